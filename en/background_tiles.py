@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Background Tiles
+Some gallery stylesheets give their widgets an SVG pattern as a background-image data URI. Qt style sheets
+cannot load data URIs: every polish of such a widget tries to open the URI as a file, logs a warning and paints
+no pattern at all. This module decodes each embedded SVG once, rasterizes one repeat of its pattern into a tile
+image per device pixel ratio, named by the hash of the SVG, and rewrites the stylesheet to refer to the tile,
+which Qt loads once and draws repeated like any other background image.
+
+Run directly, it measures the cost per frame of scrolling a long document in the patterned styles of the text
+edit gallery, with the data URIs as written, with the pattern rasterized from the SVG on every frame, and with
+the pattern drawn from the tiles.
+
+Usage:
+    python background_tiles.py
+    python background_tiles.py --lines 5000 --frames 100 --offscreen
+"""
+
+import argparse
+import base64
+import binascii
+import hashlib
+import math
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ElementTree
+
+from PySide6.QtCore import Qt, QByteArray, QEvent, QObject, QRectF
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+# Tiles are kept between runs, a tile's name changes with its SVG
+TILE_DIRECTORY = os.path.join(tempfile.gettempdir(), "gallery-background-tiles")
+# Range of tile sides searched for the repeat of a pattern, in logical pixels
+MIN_TILE_SIZE = 16
+MAX_TILE_SIZE = 256
+# Rows or columns compared when looking for the repeat of a pattern
+_REPEAT_SAMPLE = 128
+
+_DATA_URI_PATTERN = re.compile(r"""url\(\s*['"]?data:image/svg\+xml;base64,([A-Za-z0-9+/=\s]+?)['"]?\s*\)""")
+_PERCENT_SIZE_PATTERN = re.compile(r"""\b(width|height)\s*=\s*["']([0-9.]+)%["']""")
+# SVG hash: path of the tile, for every SVG rasterized in this process
+_tiles = {}
+_preloaded = []
+
+
+def tile_ratios():
+    """Return the device pixel ratios tiles are rasterized at: 1 and that of every screen, rounded up
+
+    Qt looks for name@2x.png when loading name.png on a screen with a ratio above 1, and so on.
+    """
+    return sorted({1} | {math.ceil(screen.devicePixelRatio()) for screen in QGuiApplication.screens()})
+
+
+def _tile_file(digest, ratio):
+    return os.path.join(TILE_DIRECTORY, f"{digest}{'' if ratio == 1 else f'@{ratio}x'}.png")
+
+
+def _is_pattern(svg):
+    """Return whether an SVG is sized in percent, i.e. fills whatever it is drawn on as a pattern does"""
+    root = ElementTree.fromstring(svg)
+    return root.get("width", "100%").endswith("%") or root.get("height", "100%").endswith("%")
+
+
+def _sized_svg(svg, width, height):
+    """Return the SVG with its percent widths and heights resolved against width x height
+
+    QtSvg reads 100% as 100 user units, which makes a pattern SVG a 100 x 100 image.
+    """
+    def resolve(match):
+        attribute, percent = match.group(1), float(match.group(2))
+        return f'{attribute}="{percent * (width if attribute == "width" else height) / 100:g}"'
+
+    return _PERCENT_SIZE_PATTERN.sub(resolve, svg.decode("utf-8")).encode("utf-8")
+
+
+def _rasterize(svg, width, height, ratio=1):
+    """Return a transparent image of the SVG's top left width x height logical pixels, at a device pixel ratio"""
+    if _is_pattern(svg):
+        svg = _sized_svg(svg, width, height)
+    image = QImage(width * ratio, height * ratio, QImage.Format_RGBA8888_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.scale(ratio, ratio)
+    QSvgRenderer(QByteArray(svg)).render(painter, QRectF(0, 0, width, height))
+    painter.end()
+    return image
+
+
+def _pixels(image):
+    """Return the pixels of an RGBA8888 image as an (height, width, 4) int16 array"""
+    import numpy as np
+
+    stride = image.bytesPerLine()
+    buffer = np.frombuffer(image.constBits(), dtype=np.uint8, count=stride * image.height())
+    rows = buffer.reshape(image.height(), stride)[:, :image.width() * 4]
+    return rows.reshape(image.height(), image.width(), 4).astype(np.int16)
+
+
+def _repeat_length(pixels):
+    """Return the shift along the second axis of pixels that changes them least"""
+    reference = pixels[:_REPEAT_SAMPLE, :MAX_TILE_SIZE]
+    differences = [
+        abs(pixels[:_REPEAT_SAMPLE, shift:shift + MAX_TILE_SIZE] - reference).mean()
+        for shift in range(MIN_TILE_SIZE, MAX_TILE_SIZE + 1)
+    ]
+    # The first of equally good shifts, e.g. one repeat rather than two
+    return MIN_TILE_SIZE + differences.index(min(differences))
+
+
+def tile_size(svg):
+    """Return the logical (width, height) of the tile an SVG repeats with
+
+    An SVG with a size of its own, e.g. width="24", is its own tile. One sized in percent fills whatever it is
+    drawn on, as a pattern does, and its tile is the shift in the search range that repeats the pattern best.
+    """
+    if not _is_pattern(svg):
+        size = QSvgRenderer(QByteArray(svg)).defaultSize()
+        return size.width(), size.height()
+    sample = _pixels(_rasterize(svg, 2 * MAX_TILE_SIZE, 2 * MAX_TILE_SIZE))
+    return _repeat_length(sample), _repeat_length(sample.transpose(1, 0, 2))
+
+
+def tile_path(svg):
+    """Return the path of the tile of an SVG, rasterizing it at every ratio of tile_ratios() if needed"""
+    digest = hashlib.sha256(svg).hexdigest()[:16]
+    path = _tiles.get(digest)
+    if path is not None:
+        return path
+    ratios = tile_ratios()
+    missing = [ratio for ratio in ratios if not os.path.exists(_tile_file(digest, ratio))]
+    if missing:
+        os.makedirs(TILE_DIRECTORY, exist_ok=True)
+        width, height = tile_size(svg)
+        for ratio in missing:
+            # Written under a temporary name first, so that a tile file is always complete
+            temporary = f"{_tile_file(digest, ratio)}.{os.getpid()}.png"
+            _rasterize(svg, width, height, ratio).save(temporary)
+            os.replace(temporary, _tile_file(digest, ratio))
+    # Decoded into QPixmapCache now, so the first polish finds it there
+    for ratio in ratios:
+        _preloaded.append(QPixmap(_tile_file(digest, ratio)))
+    path = _tiles[digest] = _tile_file(digest, 1).replace(os.sep, "/")
+    return path
+
+
+def tile_stylesheet(stylesheet):
+    """Return the stylesheet with every SVG data URI replaced by the tile of its SVG
+
+    Needs a QGuiApplication. URIs that do not decode are left as they are.
+    """
+    def replace(match):
+        try:
+            svg = base64.b64decode(match.group(1), validate=False)
+            return f'url("{tile_path(svg)}")'
+        except (binascii.Error, ElementTree.ParseError):
+            return match.group(0)
+
+    return _DATA_URI_PATTERN.sub(replace, stylesheet)
+
+
+def stylesheet_svgs(stylesheet):
+    """Return the decoded SVGs of the data URIs of a stylesheet"""
+    return [base64.b64decode(data) for data in _DATA_URI_PATTERN.findall(stylesheet)]
+
+
+class PerFrameSvgPainter(QObject):
+    """Paints an SVG under the text of a text edit on every frame, what a pattern costs without a tile"""
+
+    def __init__(self, textedit, svg):
+        super().__init__(textedit)
+        self.textedit = textedit
+        self.svg = svg
+        # Renderer of the SVG sized to the whole document, and that size
+        self.renderer = None
+        self.size = None
+        textedit.viewport().installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            viewport = self.textedit.viewport()
+            top = self.textedit.verticalScrollBar().value()
+            size = (viewport.width(), self.textedit.verticalScrollBar().maximum() + viewport.height())
+            if size != self.size:
+                self.renderer = QSvgRenderer(QByteArray(_sized_svg(self.svg, *size)))
+                self.size = size
+            painter = QPainter(viewport)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setClipRect(event.rect())
+            # The pattern scrolls with the document, as a background image does
+            self.renderer.setViewBox(QRectF(0, top, viewport.width(), viewport.height()))
+            self.renderer.render(painter, QRectF(viewport.rect()))
+            painter.end()
+        return False
+
+
+def _scroll_frames(app, textedit, frames):
+    """Scroll textedit by a few lines and repaint it once per frame, and return the milliseconds per frame"""
+    scrollbar = textedit.verticalScrollBar()
+    step = max(1, scrollbar.singleStep() * 3)
+    timings = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        scrollbar.setValue((frame * step) % max(1, scrollbar.maximum()))
+        textedit.viewport().repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def gallery_svg_stylesheets():
+    """Return (style name, stylesheet as written) of the text edit gallery styles with SVG data URIs"""
+    import textedit_styles
+
+    window = textedit_styles.TextEditStylesWindow()
+    # Apply the styles again with the data URIs left in
+    tile = textedit_styles.tile_stylesheet
+    textedit_styles.tile_stylesheet = lambda stylesheet: stylesheet
+    try:
+        window.apply_styles()
+    finally:
+        textedit_styles.tile_stylesheet = tile
+    specs = []
+    for index in range(window.style_combobox.count()):
+        stylesheet = window.textedit_layout.itemAt(index * 2 + 1).widget().styleSheet()
+        if stylesheet_svgs(stylesheet):
+            specs.append((window.style_combobox.itemText(index), stylesheet))
+    window.close()
+    return specs
+
+
+def benchmark(line_count, frames):
+    """Print the per-frame cost of scrolling a long document in every text edit style with an SVG background"""
+    from PySide6.QtWidgets import QApplication, QTextEdit
+
+    app = QApplication.instance()
+    document = "\n".join(f"{number + 1}: The quick brown fox jumps over the lazy dog." for number in range(line_count))
+    print(f"{line_count} lines, {frames} frames; median / max ms per frame")
+    for name, source in gallery_svg_stylesheets():
+        modes = (
+            ("data URI", source, None),
+            # The style without the image, with the SVG painted under the text on every frame instead
+            ("per frame", _DATA_URI_PATTERN.sub("none", source), stylesheet_svgs(source)[0]),
+            ("tile", tile_stylesheet(source), None),
+        )
+        for mode, stylesheet, svg in modes:
+            editor = QTextEdit()
+            editor.setStyleSheet(stylesheet)
+            editor.setPlainText(document)
+            if svg is not None:
+                PerFrameSvgPainter(editor, svg)
+            editor.resize(640, 480)
+            editor.show()
+            app.processEvents()
+            timings = _scroll_frames(app, editor, frames)
+            print(f"    {name:24} {mode:9} {statistics.median(timings):6.2f} / {max(timings):6.2f}")
+            editor.close()
+            editor.deleteLater()
+            app.processEvents()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scrolling text edits with SVG pattern backgrounds")
+    parser.add_argument("--lines", type=int, default=5000, help="lines of the scrolled document")
+    parser.add_argument("--frames", type=int, default=100, help="frames timed per measurement")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    benchmark(args.lines, args.frames)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,9 @@ from PySide6.QtWidgets import (
     QLabel
 )
 from PySide6.QtGui import QFont, QColor
+from locale_switcher import install_language_menu
+from style_classes import SECTION_HEADER, install_class_styles, set_style_class
+from qss_compiler import compiled_stylesheet
 
 class ButtonStylesWindow(QMainWindow):
     """QPushButton Style Sheet Example Window"""
@@ -30,6 +33,8 @@ class ButtonStylesWindow(QMainWindow):
         # Create central widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
+        # Section labels are styled by their class, from one stylesheet here
+        install_class_styles(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
         # Add title
@@ -49,11 +54,14 @@ class ButtonStylesWindow(QMainWindow):
         self.create_icon_style_example()
         self.create_custom_shapes_example()
         self.create_disabled_style_example()
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
     
     def create_basic_style_example(self):
         """Basic style sheet example"""
         section_label = QLabel("Basic Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -97,7 +105,7 @@ class ButtonStylesWindow(QMainWindow):
     def create_state_style_example(self):
         """Button state style sheet example (normal, hover, pressed)"""
         section_label = QLabel("Button State Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -148,7 +156,7 @@ class ButtonStylesWindow(QMainWindow):
     def create_gradient_style_example(self):
         """Gradient background style sheet example"""
         section_label = QLabel("Gradient Background Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -193,7 +201,7 @@ class ButtonStylesWindow(QMainWindow):
     def create_bordered_style_example(self):
         """Border style sheet example"""
         section_label = QLabel("Border Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -244,7 +252,7 @@ class ButtonStylesWindow(QMainWindow):
     def create_icon_style_example(self):
         """Icon button style sheet example"""
         section_label = QLabel("Icon Button Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -282,7 +290,7 @@ class ButtonStylesWindow(QMainWindow):
     def create_custom_shapes_example(self):
         """Custom shape button style sheet example"""
         section_label = QLabel("Custom Shapes")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -326,7 +334,7 @@ class ButtonStylesWindow(QMainWindow):
     def create_disabled_style_example(self):
         """Disabled state style sheet example"""
         section_label = QLabel("Disabled State Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -344,7 +352,7 @@ class ButtonStylesWindow(QMainWindow):
         
         disabled_button = QPushButton("Disabled Button")
         disabled_button.setEnabled(False)  # Set to disabled state
-        disabled_button.setStyleSheet("""
+        disabled_button.setStyleSheet(compiled_stylesheet("""
             QPushButton {
                 background-color: #2196F3;
                 color: white;
@@ -355,7 +363,7 @@ class ButtonStylesWindow(QMainWindow):
                 color: #757575;             /* Text color when disabled */
                 opacity: 0.6;               /* Opacity */
             }
-        """)
+        """))
         layout.addWidget(disabled_button)
         
         self.main_layout.addLayout(layout)
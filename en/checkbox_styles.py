@@ -18,6 +18,8 @@ from PySide6.QtWidgets import (
     QLabel
 )
 from PySide6.QtGui import QFont, QColor
+from locale_switcher import install_language_menu
+from style_classes import SECTION_HEADER, install_class_styles, set_style_class
 
 class CheckBoxStylesWindow(QMainWindow):
     """QCheckBox Style Sheet Example Window"""
@@ -30,6 +32,8 @@ class CheckBoxStylesWindow(QMainWindow):
         # Create central widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
+        # Section labels are styled by their class, from one stylesheet here
+        install_class_styles(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
         # Add title
@@ -49,11 +53,14 @@ class CheckBoxStylesWindow(QMainWindow):
         self.create_flat_style_example()
         self.create_radio_button_style_example()
         self.create_size_style_example()
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
     
     def create_basic_style_example(self):
         """Basic style sheet example"""
         section_label = QLabel("Basic Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -87,7 +94,7 @@ class CheckBoxStylesWindow(QMainWindow):
     def create_state_style_example(self):
         """State style sheet example (normal, checked, hover)"""
         section_label = QLabel("State Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -153,7 +160,7 @@ class CheckBoxStylesWindow(QMainWindow):
     def create_custom_indicator_style_example(self):
         """Custom indicator style sheet example"""
         section_label = QLabel("Custom Indicator Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -205,7 +212,7 @@ class CheckBoxStylesWindow(QMainWindow):
     def create_gradient_style_example(self):
         """Gradient background style sheet example"""
         section_label = QLabel("Gradient Background Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -261,7 +268,7 @@ class CheckBoxStylesWindow(QMainWindow):
     def create_flat_style_example(self):
         """Flat style sheet example"""
         section_label = QLabel("Flat Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -311,7 +318,7 @@ class CheckBoxStylesWindow(QMainWindow):
     def create_radio_button_style_example(self):
         """Radio button style checkbox"""
         section_label = QLabel("Radio Button Style")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -365,7 +372,7 @@ class CheckBoxStylesWindow(QMainWindow):
     def create_size_style_example(self):
         """Size and spacing style sheet example"""
         section_label = QLabel("Size and Spacing Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
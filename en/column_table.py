@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Column Table Model
+QTableWidget keeps every cell as an item with a display string, so sorting by price compares "¥6,999" with
+"¥899" as text, and a numeric filter would parse every cell again. ColumnTableModel keeps a table by column
+instead: numeric columns, e.g. prices and stock counts, are parsed once when they are loaded into a NumPy array
+of values, and text columns are stored as codes into their distinct texts. KeyProxyModel sorts and range
+filters the rows with NumPy on those arrays and only keeps the order of the rows it shows, so sorting a million
+rows is one argsort.
+
+Run directly, it loads a million-row synthetic product table into the table gallery and reports the latency of
+sorting every column in every table style.
+
+Usage:
+    python column_table.py
+    python column_table.py --rows 1000000 --offscreen
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractProxyModel, QAbstractTableModel, QModelIndex
+
+from conditional_format import FORMAT_ROLES, ConditionalFormat
+
+# A number as exports write it: a prefix such as a currency sign, digits that may be grouped, decimals and a suffix
+_NUMBER_PATTERN = re.compile(r"^(\D*?)(-?\d[\d,]*)(?:\.(\d+))?(\D*)$")
+# data() runs for every cell the view paints or measures, and looking an enum up on Qt costs more than the rest
+_DISPLAY_ROLE = Qt.DisplayRole
+_ALIGNMENT_ROLE = Qt.TextAlignmentRole
+_FOREGROUND_ROLE = Qt.ForegroundRole
+_BACKGROUND_ROLE = Qt.BackgroundRole
+# Flags of every cell of the read-only model, as QAbstractTableModel gives them
+_CELL_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemNeverHasChildren
+
+
+def _appended(buffer, length, values):
+    """Return buffer with values written after its first length items, grown to twice the size if they don't fit"""
+    end = length + len(values)
+    if end > len(buffer):
+        grown = np.empty(max(end, 2 * len(buffer)), dtype=buffer.dtype)
+        grown[:length] = buffer[:length]
+        buffer = grown
+    buffer[length:end] = values
+    return buffer
+
+
+class TextColumn:
+    """Column of texts, stored as one code per row into the distinct texts of the column"""
+
+    def __init__(self, texts=()):
+        # Distinct texts in order of appearance as the rows show them, and as they were loaded
+        self.categories = []
+        self.sources = []
+        # Code of every loaded text, which a translation of the shown texts leaves alone
+        self._codes = {}
+        # The last translation, which texts loaded after it are shown in
+        self._translate = None
+        # Appended rows go to the spare room at the end of the buffer, codes is a view of the rows
+        self._buffer = np.fromiter(map(self._code, texts), dtype=np.int32, count=len(texts))
+        self.codes = self._buffer
+        self._sort_keys = None
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _code(self, text):
+        code = self._codes.get(text)
+        if code is None:
+            code = self._codes[text] = len(self.sources)
+            self.sources.append(text)
+            self.categories.append(text if self._translate is None else self._translate(text))
+        return code
+
+    def text(self, row):
+        return self.categories[self.codes[row]]
+
+    def code_of(self, text):
+        """Return the code of a text as the rows were loaded with it, -1 if no row holds it"""
+        return self._codes.get(text, -1)
+
+    def extend(self, other):
+        """Append the rows of another TextColumn"""
+        # Its codes are mapped once per distinct text
+        mapping = np.fromiter(map(self._code, other.sources), dtype=np.int32, count=len(other.sources))
+        length = len(self.codes)
+        self._buffer = _appended(self._buffer, length, mapping[other.codes])
+        self.codes = self._buffer[:length + len(other)]
+        self._sort_keys = None
+
+    def sort_keys(self):
+        """Return the rank of every row's text among the distinct texts, computed once per set of texts"""
+        if self._sort_keys is None:
+            ranks = np.empty(len(self.categories), dtype=np.int32)
+            ranks[np.argsort(np.array(self.categories, dtype=object), kind="stable")] = np.arange(len(ranks))
+            self._sort_keys = ranks[self.codes]
+        return self._sort_keys
+
+    def translate(self, translate):
+        """Show every distinct text as translate(text), and return the number of texts that changed
+
+        The loaded texts are kept, so rows are still looked up by them, and texts loaded later are translated too.
+        """
+        self._translate = translate
+        changed = 0
+        for code, text in enumerate(self.categories):
+            translated = translate(text)
+            if translated != text:
+                self.categories[code] = translated
+                changed += 1
+        if changed:
+            self._sort_keys = None
+        return changed
+
+
+class NumberColumn:
+    """Column of numbers, stored as a float64 array and shown in the format they were loaded in"""
+
+    def __init__(self, values, prefix="", suffix="", decimals=0, grouping=False):
+        # Appended rows go to the spare room at the end of the buffer, values is a view of the rows
+        self._buffer = np.asarray(values, dtype=np.float64)
+        self.values = self._buffer
+        self.prefix = prefix
+        self.suffix = suffix
+        self.decimals = decimals
+        self.grouping = grouping
+
+    def __len__(self):
+        return len(self.values)
+
+    def text(self, row):
+        return self.format_value(self.values[row])
+
+    def format_value(self, value):
+        """Return a number as the column shows it, an empty text for NaN"""
+        if np.isnan(value):
+            return ""
+        number = f"{value:{',' if self.grouping else ''}.{self.decimals}f}"
+        return f"{self.prefix}{number}{self.suffix}"
+
+    def sort_keys(self):
+        return self.values
+
+    def extend(self, values):
+        length = len(self.values)
+        self._buffer = _appended(self._buffer, length, values)
+        self.values = self._buffer[:length + len(values)]
+
+    def accepts(self, other):
+        """Return whether the numbers of another NumberColumn are shown as loaded in the format of this one"""
+        if (other.prefix, other.suffix, other.decimals) != (self.prefix, self.suffix, self.decimals):
+            return False
+        if other.grouping == self.grouping:
+            return True
+        # Numbers below 1000 are written the same with or without grouping
+        ungrouped = self if other.grouping else other
+        return not np.any(np.abs(ungrouped.values) >= 1000)
+
+    def as_text(self):
+        """Return the column as a TextColumn of the texts it shows"""
+        return TextColumn([self.format_value(value) for value in self.values.tolist()])
+
+
+def number_format(texts):
+    """Return (prefix, suffix, decimals, grouping) if every non-empty text is a number in one format, else None
+
+    The format is taken from the first text, and a text only counts as in that format if formatting its
+    number again gives the text back, e.g. "¥6,999" and "¥899" but not "007" or "1.5" next to "2.25".
+    """
+    first = next((text for text in texts if text), None)
+    match = _NUMBER_PATTERN.match(first) if first is not None else None
+    if match is None:
+        return None
+    prefix, decimals, suffix = match.group(1), len(match.group(3) or ""), match.group(4)
+    fraction = rf"\.\d{{{decimals}}}" if decimals else ""
+    value = f"{re.escape(prefix)}-?\\d+(?:,\\d{{3}})*{fraction}{re.escape(suffix)}"
+    # All texts are checked by a few passes of the regex engine over their joined lines
+    joined = "\n".join(texts)
+    if re.search(rf"(?m)^(?!(?:{value})?$)", joined):
+        return None
+    # Leading zeros, or integer parts grouped in some texts only, would not be shown as loaded
+    integer = rf"(?m)^{re.escape(prefix)}-?"
+    if re.search(integer + r"0\d", joined):
+        return None
+    grouping = re.search(integer + r"\d+,", joined) is not None
+    if grouping and re.search(integer + r"\d{4}", joined):
+        return None
+    return prefix, suffix, decimals, grouping
+
+
+def parse_numbers(texts, prefix="", suffix=""):
+    """Return the numbers of texts in the format of number_format() as a float64 array, NaN for empty texts"""
+    start, end = len(prefix), len(suffix)
+
+    def number(text):
+        return float(text[start:len(text) - end].replace(",", "")) if text else np.nan
+
+    return np.fromiter(map(number, texts), dtype=np.float64, count=len(texts))
+
+
+def column_from_texts(texts):
+    """Return a NumberColumn for texts that are all numbers in one format, and a TextColumn otherwise"""
+    number = number_format(texts)
+    if number is None:
+        return TextColumn(texts)
+    prefix, suffix, decimals, grouping = number
+    return NumberColumn(parse_numbers(texts, prefix, suffix), prefix, suffix, decimals, grouping)
+
+
+def append_column(column, chunk):
+    """Append the rows of chunk to column and return the column, a TextColumn if their numbers don't share a format
+
+    Both are TextColumn or NumberColumn, e.g. column_from_texts() of successive chunks of a file; an empty
+    column takes the type of the first chunk.
+    """
+    if not len(column):
+        return chunk
+    if isinstance(column, NumberColumn) and isinstance(chunk, NumberColumn):
+        if column.accepts(chunk):
+            column.grouping = column.grouping or chunk.grouping
+            column.extend(chunk.values)
+            return column
+    elif isinstance(column, NumberColumn) and chunk.categories in ([], [""]):
+        # Empty cells of a numeric column
+        column.extend(np.full(len(chunk), np.nan))
+        return column
+    if isinstance(column, NumberColumn):
+        column = column.as_text()
+    column.extend(chunk.as_text() if isinstance(chunk, NumberColumn) else chunk)
+    return column
+
+
+class ColumnTableModel(QAbstractTableModel):
+    """Read-only table model over a list of TextColumn and NumberColumn"""
+
+    def __init__(self, headers, columns, alignment=None, parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.columns = list(columns)
+        self.alignment = alignment
+        # Foreground and background brushes of the cells, by rules per column
+        self.formats = ConditionalFormat()
+        self._row_count = len(self.columns[0]) if self.columns else 0
+
+    @classmethod
+    def from_rows(cls, headers, rows, alignment=None, parent=None):
+        """Return a model of rows of display strings, parsing the numeric columns once"""
+        columns = [column_from_texts([row[column] for row in rows]) for column in range(len(headers))]
+        return cls(headers, columns, alignment, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        return self.cell_data(index.row(), index.column(), role)
+
+    def cell_data(self, row, column, role):
+        """Return the data of a cell for a role, as data() does without a model index"""
+        if role == _DISPLAY_ROLE:
+            return self.columns[column].text(row)
+        if role == _ALIGNMENT_ROLE and self.alignment is not None:
+            return self.alignment
+        if role == _FOREGROUND_ROLE or role == _BACKGROUND_ROLE:
+            return self.formats.brush(column, row, role)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.headers):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def sort_keys(self, column):
+        """Return an array with a key per row that orders the rows as the column's values do"""
+        return self.columns[column].sort_keys()
+
+    def append_columns(self, chunk):
+        """Append rows given as one TextColumn or NumberColumn per column, e.g. a chunk of an imported file"""
+        count = len(chunk[0]) if chunk else 0
+        if not count:
+            return
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + count - 1)
+        self.columns = [append_column(column, values) for column, values in zip(self.columns, chunk)]
+        self._row_count += count
+        for column in self.formats.rules:
+            self.formats.update(column, self.columns[column])
+        self.endInsertRows()
+
+    def set_format_rules(self, column, rules):
+        """Color the cells of a column by conditional format rules, no rules for the view's colors"""
+        if rules:
+            self.formats.set_rules(column, rules, self.columns[column])
+        else:
+            self.formats.remove_rules(column)
+        self.dataChanged.emit(self.index(0, column), self.index(self._row_count - 1, column), list(FORMAT_ROLES))
+
+    def translate_texts(self, translate):
+        """Translate the header and the distinct texts of the text columns, and return the number changed"""
+        changed = 0
+        for section, header in enumerate(self.headers):
+            translated = translate(header)
+            if translated != header:
+                self.headers[section] = translated
+                changed += 1
+        if changed:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.headers) - 1)
+        for column, values in enumerate(self.columns):
+            if isinstance(values, TextColumn) and values.translate(translate):
+                changed += 1
+                self.dataChanged.emit(self.index(0, column), self.index(self._row_count - 1, column))
+        return changed
+
+
+class KeyProxyModel(QAbstractProxyModel):
+    """Sorts and range filters the rows of a ColumnTableModel with NumPy on its sort keys"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Source rows in the order they are shown
+        self._rows = np.empty(0, dtype=np.int64)
+        # Proxy row of every source row, -1 for rows filtered out; built when first needed
+        self._proxy_rows = None
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+        # Column: (minimum, maximum), either of which may be None
+        self.range_filters = {}
+        # Type of every source column, as the shown rows were sorted and filtered by
+        self._column_types = ()
+
+    def setSourceModel(self, model):
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelReset.disconnect(self._refilter)
+            previous.rowsInserted.disconnect(self._on_source_rows_inserted)
+            previous.dataChanged.disconnect(self._on_source_data_changed)
+            previous.headerDataChanged.disconnect(self.headerDataChanged)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        model.modelReset.connect(self._refilter)
+        model.rowsInserted.connect(self._on_source_rows_inserted)
+        model.dataChanged.connect(self._on_source_data_changed)
+        model.headerDataChanged.connect(self.headerDataChanged)
+        self.range_filters = {}
+        self._update_rows()
+        self.endResetModel()
+
+    def _filtered_rows(self, rows=None):
+        """Return the source rows, or those of rows, that pass the range filters"""
+        model = self.sourceModel()
+        if rows is None:
+            rows = np.arange(model.rowCount())
+        if not self.range_filters:
+            return rows
+        mask = np.ones(len(rows), dtype=bool)
+        for column, (minimum, maximum) in self.range_filters.items():
+            keys = model.sort_keys(column)[rows]
+            # NaN compares false, so rows without a value are filtered out by any bound
+            if minimum is not None:
+                mask &= keys >= minimum
+            if maximum is not None:
+                mask &= keys <= maximum
+        return rows[mask]
+
+    def _keys(self, rows):
+        """Return the keys of rows that order them ascending in the sort column and order"""
+        keys = self.sourceModel().sort_keys(self.sort_column)[rows]
+        # Negated rather than reversed, so equal rows keep their order; NaN sorts last either way
+        return -keys if self.sort_order == Qt.DescendingOrder else keys
+
+    def _sorted(self, rows):
+        """Return rows in the order of the sort column, stable as QSortFilterProxyModel sorts"""
+        if self.sort_column < 0:
+            return rows
+        return rows[np.argsort(self._keys(rows), kind="stable")]
+
+    def _update_rows(self):
+        self._rows = self._sorted(self._filtered_rows()) if self.sourceModel() is not None else self._rows[:0]
+        self._proxy_rows = None
+        self._column_types = self._source_column_types()
+
+    def _source_column_types(self):
+        model = self.sourceModel()
+        return tuple(map(type, model.columns)) if model is not None else ()
+
+    def _refilter(self):
+        self.beginResetModel()
+        self._update_rows()
+        self.endResetModel()
+
+    def _on_source_rows_inserted(self, parent, first, last):
+        # A numeric column that became a text column has keys of another kind for every row
+        column_types = self._source_column_types()
+        retyped = [column for column, (before, after) in enumerate(zip(self._column_types, column_types))
+                   if before is not after]
+        self._column_types = column_types
+        if retyped:
+            # Bounds on the numbers don't apply to the ranks of texts
+            for column in retyped:
+                self.range_filters.pop(column, None)
+            self._relayout(self._sorted(self._filtered_rows()))
+            return
+        rows = self._filtered_rows(np.arange(first, last + 1))
+        if not len(rows):
+            # None of them is shown, but the proxy row map has no room for them
+            self._proxy_rows = None
+            return
+        if self.sort_column < 0:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+            self._rows = np.concatenate([self._rows, rows])
+            self._proxy_rows = None
+            self.endInsertRows()
+            return
+        # Merged into the sorted rows after those with equal keys, where a stable sort of every row puts them
+        rows = self._sorted(rows)
+        positions = np.searchsorted(self._keys(self._rows), self._keys(rows), side="right")
+        self._relayout(np.insert(self._rows, positions, rows))
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        # A column whose texts changed, e.g. by a translation, sorts its rows differently; its colors don't
+        columns = range(top_left.column(), bottom_right.column() + 1)
+        texts_changed = not roles or _DISPLAY_ROLE in roles
+        if texts_changed and self.sort_column in columns and self.sort_column >= 0:
+            # Not by sort(), which does nothing for the column and order the rows are sorted by
+            self._relayout(self._sorted(np.sort(self._rows)))
+        self.dataChanged.emit(self.index(0, top_left.column()),
+                              self.index(len(self._rows) - 1, bottom_right.column()), roles)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the shown rows by a column; column -1 shows them in source order"""
+        # The rows are kept in order as they change, and QTableView.sortByColumn() sorts twice
+        if column == self.sort_column and order == self.sort_order:
+            return
+        self.sort_column = column
+        self.sort_order = order
+        self._relayout(self._sorted(np.sort(self._rows) if self.range_filters else np.arange(len(self._rows))))
+
+    def _relayout(self, rows):
+        """Show rows in place of the shown rows, moving the persistent indexes, and so the selection, with them"""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        source_indexes = [self.mapToSource(index) for index in persistent]
+        self._rows = rows
+        self._proxy_rows = None
+        self.changePersistentIndexList(persistent, [self.mapFromSource(index) for index in source_indexes])
+        self.layoutChanged.emit()
+
+    def set_range_filters(self, filters):
+        """Show only the rows whose values lie within the ranges of filters, {column: (minimum, maximum)}
+
+        Either bound may be None; no filters show every row.
+        """
+        self.range_filters = dict(filters)
+        self._refilter()
+
+    def source_rows(self):
+        """Return the source rows in the order they are shown"""
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        model = self.sourceModel()
+        return 0 if parent.isValid() or model is None else model.columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._rows) and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def data(self, index, role=Qt.DisplayRole):
+        # The source row straight from the array, without a source index per cell
+        if not index.isValid():
+            return None
+        return self.sourceModel().cell_data(int(self._rows[index.row()]), index.column(), role)
+
+    def flags(self, index):
+        # The same for every cell, without mapping each one to the source
+        return _CELL_FLAGS if index.isValid() else Qt.NoItemFlags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        # Rows are numbered as in the source, as QSortFilterProxyModel numbers them
+        if orientation == Qt.Vertical and 0 <= section < len(self._rows):
+            section = int(self._rows[section])
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(int(self._rows[proxy_index.row()]), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._proxy_rows is None:
+            self._proxy_rows = np.full(self.sourceModel().rowCount(), -1, dtype=np.int64)
+            self._proxy_rows[self._rows] = np.arange(len(self._rows))
+        row = int(self._proxy_rows[source_index.row()])
+        return QModelIndex() if row < 0 else self.createIndex(row, source_index.column())
+
+
+# Synthetic products, priced and stocked like the gallery's sample rows
+_PRODUCTS = ("Laptop", "Smartphone", "Tablet", "Smartwatch", "Wireless Headphones", "Monitor", "Keyboard",
+             "Mouse", "Speaker", "Camera")
+
+
+def synthetic_rows(count, seed=0):
+    """Return (headers, columns of display strings) of count synthetic product rows"""
+    generator = np.random.default_rng(seed)
+    names = [f"{_PRODUCTS[index % len(_PRODUCTS)]} {index // len(_PRODUCTS) + 1}"
+             for index in range(len(_PRODUCTS) * 20)]
+    picks = generator.integers(0, len(names), count)
+    prices = generator.integers(99, 20000, count)
+    stocks = generator.integers(0, 60, count)
+    columns = [
+        [names[pick] for pick in picks],
+        [f"¥{price:,}" for price in prices.tolist()],
+        [str(stock) for stock in stocks.tolist()],
+        ["Out of Stock" if stock == 0 else "In Stock" for stock in stocks.tolist()],
+    ]
+    return ["Product Name", "Price", "Stock", "Status"], columns
+
+
+def benchmark(row_count, runs):
+    """Print the latency of sorting a synthetic table of row_count rows by every column in every table style"""
+    from PySide6.QtWidgets import QApplication
+    from tablewidget_styles import TableWidgetStylesWindow
+
+    app = QApplication.instance()
+    headers, texts = synthetic_rows(row_count)
+    start = time.perf_counter()
+    columns = [column_from_texts(column) for column in texts]
+    load_ms = (time.perf_counter() - start) * 1000
+    del texts
+    key_bytes = sum(column.sort_keys().nbytes + getattr(column, "codes", column.sort_keys()).nbytes
+                    for column in columns)
+    print(f"{row_count} rows parsed in {load_ms:.0f} ms, {key_bytes / 1024 / 1024:.1f} MB of column arrays")
+
+    window = TableWidgetStylesWindow()
+    window.set_table_model(ColumnTableModel(headers, columns, Qt.AlignCenter))
+    window.show()
+    app.processEvents()
+    print(f"{runs} runs; median ms to sort ascending / descending and repaint")
+    for index in range(window.style_combobox.count()):
+        window.style_combobox.setCurrentIndex(index)
+        app.processEvents()
+        timings = []
+        for column, header in enumerate(headers):
+            ascending = []
+            descending = []
+            for _ in range(runs):
+                for order, results in ((Qt.AscendingOrder, ascending), (Qt.DescendingOrder, descending)):
+                    start = time.perf_counter()
+                    window.table_view.sortByColumn(column, order)
+                    window.table_view.viewport().repaint()
+                    results.append((time.perf_counter() - start) * 1000)
+            timings.append(f"{header} {statistics.median(ascending):.0f} / {statistics.median(descending):.0f}")
+        print(f"    {window.style_combobox.itemText(index):20} " + ", ".join(timings))
+    window.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sorting a million-row table in every table style")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows of the synthetic table")
+    parser.add_argument("--runs", type=int, default=3, help="sorts timed per column and order")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    benchmark(args.rows, args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,18 +18,30 @@ from PySide6.QtWidgets import (
     QLabel
 )
 from PySide6.QtGui import QFont, QColor
+from locale_switcher import install_language_menu
+from style_classes import SECTION_HEADER, install_class_styles, set_style_class
+from qss_compiler import compiled_stylesheet
+from large_combobox import LargeComboBox, sample_entries
+from icon_resources import load_icon_resources
+
+# Options in each combobox of the large list section
+LARGE_LIST_SIZE = 50000
 
 class ComboBoxStylesWindow(QMainWindow):
     """QComboBox Style Sheet Example Window"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Register the :/icons/ images the stylesheets refer to before anything is polished
+        load_icon_resources()
         self.setWindowTitle("QComboBox Style Sheet Examples")
         self.resize(800, 600)
         
         # Create central widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
+        # Section labels are styled by their class, from one stylesheet here
+        install_class_styles(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
         # Add title
@@ -49,11 +61,15 @@ class ComboBoxStylesWindow(QMainWindow):
         self.create_dropdown_style_example()
         self.create_state_style_example()
         self.create_size_style_example()
+        self.create_large_list_style_example()
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
     
     def create_basic_style_example(self):
         """Basic style sheet example"""
         section_label = QLabel("Basic Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -82,7 +98,7 @@ class ComboBoxStylesWindow(QMainWindow):
     def create_editable_style_example(self):
         """Editable combobox style sheet example"""
         section_label = QLabel("Editable ComboBox Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -91,7 +107,7 @@ class ComboBoxStylesWindow(QMainWindow):
         editable_combobox = QComboBox()
         editable_combobox.setEditable(True)
         editable_combobox.addItems(["Option 1", "Option 2", "Option 3"])
-        editable_combobox.setStyleSheet("""
+        editable_combobox.setStyleSheet(compiled_stylesheet("""
             QComboBox {
                 background-color: #2196F3;
                 color: white;
@@ -105,7 +121,7 @@ class ComboBoxStylesWindow(QMainWindow):
                 selection-background-color: #2196F3;
                 selection-color: white;
             }
-        """)
+        """))
         layout.addWidget(editable_combobox)
         
         self.main_layout.addLayout(layout)
@@ -113,7 +129,7 @@ class ComboBoxStylesWindow(QMainWindow):
     def create_gradient_style_example(self):
         """Gradient background style sheet example"""
         section_label = QLabel("Gradient Background Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -161,7 +177,7 @@ class ComboBoxStylesWindow(QMainWindow):
     def create_custom_arrow_style_example(self):
         """Custom arrow style sheet example"""
         section_label = QLabel("Custom Arrow Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -179,10 +195,9 @@ class ComboBoxStylesWindow(QMainWindow):
                 border-radius: 4px;
             }
             QComboBox::down-arrow {
-                image: url(:/icons/down_arrow.png);  /* Use image in actual projects */
+                image: url(:/icons/down_arrow.png);  /* From the icon resource bundle, see icon_resources.py */
                 width: 12px;
                 height: 12px;
-                /* Using color simulation since no actual image is available */
                 color: white;
             }
             QComboBox::drop-down {
@@ -230,7 +245,7 @@ class ComboBoxStylesWindow(QMainWindow):
     def create_dropdown_style_example(self):
         """Dropdown list style sheet example"""
         section_label = QLabel("Dropdown List Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -299,7 +314,7 @@ class ComboBoxStylesWindow(QMainWindow):
     def create_state_style_example(self):
         """State style sheet example"""
         section_label = QLabel("State Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -350,7 +365,7 @@ class ComboBoxStylesWindow(QMainWindow):
     def create_size_style_example(self):
         """Size and spacing style sheet example"""
         section_label = QLabel("Size and Spacing Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -401,6 +416,56 @@ class ComboBoxStylesWindow(QMainWindow):
         layout.addWidget(wide_combobox)
         
         self.main_layout.addLayout(layout)
+    
+    def create_large_list_style_example(self):
+        """Large option list style sheet example"""
+        section_label = QLabel("Large List Styles")
+        set_style_class(section_label, SECTION_HEADER)
+        self.main_layout.addWidget(section_label)
+        
+        layout = QHBoxLayout()
+        large_list_entries = sample_entries(LARGE_LIST_SIZE)
+        
+        # Lazily fetched dropdown, rows are loaded as the popup scrolls
+        large_combobox = LargeComboBox(large_list_entries)
+        large_combobox.setStyleSheet("""
+            QComboBox {
+                background-color: #37474F;
+                color: white;
+                padding: 5px;
+                border: none;
+                border-radius: 4px;
+            }
+            QComboBox QAbstractItemView {
+                background-color: #263238;
+                color: white;
+                selection-background-color: #546E7A;
+                outline: none;
+            }
+            QComboBox QAbstractItemView::item {
+                height: 24px;
+            }
+        """)
+        layout.addWidget(large_combobox)
+        
+        # Editable variant, typing filters all options through the prebuilt index
+        filter_combobox = LargeComboBox(large_list_entries, editable=True)
+        filter_combobox.lineEdit().setPlaceholderText("Type to filter options...")
+        filter_combobox.setStyleSheet("""
+            QComboBox {
+                background-color: white;
+                padding: 5px;
+                border: 1px solid #90A4AE;
+                border-radius: 4px;
+            }
+            QComboBox:focus {
+                border-color: #37474F;
+            }
+        """)
+        filter_combobox.setCurrentIndex(-1)
+        layout.addWidget(filter_combobox)
+        
+        self.main_layout.addLayout(layout)
 
 # Startup function
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by qss_compiler.py from the stylesheets the gallery windows compile, do not edit
+
+STYLESHEETS = {
+    '037b8ffff0f2ef924e92c65256077c9c5d44fcae': 'QPushButton{background-color:#2196F3;color:white;padding:10px 20px}QPushButton:disabled{background-color:#BDBDBD;color:#757575}',
+    '13a3eef9cc8dacec8a0f8f74416a86b0eecdd655': 'QRadioButton{color:#4CAF50;font-size:14px;spacing:5px}QRadioButton::indicator{width:16px;height:16px;border:2px solid #C8E6C9;border-radius:8px;background-color:white}QRadioButton::indicator:checked{background-color:#4CAF50;border-color:#4CAF50}',
+    '1bf0ac4219ed1cd0523c65c31b8465c267fa8a9e': 'QSlider::groove:vertical{background:#E0E0E0;width:8px;border-radius:4px}QSlider::handle:vertical{background:#F44336;width:18px;height:18px;margin:0 -5px;border-radius:9px}',
+    '236838465b87878b57df95866060b1c73ad43b58': 'QLineEdit{background-color:#FFFFFF;color:#333333;border:2px solid #CCCCCC;border-radius:4px;padding:5px}',
+    '2889a9bb4b0055e7e345b16c793b2d7ce4678e37': 'QRadioButton{color:#607D8B;font-size:14px;spacing:5px}QRadioButton::indicator{width:18px;height:18px;border:2px solid #CFD8DC;border-radius:9px;background-color:white}QRadioButton::indicator:checked{background-color:#26C6DA;border-color:#26C6DA}QRadioButton::indicator:checked::after{position:absolute;width:8px;height:4px;background-color:white;top:5px;left:3px;border-left:2px solid white;border-bottom:2px solid white}',
+    '2909e3941d1375034a03560af0e376a122ad8c30': 'QTabWidget::pane{border:1px solid #E0E0E0;background-color:white;border-radius:4px}QTabBar::tab{color:white;padding:10px 20px;margin-right:4px;border-top-left-radius:4px;border-top-right-radius:4px}QTabBar::tab:nth-child(1){background-color:#F44336}QTabBar::tab:nth-child(2){background-color:#2196F3}QTabBar::tab:nth-child(3){background-color:#4CAF50}QTabBar::tab:nth-child(4){background-color:#FF9800}QTabBar::tab:hover{}QTabBar::tab:selected{font-weight:bold}',
+    '366ca1169d0404dc76ded854d224512adf6571dd': 'QRadioButton{color:#333333;font-size:14px;spacing:8px;padding:3px}QRadioButton::indicator{width:18px;height:18px;border:2px solid #FFC107;border-radius:9px;background-color:white}QRadioButton::indicator:checked{background-color:#FFC107;border-color:#FFC107}',
+    '45288928a2601caa0103291295dc1c5230a6af7c': 'QProgressBar{background-color:rgba(224, 224, 224, 150);border-radius:15px;text-align:center;color:#333;font-weight:bold;border:1px solid rgba(189, 189, 189, 150)}QProgressBar::chunk{background-color:rgba(33, 150, 243, 200);border-radius:15px;border:1px solid rgba(25, 118, 210, 200)}',
+    '46d3c947bc816772d4425b02a9bf80528b4a1816': "QProgressBar{background-color:#E0E0E0;border-radius:10px;text-align:center;color:#F44336;font-weight:bold;font-family:'Courier New', monospace}QProgressBar::chunk{background-color:#F44336;border-radius:10px}",
+    '55b609b7437406bfcc528c8a34c1eea167b358ec': 'QLineEdit{background-color:#FFFFFF;color:#333333;border:2px solid #CCCCCC;border-radius:4px;padding:5px}QLineEdit:hover{border-color:#999999}QLineEdit:focus{border-color:#2196F3;background-color:#F5F5F5;outline:none}',
+    '567f784268ea1a997fb30955a64989b696dc9dd1': 'QProgressBar{background-color:#E0E0E0;border-radius:20px;text-align:center;color:white;font-weight:bold;font-size:14px;border:1px solid #BDBDBD}QProgressBar::chunk{background:qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4CAF50, stop:1 #388E3C);border-radius:20px;border:1px solid #4CAF50}',
+    '5bd87c60c907741c4415df9198c75f15d3064c62': 'QLineEdit{background-color:#FFFFFF;color:#333333;border:2px solid #CCCCCC;border-radius:4px;padding:5px}',
+    '5d17f761c2ff0205c61c484406c8386f905d421c': 'QRadioButton{color:#333333;font-size:14px;spacing:5px}QRadioButton::indicator{width:16px;height:16px;border:2px solid #CCCCCC;border-radius:8px;background-color:white}QRadioButton::indicator:checked{background-color:#2196F3;border-color:#2196F3}QRadioButton::indicator:checked::after{position:absolute;width:6px;height:6px;border-radius:3px;background-color:white;top:5px;left:5px}',
+    '666f4e0a8b8f1d759ec4522365e8107bc24d27a0': 'QProgressBar{background-color:#E0E0E0;border-radius:10px;text-align:center;color:#333;font-weight:bold}QProgressBar::chunk{background-color:#2196F3;border-radius:10px}',
+    '67a6b3d68771fb04142b20af2836c00b4c5ad597': 'QRadioButton{color:#333333;font-size:14px;spacing:5px}QRadioButton::indicator{width:16px;height:16px;border:2px solid #CCCCCC;border-radius:8px;background-color:white}QRadioButton::indicator:checked{background-color:#9C27B0;border-color:#9C27B0}',
+    '6ca7a5ef1fa6f39505dd61abdd1faed7485dde56': 'QSlider::groove:horizontal{background:#E0E0E0;height:8px;border-radius:4px}QSlider::handle:horizontal{background:#2196F3;width:18px;height:18px;margin:-5px 0;border-radius:9px}',
+    '7151cf0f00daf5bef820e27dc6bcc790d3038985': "QTextEdit{background-color:#FFFBE6;color:#333333;border:1px solid #FFD700;border-radius:4px;padding:15px;font-family:'SimSun', '宋体', serif;font-size:14px;background-image:url(data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMDAlIiBoZWlnaHQ9IjEwMCUiPjxkZWZzPjxwYXR0ZXJuIGlkPSJwYXR0ZXJuIiB4PSIwIiB5PSIwIiB3aWR0aD0iMTAwIiBoZWlnaHQ9IjIwIiBwYXR0ZXJuVW5pdHM9InVzZXJTcGFjZU9uVXNlIiBwYXR0ZXJuVHJhbnNmb3JtPSJyb3RhdGUoNDUpIj48bGluZSB4MT0iMCIgeTE9IjAiIHgyPSIxMDAiIHkyPSIwIiBzdHJva2U9IiNmZmQ3MDAiIHN0cm9rZS13aWR0aD0iMC41Ii8+PC9wYXR0ZXJuPjwvZGVmcz48cmVjdCB3aWR0aD0iMTAwJSIgaGVpZ2h0PSIxMDAlIiBmaWxsPSJ1cmwoI3BhdHRlcm4pIiAvPjwvc3ZnPg==)}QTextEdit:hover{border-color:#FFA500}QTextEdit:focus{border-color:#FFA500;background-color:#FFF8E1;outline:none}",
+    '742882d268f3b381663af0d65dab378059650be6': 'QLineEdit{background-color:#FFFFFF;color:#333333;border:2px solid #CCCCCC;border-radius:4px;padding:8px;font-size:16px}',
+    '762e368b5feb614a6a4078e465ac9d35b6f4c9e5': 'QRadioButton{color:#333333;font-size:12px;spacing:4px}QRadioButton::indicator{width:12px;height:12px;border:1px solid #CCCCCC;border-radius:6px;background-color:white}QRadioButton::indicator:checked{background-color:#9C27B0;border-color:#9C27B0}',
+    '780c5f184ce3f4d1d60b9a8cd1da1253fd160ce9': "QTextEdit{background-color:#2D2D2D;color:#D4D4D4;border:1px solid #444444;border-radius:4px;padding:10px;font-family:'Consolas', 'Courier New', monospace;font-size:14px}QTextEdit:hover{border-color:#666666}QTextEdit:focus{border-color:#007ACC;background-color:#2D2D2D;outline:none}",
+    '79d46465ddbfac9035f8b35cdbb8abe1a7bc6ce2': "QTextEdit{background-color:#F5F5F5;color:#666666;border:1px solid #E0E0E0;border-radius:4px;padding:15px;font-family:'Microsoft YaHei', Arial, sans-serif;font-size:14px}QTextEdit QScrollBar:vertical{background-color:#F5F5F5;width:10px}QTextEdit QScrollBar::handle:vertical{background-color:#BDBDBD;border-radius:5px}QTextEdit QScrollBar::handle:vertical:hover{background-color:#9E9E9E}",
+    '8296ffd6fd52074c56b1a045b7a20350cd34c6d1': 'color:white;background-color:#3F51B5;padding:10px;font-size:16px;font-weight:bold',
+    '8af2d9a01e464b8bec8d0bf1ad1809fd1b1a351b': 'QComboBox{background-color:#2196F3;color:white;padding:5px;border:1px solid #1976D2;border-radius:4px}',
+    '94b6bbd41df559adb46d0198ef8dfa38f887a590': "QTextEdit{background-color:white;color:#333333;border:1px solid #CCCCCC;border-radius:4px;padding:20px;font-family:'SimSun', '宋体', serif;font-size:14px;background-image:url(data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMDAlIiBoZWlnaHQ9IjEwMCUiPjxkZWZzPjxwYXR0ZXJuIGlkPSJwYXR0ZXJuIiB4PSIwIiB5PSIwIiB3aWR0aD0iMTAwIiBoZWlnaHQ9IjIwIiBwYXR0ZXJuVW5pdHM9InVzZXJTcGFjZU9uVXNlIiBwYXR0ZXJuVHJhbnNmb3JtPSJyb3RhdGUoNDUpIj48bGluZSB4MT0iMCIgeTE9IjAiIHgyPSIxMDAiIHkyPSIwIiBzdHJva2U9IiNmNWY1ZjUiIHN0cm9rZS13aWR0aD0iMC41Ii8+PC9wYXR0ZXJuPjwvZGVmcz48cmVjdCB3aWR0aD0iMTAwJSIgaGVpZ2h0PSIxMDAlIiBmaWxsPSJ1cmwoI3BhdHRlcm4pIiAvPjwvc3ZnPg==)}QTextEdit:hover{border-color:#999999}QTextEdit:focus{border-color:#2196F3;outline:none}",
+    '9911da685db20e9e815e14cc1a336d9b3ed9547d': 'QProgressBar{background-color:#E0E0E0;border-radius:15px;text-align:center;color:white;font-weight:bold;border:1px solid #BDBDBD}QProgressBar::chunk{background:qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #4CAF50, stop:1 #2196F3);border-radius:15px;border:1px solid #4CAF50}',
+    'a12cb04388822b5f6b8f7b7478258ba634d2f8f8': 'QProgressBar{background-color:#E0E0E0;border-radius:10px;text-align:center;color:#333;font-weight:bold;border:1px solid #BDBDBD}QProgressBar::chunk{background-color:#FF9800;width:20px;margin:1px;border-radius:3px}',
+    'a4062aad2186659dc2c19ca853890d4d9f0b8440': "QTextEdit{background-color:white;color:#333333;border:1px solid #CCCCCC;border-radius:4px;padding:15px;font-family:'Microsoft YaHei', Arial, sans-serif;font-size:14px;selection-background-color:#2196F3;selection-color:white}QTextEdit:hover{border-color:#999999}QTextEdit:focus{border-color:#2196F3;outline:none}",
+    'abd7184b6e7e0964100fb08f5fd40e9510d72074': 'QRadioButton{color:#333333;font-size:14px;spacing:5px}QRadioButton::indicator{width:18px;height:18px;border:2px solid #FF5722;border-radius:2px;background-color:white}QRadioButton::indicator:checked{background-color:#FF5722}QRadioButton::indicator:checked::after{position:absolute;width:10px;height:6px;background-color:white;top:4px;left:3px;border-left:2px solid white;border-bottom:2px solid white}',
+    'ac82376c65545a43b047a7eb014e1476bf732811': 'QRadioButton{color:#F44336;font-size:14px;spacing:5px}QRadioButton::indicator{width:16px;height:16px;border:2px solid #FFCDD2;border-radius:8px;background-color:white}QRadioButton::indicator:checked{background-color:#F44336;border-color:#F44336}',
+    'b205b47242d54926b6f1d3d5a7575cf882ff0813': "QTextEdit{background-color:#F7F7F7;color:#333333;border:1px solid #CCCCCC;border-radius:4px;padding:10px 10px 10px 40px;font-family:'Consolas', 'Courier New', monospace;font-size:14px;background-image:linear-gradient(to right, #E0E0E0 0px, #E0E0E0 30px, transparent 30px), url(data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxMDAlIiBoZWlnaHQ9IjEwMCUiPjxkZWZzPjxwYXR0ZXJuIGlkPSJwYXR0ZXJuIiB4PSIzMCIgeT0iMCIgd2lkdGg9IjcwIiBoZWlnaHQ9IjIwIiBwYXR0ZXJuVW5pdHM9InVzZXJTcGFjZU9uVXNlIiBwYXR0ZXJuVHJhbnNmb3JtPSJyb3RhdGUoNDUpIj48bGluZSB4MT0iMCIgeTE9IjAiIHgyPSI3MCIgeTI9IjAiIHN0cm9rZT0iI2ZmZiIgc3Ryb2tlLXdpZHRoPSIwLjUiLz48L3BhdHRlcm4+PC9kZWZzPjxyZWN0IHdpZHRoPSIxMDAlIiBoZWlnaHQ9IjEwMCUiIGZpbGw9InVybCgjcGF0dGVybikiIC8+PC9zdmc+)}QTextEdit:hover{border-color:#999999}QTextEdit:focus{border-color:#2196F3;background-color:#F5F5F5;outline:none}",
+    'bd828643516b2c5040ad6a3f57424386ed50e864': 'QRadioButton{color:#00BCD4;font-size:14px;spacing:5px}QRadioButton::indicator{width:20px;height:20px;border:2px solid #00BCD4;border-radius:10px;background-color:#1A1A1A}QRadioButton::indicator:checked{background-color:#00BCD4}QRadioButton::indicator:checked::after{position:absolute;width:10px;height:10px;border-radius:5px;background-color:#1A1A1A;top:5px;left:5px}',
+    'c427e537397f5f010eec9dc5c445d7a0bda41b56': 'QRadioButton{color:#2196F3;font-size:14px;spacing:5px}QRadioButton::indicator{width:16px;height:16px;border:2px solid #BBDEFB;border-radius:8px;background-color:white}QRadioButton::indicator:checked{background-color:#2196F3;border-color:#2196F3}',
+    'c4c7b034782444f201126865619b07256f6ae3b0': 'QRadioButton{color:#333333;font-size:16px;spacing:6px}QRadioButton::indicator{width:24px;height:24px;border:2px solid #CCCCCC;border-radius:12px;background-color:white}QRadioButton::indicator:checked{background-color:#9C27B0;border-color:#9C27B0}QRadioButton::indicator:checked::after{position:absolute;width:12px;height:12px;border-radius:6px;background-color:white;top:6px;left:6px}',
+    'd0a2c8af5e9e29e1be4d9265d04e5136cb0d25de': 'QLineEdit{background-color:#FFFFFF;border:2px solid #CCCCCC;border-radius:4px;padding:5px}',
+    'd736170d91c41034e0f5c47b740ab43006c63138': "QTextEdit{background-color:white;color:#333333;border:1px solid #CCCCCC;border-radius:4px;padding:10px;font-family:'Microsoft YaHei', Arial, sans-serif;font-size:14px}QTextEdit:hover{border-color:#999999}QTextEdit:focus{border-color:#2196F3;background-color:#FAFAFA;outline:none}",
+    'dbc914e5b8a52e105ba81c37f06059ee7013e322': 'QTabWidget::pane{border:none;background-color:white;border-bottom:1px solid #E0E0E0}QTabBar::tab{background-color:transparent;color:#666666;padding:12px 20px;margin-right:4px}QTabBar::tab:hover{color:#2196F3}QTabBar::tab:selected{color:#2196F3;font-weight:bold}QTabBar::tab:selected::after{background-color:#2196F3;height:3px;width:100%;position:absolute;bottom:0;left:0}',
+    'dcefec9aa3b6e73024da02c56df86b89fa48c23d': 'QProgressBar{background-color:#1A1A1A;border-radius:15px;text-align:center;color:#00BCD4;font-weight:bold;border:1px solid #00BCD4;padding:2px}QProgressBar::chunk{background-color:#00BCD4;border-radius:13px}',
+    'dd46a486f1d1a6d6cfa938858df1fd2236dcc074': 'QRadioButton{color:#333333;font-size:14px;spacing:5px}QRadioButton::indicator{width:18px;height:18px;border:2px solid #673AB7;border-radius:9px;background-color:white}QRadioButton::indicator:checked{background-color:#673AB7}QRadioButton::indicator:checked::after{color:white;font-weight:bold;font-size:12px;position:absolute;top:1px;left:4px}',
+    'dff416e813c61439ca8559e6985546937ba331b4': "QTextEdit{background-color:#1E1E1E;color:#D4D4D4;border:1px solid #444444;border-radius:4px;padding:15px;font-family:'Microsoft YaHei', Arial, sans-serif;font-size:14px;selection-background-color:#007ACC;selection-color:white}QTextEdit:hover{border-color:#666666}QTextEdit:focus{border-color:#007ACC;outline:none}",
+    'fa5d63987b4016a6a9f029223330437c3d66902e': 'QProgressBar{background-color:#F5F5F5;border-radius:75px;text-align:center;color:#2196F3;font-weight:bold;font-size:18px;border:8px solid #E0E0E0}QProgressBar::chunk{background-color:#2196F3;border-radius:75px;border:8px solid #1976D2}',
+}
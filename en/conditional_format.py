@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Conditional Format
+Coloring cells by their values with a brush set on every item, or a check written into a callback per cell,
+allocates a brush per cell and hard-codes the condition. ConditionalFormat declares rules per column instead, a
+range of values, a value or a regular expression with the foreground and background colors of the cells that
+match. The rules of a column are evaluated in bulk on its TextColumn or NumberColumn arrays into one small array
+of style numbers per role, and the model serves the brushes of those numbers from a pool shared by every format,
+one QBrush per color.
+
+Run directly, it loads a million-row synthetic product table into the table gallery and reports the time to
+evaluate a changed rule set and repaint the table, for a range, an equality and a regular expression rule.
+
+Usage:
+    python conditional_format.py
+    python conditional_format.py --rows 1000000 --offscreen
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor
+
+FOREGROUND_ROLE = Qt.ForegroundRole
+BACKGROUND_ROLE = Qt.BackgroundRole
+FORMAT_ROLES = (FOREGROUND_ROLE, BACKGROUND_ROLE)
+
+
+class BrushPool:
+    """One QBrush per color, numbered from 1, number 0 standing for no brush"""
+
+    def __init__(self):
+        self.brushes = [None]
+        self._numbers = {}
+
+    def number(self, color):
+        """Return the number of the brush of a color, a QColor or anything QColor takes, e.g. "#ff0000" """
+        color = QColor(color) if not isinstance(color, QColor) else color
+        key = color.rgba()
+        number = self._numbers.get(key)
+        if number is None:
+            number = self._numbers[key] = len(self.brushes)
+            self.brushes.append(QBrush(color))
+        return number
+
+
+# Shared by every format, so the same color is the same brush in every table
+BRUSHES = BrushPool()
+
+
+class Rule:
+    """Colors of the cells of a column that match a condition; the base rule matches every cell"""
+
+    def __init__(self, foreground=None, background=None):
+        self.foreground = foreground
+        self.background = background
+
+    def colors(self):
+        """Return {role: color} of the colors this rule sets"""
+        colors = {FOREGROUND_ROLE: self.foreground, BACKGROUND_ROLE: self.background}
+        return {role: color for role, color in colors.items() if color is not None}
+
+    def mask(self, column):
+        """Return a bool array, True for the rows of column that match"""
+        return np.ones(len(column), dtype=bool)
+
+
+class RangeRule(Rule):
+    """Matches the numbers of a NumberColumn within minimum and maximum, either of which may be None"""
+
+    def __init__(self, minimum=None, maximum=None, foreground=None, background=None):
+        super().__init__(foreground, background)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def mask(self, column):
+        values = getattr(column, "values", None)
+        if values is None:
+            return np.zeros(len(column), dtype=bool)
+        # NaN compares false, so empty cells never match
+        mask = ~np.isnan(values)
+        if self.minimum is not None:
+            mask &= values >= self.minimum
+        if self.maximum is not None:
+            mask &= values <= self.maximum
+        return mask
+
+
+class EqualsRule(Rule):
+    """Matches the cells holding value, a text of a TextColumn or a number of a NumberColumn"""
+
+    def __init__(self, value, foreground=None, background=None):
+        super().__init__(foreground, background)
+        self.value = value
+
+    def mask(self, column):
+        if hasattr(column, "codes"):
+            # One comparison of codes, the text looked up once among the distinct texts
+            return column.codes == column.code_of(self.value)
+        return column.values == self.value
+
+
+class MatchRule(Rule):
+    """Matches the cells whose text, as loaded, contains a match of a regular expression"""
+
+    def __init__(self, pattern, foreground=None, background=None):
+        super().__init__(foreground, background)
+        self.pattern = re.compile(pattern)
+
+    def mask(self, column):
+        # The expression runs once per distinct text, not per row
+        if hasattr(column, "codes"):
+            texts, rows = column.sources, column.codes
+        else:
+            values, rows = np.unique(column.values, return_inverse=True)
+            texts = [column.format_value(value) for value in values.tolist()]
+        matches = np.fromiter((self.pattern.search(text) is not None for text in texts), dtype=bool,
+                              count=len(texts))
+        return matches[rows]
+
+
+class ConditionalFormat:
+    """Rules per column of a table, evaluated into a style number per row and role
+
+    Text rules are matched against the texts the rows were loaded with; a translation keeps the rows they
+    matched, as it keeps the codes of the rows.
+    """
+
+    def __init__(self, pool=BRUSHES):
+        self.pool = pool
+        self.rules = {}
+        # (column, role): uint16 array of brush numbers, one per row
+        self._numbers = {}
+
+    def set_rules(self, column, rules, values):
+        """Color the cells of column by rules, the first rule that matches a cell setting each of its colors"""
+        self.rules[column] = list(rules)
+        self.update(column, values)
+
+    def remove_rules(self, column):
+        self.rules.pop(column, None)
+        for role in FORMAT_ROLES:
+            self._numbers.pop((column, role), None)
+
+    def update(self, column, values):
+        """Evaluate the rules of column again on its values, e.g. after they changed"""
+        numbers = {}
+        # Later rules first, so the rules before them overwrite the rows they match too
+        for rule in reversed(self.rules.get(column, ())):
+            colors = rule.colors()
+            if not colors:
+                continue
+            mask = rule.mask(values)
+            for role, color in colors.items():
+                if role not in numbers:
+                    numbers[role] = np.zeros(len(values), dtype=np.uint16)
+                numbers[role][mask] = self.pool.number(color)
+        for role in FORMAT_ROLES:
+            if role in numbers:
+                self._numbers[(column, role)] = numbers[role]
+            else:
+                self._numbers.pop((column, role), None)
+
+    def brush(self, column, row, role):
+        """Return the brush of a cell for a role, None where no rule sets it"""
+        numbers = self._numbers.get((column, role))
+        if numbers is None:
+            return None
+        return self.pool.brushes[numbers[row]]
+
+
+def benchmark(row_count, runs):
+    """Print the time to evaluate changed rules on a synthetic table of row_count rows and repaint it"""
+    from PySide6.QtWidgets import QApplication
+    from column_table import ColumnTableModel, column_from_texts, synthetic_rows
+    from tablewidget_styles import TableWidgetStylesWindow
+
+    app = QApplication.instance()
+    headers, texts = synthetic_rows(row_count)
+    model = ColumnTableModel(headers, [column_from_texts(column) for column in texts], Qt.AlignCenter)
+    del texts
+    window = TableWidgetStylesWindow()
+    window.set_table_model(model)
+    window.show()
+    app.processEvents()
+
+    # Name: (column, two rule sets the measurement switches between)
+    changes = {
+        "price range": (1, [RangeRule(5000, None, "#c00000", "#fff0f0")],
+                        [RangeRule(None, 1000, "#008000", "#f0fff0")]),
+        "stock equals": (2, [EqualsRule(0, background="#ffe0e0")], [EqualsRule(1, background="#fff4d0")]),
+        "name regex": (0, [MatchRule(r"^(Laptop|Tablet)", foreground="#1464a0")],
+                       [MatchRule(r"\b1\d$", foreground="#a05014")]),
+    }
+    print(f"{row_count} rows, {runs} runs; median ms to evaluate a changed rule set / and repaint")
+    for name, (column, first, second) in changes.items():
+        evaluations = []
+        totals = []
+        for run in range(runs * 2):
+            start = time.perf_counter()
+            model.set_format_rules(column, first if run % 2 else second)
+            evaluated = time.perf_counter()
+            window.table_view.viewport().repaint()
+            evaluations.append((evaluated - start) * 1000)
+            totals.append((time.perf_counter() - start) * 1000)
+        print(f"    {name:13} {statistics.median(evaluations):7.2f} / {statistics.median(totals):7.2f}")
+    print(f"{len(BRUSHES.brushes) - 1} brushes shared by every format")
+    window.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark changing the conditional format of a large table")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows of the synthetic table")
+    parser.add_argument("--runs", type=int, default=5, help="rule changes timed per rule")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    # The models import this file as conditional_format, and share its brushes there
+    import conditional_format
+
+    conditional_format.benchmark(args.rows, args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
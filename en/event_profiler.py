@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Widget Event Profiler
+This tool shows which widgets of a gallery window pay for a style switch. ProfiledApplication.notify() times the
+delivery of every Paint, Polish, StyleChange and LayoutRequest event of the window, event filters of the
+receiver included, so each one is counted and timed per widget (self time, without nested events). Every polish
+and style change also counts the images that the stylesheets applying to the widget refer to but that don't
+exist, e.g. an unregistered :/icons/ resource, since each one is a failed lookup whenever the widget's style
+rules are rebuilt. A floating overlay lists the hottest widgets of the current switch, and every switch can be
+exported as folded stacks for flamegraph.pl or speedscope.
+
+Usage:
+    python event_profiler.py tabwidget_styles.py                          # profile while using the window
+    python event_profiler.py tabwidget_styles.py --headless -o tab.folded # switch every style offscreen
+    flamegraph.pl tab.folded > tab.svg
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+import shiboken6
+from PySide6.QtCore import Qt, QObject, QEvent, QFile, QTimer, QPoint
+from PySide6.QtGui import QAction, QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QApplication, QFileDialog, QWidget
+
+from icon_resources import stylesheet_image_rules
+from render_snapshots import STYLE_SELECTOR_ATTRIBUTES, _init_worker, create_window, style_states
+
+# Events that are profiled, with their frame names in the report
+PROFILED_EVENTS = {
+    QEvent.Paint: "Paint",
+    QEvent.Polish: "Polish",
+    QEvent.StyleChange: "StyleChange",
+    QEvent.LayoutRequest: "LayoutRequest",
+}
+# Input on the style selector that may be about to switch the style
+SELECTOR_INPUT_EVENTS = (QEvent.MouseButtonRelease, QEvent.KeyPress, QEvent.Wheel)
+
+HOT_WIDGET_COUNT = 10
+OVERLAY_INTERVAL_MS = 500
+
+
+def widget_frame(widget):
+    """Return the flamegraph frame of a widget: its class and object name"""
+    name = type(widget).__name__
+    if widget.objectName():
+        name += f"#{widget.objectName()}"
+    return name.replace(";", ",")
+
+
+def widget_label(widget):
+    """Return a readable label of a widget, with its text if it has any"""
+    label = widget_frame(widget)
+    text = widget.text() if hasattr(widget, "text") and callable(widget.text) else ""
+    if isinstance(text, str) and text:
+        label += f" '{text[:20]}'"
+    return label
+
+
+class WidgetStats:
+    """Event counts and self times of one widget during one style switch"""
+
+    def __init__(self, widget, path):
+        self.widget = widget
+        self.path = path
+        self.label = widget_label(widget)
+        self.counts = Counter()
+        self.times = Counter()
+
+    @property
+    def total(self):
+        return sum(self.times.values())
+
+
+class StyleSwitch:
+    """Profile of the events delivered while one style was being switched to and shown"""
+
+    def __init__(self, name=None):
+        # None until the selector reports which style the switch selected
+        self.name = name
+        self.widgets = {}
+        # Image path: failed lookups of it while widgets were polished
+        self.missing_resources = Counter()
+
+    def hottest(self, count=HOT_WIDGET_COUNT):
+        return sorted(self.widgets.values(), key=lambda stats: stats.total, reverse=True)[:count]
+
+    def event_count(self):
+        return sum(sum(stats.counts.values()) for stats in self.widgets.values())
+
+    def total(self):
+        return sum(stats.total for stats in self.widgets.values())
+
+
+class ProfiledApplication(QApplication):
+    """QApplication that lets the profiler started on it time the delivery of every event"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.profiler = None
+
+    def notify(self, receiver, event):
+        if self.profiler is None:
+            return super().notify(receiver, event)
+        return self.profiler.notify(receiver, event, super().notify)
+
+
+class EventProfiler(QObject):
+    """Counts and times the paint, polish, style change and layout events of one window"""
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.switches = [StyleSwitch("initial")]
+        # Bumped for every profiled event, so the overlay only repaints when something changed
+        self.revision = 0
+        self._selector_widgets = ()
+        # Self time bookkeeping: time spent in nested events of each event being delivered
+        self._nested = []
+        self._paths = {}
+        # Parsed image rules per stylesheet text, and whether each image path exists
+        self._image_rules = {}
+        self._resource_exists = {}
+
+    @property
+    def current(self):
+        return self.switches[-1]
+
+    def start(self):
+        app = QApplication.instance()
+        # An event filter can only time an event by delivering it itself, which skips the receiver's own filters
+        if not isinstance(app, ProfiledApplication):
+            raise TypeError("profiling events needs the application to be a ProfiledApplication")
+        app.profiler = self
+
+    def stop(self):
+        app = QApplication.instance()
+        if app.profiler is self:
+            app.profiler = None
+
+    def clear(self):
+        self.switches = [StyleSwitch(self.current.name)]
+        self.revision += 1
+
+    def follow_selector(self):
+        """Start a new switch whenever the window's style selector changes the style"""
+        for attribute in STYLE_SELECTOR_ATTRIBUTES:
+            combobox = getattr(self.window, attribute, None)
+            if combobox is not None:
+                self._selector_widgets = (combobox, combobox.view().viewport())
+                combobox.currentIndexChanged.connect(lambda index: self._on_style_selected(combobox.itemText(index)))
+                return
+        tab_widget = getattr(self.window, "tab_widget", None)
+        if tab_widget is not None:
+            self._selector_widgets = (tab_widget.tabBar(),)
+            tab_widget.currentChanged.connect(lambda index: self._on_style_selected(tab_widget.tabText(index)))
+
+    def begin_switch(self, name=None):
+        """Start profiling a new switch; an unnamed switch takes the name of the style selected next"""
+        if self.current.name is None and not self.current.widgets:
+            self.current.name = name
+        else:
+            self.switches.append(StyleSwitch(name))
+        self.revision += 1
+
+    def _on_style_selected(self, name):
+        # The window's own handler has already run, its synchronous events belong to the pending switch
+        if self.current.name is None:
+            self.current.name = name
+        else:
+            self.begin_switch(name)
+
+    def _is_profiled(self, widget):
+        return widget == self.window or self.window.isAncestorOf(widget)
+
+    def _path(self, widget):
+        """Return the flamegraph stack of a widget, from the window down to the widget"""
+        path = self._paths.get(widget)
+        if path is None:
+            frames = []
+            ancestor = widget
+            while ancestor is not None:
+                frames.append(widget_frame(ancestor))
+                if ancestor == self.window:
+                    break
+                ancestor = ancestor.parentWidget()
+            path = self._paths[widget] = ";".join(reversed(frames))
+        return path
+
+    def _count_missing_resources(self, widget):
+        """Count the images missing from the rules of the stylesheets that apply to a polished widget"""
+        stylesheets = [QApplication.instance().styleSheet()]
+        ancestor = widget
+        while ancestor is not None:
+            stylesheets.append(ancestor.styleSheet())
+            ancestor = ancestor.parentWidget()
+        for stylesheet in filter(None, stylesheets):
+            rules = self._image_rules.get(stylesheet)
+            if rules is None:
+                rules = self._image_rules[stylesheet] = stylesheet_image_rules(stylesheet)
+            for class_names, paths in rules:
+                if not any(name in ("", "*") or widget.inherits(name) for name in class_names):
+                    continue
+                for path in paths:
+                    exists = self._resource_exists.get(path)
+                    if exists is None:
+                        exists = self._resource_exists[path] = QFile.exists(path)
+                    if not exists:
+                        self.current.missing_resources[path] += 1
+
+    def notify(self, watched, event, deliver):
+        """Deliver an event with deliver(watched, event), timing it if it is profiled, and return its result"""
+        event_type = event.type()
+        if event_type in SELECTOR_INPUT_EVENTS and watched in self._selector_widgets and self.current.name is not None:
+            self.begin_switch()
+
+        name = PROFILED_EVENTS.get(event_type)
+        if name is None or not watched.isWidgetType() or not self._is_profiled(watched):
+            return deliver(watched, event)
+
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        result = deliver(watched, event)
+        elapsed = time.perf_counter() - start
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += elapsed
+
+        switch = self.current
+        stats = switch.widgets.get(watched)
+        if stats is None:
+            stats = switch.widgets[watched] = WidgetStats(watched, self._path(watched))
+        stats.counts[name] += 1
+        stats.times[name] += elapsed - nested
+        # Both rebuild the widget's style rules, which looks its images up
+        if event_type in (QEvent.Polish, QEvent.StyleChange):
+            self._count_missing_resources(watched)
+        self.revision += 1
+        return result
+
+    def summary(self, top=HOT_WIDGET_COUNT):
+        """Return a text report of the hottest widgets of every switch"""
+        lines = []
+        for switch in self.switches:
+            lines.append(f"{switch.name or '(no switch)'}: {switch.event_count()} events, "
+                         f"{switch.total() * 1000:.2f} ms")
+            if switch.missing_resources:
+                lines.append(f"    {sum(switch.missing_resources.values())} missing resource lookups: "
+                             + ", ".join(f"{path} x{count}" for path, count in switch.missing_resources.most_common()))
+            for stats in switch.hottest(top):
+                counts = " ".join(f"{name}={stats.counts[name]}" for name in PROFILED_EVENTS.values()
+                                  if stats.counts[name])
+                lines.append(f"    {stats.total * 1000:8.3f} ms  {stats.label}  {counts}")
+        return lines
+
+    def folded_stacks(self):
+        """Return the profile as folded stacks, one root frame per switch and self time in microseconds"""
+        stacks = Counter()
+        for number, switch in enumerate(self.switches):
+            root = f"{number:03d} {switch.name or '(no switch)'}".replace(";", ",")
+            for stats in switch.widgets.values():
+                for name, seconds in stats.times.items():
+                    stacks[f"{root};{stats.path};{name}"] += seconds
+        return [f"{stack} {max(1, round(seconds * 1_000_000))}" for stack, seconds in stacks.items()]
+
+    def export(self, path):
+        with open(path, "w", encoding="utf-8") as folded_file:
+            folded_file.write("\n".join(self.folded_stacks()) + "\n")
+
+
+class ProfilerOverlay(QWidget):
+    """Floating list of the hottest widgets of the current switch"""
+
+    def __init__(self, profiler):
+        # A separate translucent window, so that repainting it never repaints the profiled window
+        super().__init__(profiler.window, Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.profiler = profiler
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setFont(QFont("Courier New", 9))
+        self.resize(460, (HOT_WIDGET_COUNT + 2) * QFontMetrics(self.font()).height() + 16)
+
+        self._revision = -1
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._refresh)
+
+    def showEvent(self, event):
+        self.timer.start(OVERLAY_INTERVAL_MS)
+        self._refresh()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def _refresh(self):
+        window = self.profiler.window
+        self.move(window.mapToGlobal(QPoint(window.width() - self.width() - 10, 40)))
+        if self._revision != self.profiler.revision:
+            self._revision = self.profiler.revision
+            self.update()
+
+    def paintEvent(self, event):
+        switch = self.profiler.current
+        hottest = switch.hottest()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(20, 20, 20, 200))
+        line_height = painter.fontMetrics().height()
+        y = 8 + painter.fontMetrics().ascent()
+
+        painter.setPen(QColor("#FFFFFF"))
+        header = f"{switch.name or '...'}: {switch.event_count()} events, {switch.total() * 1000:.1f} ms"
+        missing = sum(switch.missing_resources.values())
+        if missing:
+            header += f", {missing} missing resources"
+        painter.drawText(8, y, header)
+        hottest_total = hottest[0].total if hottest else 0.0
+        for stats in hottest:
+            y += line_height
+            if not shiboken6.isValid(stats.widget):
+                continue
+            # From yellow for cheap widgets to red for the hottest one
+            heat = stats.total / hottest_total if hottest_total else 0.0
+            painter.setPen(QColor(255, int(220 * (1.0 - heat)), 60))
+            counts = "".join(f" {name[0]}{stats.counts[name]}" for name in PROFILED_EVENTS.values()
+                             if stats.counts[name])
+            painter.drawText(8, y, f"{stats.total * 1000:7.2f} ms{counts}  {stats.label}")
+
+
+def install_event_profiler(window):
+    """Add a profiler menu to a gallery window and return its EventProfiler"""
+    profiler = EventProfiler(window)
+    profiler.follow_selector()
+    overlay = ProfilerOverlay(profiler)
+
+    menu = window.menuBar().addMenu("Profiler")
+    toggle_action = QAction("Profile Events", window)
+    toggle_action.setCheckable(True)
+    toggle_action.setShortcut("Ctrl+Shift+P")
+
+    def set_profiling(enabled):
+        if enabled:
+            profiler.start()
+            overlay.show()
+        else:
+            profiler.stop()
+            overlay.hide()
+
+    toggle_action.toggled.connect(set_profiling)
+    clear_action = QAction("Clear Profile", window)
+    clear_action.triggered.connect(profiler.clear)
+    export_action = QAction("Export Flame Graph...", window)
+    export_action.triggered.connect(lambda: _export_with_dialog(profiler))
+    for action in (toggle_action, clear_action, export_action):
+        menu.addAction(action)
+
+    profiler.toggle_action = toggle_action
+    return profiler
+
+
+def _export_with_dialog(profiler):
+    path, _ = QFileDialog.getSaveFileName(profiler.window, "Export Flame Graph", "profile.folded",
+                                          "Folded stacks (*.folded)")
+    if path:
+        profiler.export(path)
+
+
+def profile_headless(path, output=None, top=HOT_WIDGET_COUNT):
+    """Switch through every style of a window offscreen and return its profiler"""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    if QApplication.instance() is None:
+        ProfiledApplication([])
+    _init_worker()
+    app = QApplication.instance()
+    window = create_window(path)
+    window.show()
+    app.processEvents()
+
+    profiler = EventProfiler(window)
+    profiler.follow_selector()
+    profiler.start()
+    for name, activate in style_states(window):
+        profiler.begin_switch()
+        activate()
+        app.processEvents()
+        # Styles that are already selected don't emit a change
+        if profiler.current.name is None:
+            profiler.current.name = name
+    profiler.stop()
+
+    # The first switch is the window being shown, before the profiler was installed
+    profiler.switches = [switch for switch in profiler.switches if switch.widgets]
+    print("\n".join(profiler.summary(top)))
+    if output:
+        profiler.export(output)
+        print(f"Folded stacks written to {output}")
+    window.close()
+    return profiler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the paint, polish and layout events of a gallery window")
+    parser.add_argument("window", help="a *_styles.py gallery window")
+    parser.add_argument("--headless", action="store_true", help="switch every style offscreen and print the profile")
+    parser.add_argument("-o", "--output", help="write the profile as folded stacks for flamegraph.pl or speedscope")
+    parser.add_argument("--top", type=int, default=HOT_WIDGET_COUNT, help="widgets listed per switch")
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.window)
+    if args.headless:
+        profile_headless(path, args.output, args.top)
+        return 0
+
+    app = ProfiledApplication(sys.argv)
+    window = create_window(path)
+    profiler = install_event_profiler(window)
+    window.show()
+    profiler.toggle_action.setChecked(True)
+    exit_code = app.exec()
+    if args.output:
+        profiler.export(args.output)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,8 @@ from PySide6.QtWidgets import (
     QTabWidget, QTextEdit, QGridLayout
 )
 from PySide6.QtCore import Qt
+from locale_switcher import install_language_menu
+from qss_playground import QssPlayground
 
 class GlobalStylesWindow(QMainWindow):
     def __init__(self):
@@ -33,12 +35,17 @@ class GlobalStylesWindow(QMainWindow):
         self.tab_widget.addTab(self.create_cascade_styles_tab(), 'Style Cascade')
         self.tab_widget.addTab(self.create_custom_classes_tab(), 'Custom Classes & IDs')
         self.tab_widget.addTab(self.create_pseudo_states_tab(), 'Pseudo States')
+        self.playground_tab = self.create_playground_tab()
+        self.tab_widget.addTab(self.playground_tab, 'Playground')
         
         # Add tab widget to main layout
         main_layout.addWidget(self.tab_widget)
         
         # Set central widget
         self.setCentralWidget(main_widget)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
     
     def create_global_styles_tab(self):
         """Create the tab for global styles demonstration"""
@@ -263,6 +270,51 @@ class GlobalStylesWindow(QMainWindow):
         
         return tab
 
+    def create_playground_tab(self):
+        """Create the tab for editing the global stylesheet live"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        # Add title label
+        title = QLabel('QSS Playground')
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet('font-size: 18px; font-weight: bold; margin-bottom: 20px;')
+        layout.addWidget(title)
+        
+        # Create explanation label
+        explanation = QLabel(
+            'Edit the application stylesheet below. It is applied once typing pauses, '
+            'and only if it compiles without problems.'
+        )
+        explanation.setWordWrap(True)
+        layout.addWidget(explanation)
+        
+        # The editor compiles in the background and reports to the status bar
+        self.playground = QssPlayground()
+        self.playground.applied.connect(self.show_playground_applied)
+        self.playground.rejected.connect(self.show_playground_rejected)
+        self.playground.unchanged.connect(self.show_playground_unchanged)
+        layout.addWidget(self.playground)
+        
+        return tab
+    
+    def show_playground_applied(self, ms, compile_ms):
+        """Show the time it took to apply the edited stylesheet"""
+        self.statusBar().showMessage(
+            self.locale_switcher.text("Applied in {ms:.1f} ms, compiled in {compile_ms:.1f} ms in the background")
+            .format(ms=ms, compile_ms=compile_ms)
+        )
+    
+    def show_playground_rejected(self, diagnostics):
+        """Show the first problem of a stylesheet that was not applied"""
+        self.statusBar().showMessage(
+            self.locale_switcher.text("Not applied, {count} problems: {problem}")
+            .format(count=len(diagnostics), problem=diagnostics[0])
+        )
+    
+    def show_playground_unchanged(self):
+        self.statusBar().showMessage(self.locale_switcher.text("Unchanged once compiled, nothing re-polished"))
+
 
 # Setup global stylesheet function
 def setup_global_stylesheet(app):
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Icon Resources
+The stylesheets of the scrollbar, tree widget, combobox and line edit galleries refer to arrow, checkbox and
+search images under :/icons/. This module draws those icons, compiles them with pyside6-rcc into the resource
+bundle icons_rc.py, and loads the bundle once at startup, decoding every icon into QPixmapCache before the
+first polish asks for it. Each icon is drawn at the size its subcontrol shows it at and at twice that size as
+name@2x.png, which Qt picks on high-DPI screens by itself, so no icon is scaled when it is painted.
+
+Run directly, it regenerates icons_rc.py next to this file:
+    python icon_resources.py
+"""
+
+import os
+import re
+import sys
+
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+
+ICON_PREFIX = ":/icons/"
+BUNDLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons_rc.py")
+# Device pixel ratios every icon is drawn at
+ICON_SCALES = (1, 2)
+
+ARROW_COLOR = "#616161"
+WHITE = "#FFFFFF"
+CHECKBOX_COLOR = "#2196F3"
+CHECKBOX_BORDER_COLOR = "#9E9E9E"
+SEARCH_COLOR = "#9E9E9E"
+
+# Icon name: (shape, color, logical size in pixels), sized for the subcontrols that show them
+ICONS = {
+    # Scrollbar buttons are 14px or more, tree branch indicators about 20px
+    "up-arrow": ("up", ARROW_COLOR, 8),
+    "down-arrow": ("down", ARROW_COLOR, 8),
+    "left-arrow": ("left", ARROW_COLOR, 8),
+    "right-arrow": ("right", ARROW_COLOR, 8),
+    "up-arrow-white": ("up", WHITE, 8),
+    "down-arrow-white": ("down", WHITE, 8),
+    "left-arrow-white": ("left", WHITE, 8),
+    "right-arrow-white": ("right", WHITE, 8),
+    # Combobox down-arrow subcontrols are 10px to 12px, on colored drop-down buttons
+    "down_arrow": ("down", WHITE, 12),
+    # Tree widget indicators are 18px
+    "checkbox-checked": ("checked", CHECKBOX_COLOR, 18),
+    "checkbox-unchecked": ("unchecked", CHECKBOX_BORDER_COLOR, 18),
+    "checkbox-indeterminate": ("indeterminate", CHECKBOX_COLOR, 18),
+    # Line edit background image
+    "search": ("search", SEARCH_COLOR, 16),
+}
+
+# url() references to files or resources in a stylesheet; data URIs are not looked up
+_URL_PATTERN = re.compile(r"""url\(\s*['"]?(?!data:)([^'")]+?)['"]?\s*\)""")
+_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_preloaded = []
+
+
+def icon_path(name, scale=1):
+    """Return the resource path of an icon at a device pixel ratio"""
+    return f"{ICON_PREFIX}{name}{'' if scale == 1 else f'@{scale}x'}.png"
+
+
+def _arrow_points(direction, rect):
+    left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+    center_x, center_y = rect.center().x(), rect.center().y()
+    return {
+        "up": [QPointF(left, bottom), QPointF(center_x, top), QPointF(right, bottom)],
+        "down": [QPointF(left, top), QPointF(center_x, bottom), QPointF(right, top)],
+        "left": [QPointF(right, top), QPointF(left, center_y), QPointF(right, bottom)],
+        "right": [QPointF(left, top), QPointF(right, center_y), QPointF(left, bottom)],
+    }[direction]
+
+
+def draw_icon(shape, color, size, scale=1):
+    """Return the image of an icon, size logical pixels square, drawn at a device pixel ratio"""
+    image = QImage(size * scale, size * scale, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.scale(scale, scale)
+    color = QColor(color)
+
+    if shape in ("up", "down", "left", "right"):
+        # A flat triangle, half as deep as it is wide
+        depth = size / 2
+        if shape in ("up", "down"):
+            rect = QRectF(0, (size - depth) / 2, size, depth)
+        else:
+            rect = QRectF((size - depth) / 2, 0, depth, size)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawPolygon(_arrow_points(shape, rect))
+    elif shape == "unchecked":
+        painter.setPen(QPen(color, 1.5))
+        painter.setBrush(QColor(WHITE))
+        painter.drawRoundedRect(QRectF(1.25, 1.25, size - 2.5, size - 2.5), 3, 3)
+    elif shape in ("checked", "indeterminate"):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(0.5, 0.5, size - 1, size - 1), 3, 3)
+        pen = QPen(QColor(WHITE), size / 9, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        painter.setPen(pen)
+        if shape == "checked":
+            painter.drawPolyline([QPointF(size * 0.25, size * 0.52), QPointF(size * 0.43, size * 0.7),
+                                  QPointF(size * 0.75, size * 0.32)])
+        else:
+            painter.drawLine(QPointF(size * 0.28, size / 2), QPointF(size * 0.72, size / 2))
+    elif shape == "search":
+        painter.setPen(QPen(color, size / 8, Qt.SolidLine, Qt.RoundCap))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(QRectF(size * 0.12, size * 0.12, size * 0.5, size * 0.5))
+        painter.drawLine(QPointF(size * 0.56, size * 0.56), QPointF(size * 0.86, size * 0.86))
+    else:
+        raise ValueError(f"Unknown icon shape: {shape}")
+
+    painter.end()
+    return image
+
+
+def build_bundle(output=BUNDLE_PATH):
+    """Draw every icon at every scale and compile them into a Python resource module with pyside6-rcc"""
+    import subprocess
+    import tempfile
+    from xml.sax.saxutils import escape
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.mkdir(os.path.join(directory, "icons"))
+        files = []
+        for name, (shape, color, size) in ICONS.items():
+            for scale in ICON_SCALES:
+                relative = icon_path(name, scale)[len(":/"):]
+                draw_icon(shape, color, size, scale).save(os.path.join(directory, relative))
+                files.append(relative)
+        qrc_path = os.path.join(directory, "icons.qrc")
+        with open(qrc_path, "w", encoding="utf-8") as qrc_file:
+            entries = "\n".join(f"    <file>{escape(path)}</file>" for path in files)
+            qrc_file.write(f'<RCC>\n  <qresource prefix="/">\n{entries}\n  </qresource>\n</RCC>\n')
+        # Zlib compression buys nothing on PNG data, and loading skips the inflate
+        subprocess.run(["pyside6-rcc", "--no-compress", qrc_path, "-o", output], check=True)
+    return output
+
+
+def load_icon_resources():
+    """Register the icon bundle and decode every icon into QPixmapCache, once per process
+
+    Needs a QGuiApplication. Returns the number of icons decoded.
+    """
+    if not _preloaded:
+        import icons_rc  # noqa: F401, registers the resources on import
+
+        for name in ICONS:
+            for scale in ICON_SCALES:
+                pixmap = QPixmap(icon_path(name, scale))
+                if not pixmap.isNull():
+                    _preloaded.append(pixmap)
+    return len(_preloaded)
+
+
+def stylesheet_image_rules(stylesheet):
+    """Return (widget class names, image paths) for every rule of a stylesheet that refers to an image"""
+    rules = []
+    for selectors, body in _RULE_PATTERN.findall(_COMMENT_PATTERN.sub("", stylesheet)):
+        paths = _URL_PATTERN.findall(body)
+        if paths:
+            # The type selector of each selector, e.g. QScrollBar in QScrollBar::up-arrow:vertical
+            class_names = {re.split(r"[:#.\[\s>]", selector.strip(), 1)[0] for selector in selectors.split(",")}
+            rules.append((class_names, paths))
+    return rules
+
+
+def main():
+    from PySide6.QtGui import QGuiApplication
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication(sys.argv)
+    output = build_bundle()
+    print(f"{len(ICONS)} icons at {len(ICON_SCALES)} scales compiled into {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
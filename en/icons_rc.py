@@ -0,0 +1,682 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\x9f\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00QIDAT8\x8d\xb5\
+\xcfA\x0a\x00 \x0c\x03A\xf1\xe5\xfe<\x1e\x14\xd4\xda\
+JRp\x8fB\x86Z\x8a\x09@\xb3oR\x18\xe5\x11\
+\xacr\x08\xcet\x04w\x1a\xe2\x00\x1a\x12\x00<\xf2\x00\
+\x5c\xa4\xd2\xa7\xb1\xfd\xfa\x027\x0e\x00~\xec\x00\xda\xd8\
+\x00\xfax\x03r\xe3\x09H\xe3\x0e;`\xf7\x92\xad!\
+|\xa8\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00\x92\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00DIDAT\x18\x95c\
+`\xa0\x140&%%5\xfc\xff\xff\xbf\x1e\xab$#\
+c#\xf3\xf9\xf3\xe7\x0f\x18\x19\x1912008\xa0\
+K\xce\x9b7\xaf\x81\x99\x81\x81\x81\x01]\x11L\x12\xc3\
+\xc8\xa4\xa4\xa4\x86\xa4\xa4$L\x09\x8a\x00\x00x;\x16\
+\xbe~\xb0*Q\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x00\x85\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x007IDAT\x18\x95c\
+`\xc0\x02\x92\x92\x92\x1a`l&l\x92\xff\xff\xff\xaf\
+\xc7\xaa\x00]\x12E\x016I\xacV\xe0T0o\xde\
+\xbc\x06FF\xc6F\xbc&\xe0R\x84\x01\x90\xbd\x09\x00\
+\x15\x86\x18{\xde\xe1C\x10\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x01S\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x12\x00\x00\x00\x12\x08\x06\x00\x00\x00V\xce\x8eW\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01\x05IDAT8\x8d\xed\
+\x941N\xc3P\x10Dg\xc7\xbdm\xc9(W@\xc9\
+\x0d(~\x99\xd4p\x04\xcb\xe7\xb2\xfe\x15\xa8\x93\xf2\x17\
+p\x82D\x1c!\x08K|\x1f`>\x056B\x11\x18\
+[THL?O\xb3\xab\xdd1\x0c\xf2\xde\x97\x92v\
+$\xd7\x92\x0c\x13\x22\x99$\x9dH\xee\xeb\xba~\x05\x00\
+\x03\x80\xb6mo\xb2,\xbb\x97\xb4\x9a\x02\x5c\xca\xcc\xce\
+\x92\xee\x9a\xa6y0\xef}ifOUU]9\xe7\
+\x98\xe79\xcc&\x03!\xa5\x84\xbe\xef\x11BP\xd7u\
+/)\xa5kJ\xdaIZ9\xe7X\x14\xc5\x8f\x90!\
+\x09\x8a\xa2\x80s\x8e\xc3\x14[\x92\x5c\x03@\x9e\xe7K\
+\xa6\xc2\x85g\xc3q\xb1s\x92|\x95\x0c\x00$\x19\x17\
+\xbb\xbf\xd1?\xe8O\x82H&\xe0\xfd\xec\x97j\xf4\x90\
+L\x94t\x02\x80\xbe\xef\x17\x83>y\x8e$\xb9'\xf9\
+\x1cBP\x8cqV\xb2\x94\x12b\x8c\x08!\xc8\xcc\xce\
+\x00\x0e\xbf\xae\x11\x00\xb7u]?~<\x98\xf7\xbe\x04\
+\xb0\x05\xb0\x99Sl\x00\x8e\x00\x0ec\xb1\xbd\x01\xe3\xf0\
+}\x09.\x16\x81\xde\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x01\xa9\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00$\x00\x00\x00$\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01[IDATX\x85\xed\
+\xd8\xb1J\xc3@\x1c\x80\xf1\xef\x12CE\xb27`\x87\
+>@\x9f\xa0\x14\xac\xef\xd1\xb5\x15w\xf7\x90\xdd]\x9a\
+\x8e\xd6\xe70C\xe9\x13\xf4\x012TH\xf7(\x96\x90\
+\x9eC\x93T)\xf6\x94\x10/B\xbe-\xf0\x87\xfb\x91\
+\xbb\x0c9\xa8Y\xe2\xcb\x93+\x8dn;\x9e\x08\x98\x00\
+=\xc0\xaah\xdd\x04XI\xf0\xc3\x8d\xed\xe3\x89\xdd\x11\
+\xa8\xf3\xf0vi\xc9t\x0e\x0c+B|W\x90\x08s\
+\xb4\xbe\xbdx\x010\x00p\xa5a\xc9\xf4I\x03\x06`\
+h\xc9t\x8e+\x8d\x02\xd4m\xc7\x13\xe0J\x03\xa6@\
+u\x9dx\x5c\x80\xb23\xa35!\xb9\x81|\xcb\xf6\x07\
+Xw=8\x80\xaa\xfa\x9a~\x93\x05\x07Pmj@\
+\xaa\x1a\x90\xaa\x06\xa4\xaav\xa03\xd5@\xbfcr\x7f\
+}\x8ec\x0b\xd5\xe8\xc9\xa2Xr\xf7\xfc\xcer\x9d\x9e\
+\x9cS\xbe!w\xd0*\x8d\x01pl\x81;h)\xe7\
+j\xb7eJ\x90\xb7\xd8\x12\xc5\xb2\xf4BQ,\xf1\x16\
+[\xe5\x9c\xf2\x0c-\xd7)\xfd\xc7\xd7\xd2\xa0\x9f\xf6\xff\
+\xb6\xec\xafk@\xaa\x1a\x90\xaa\x06\xa4*\x07%Z\x15\
+\xfb\x128\x80V\x1a!y+\xc8@\x12|\xbd\x16\x90\
+\x82)d\xa0pc\xfb@\xa0\xd1\x13\x84\x91=+@\
+xb\x97\x08s\xa4\x09\x15$\xc2\x1c\xe5wD\xc7\x17\
+VN<\xce~\xfc\xab\xbf\xb0\x12L\xc3\xc8\x9e}\xbe\
+\xb0\xaa]\x1fW?\x5c\xbfj.c\xb1\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x00\x8b\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00=IDAT\x18\x95c\
+`\x80\x82\xa4\xa4\xa4\x06\x06,\x80\x09\xc6\xf8\xff\xff\x7f\
+=6EL\xc8\x1cl\x8aP\x14`S\x84\xa1\x00\xaf\
+\x15\x0c\x0c\x0c\x0c\x8c\x8c\x8c\x8d\xf3\xe6\xcd\xc3n\x02\xba\
+$\x0a\xc0\xe5M\x00-~\x18{2\xd1\xdaR\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00q\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00#IDAT\x18\x95c\
+`\xa0\x18\xfc\xff\xff\xbf\xe1?n\xd0\x80OQ\x03>\
+\x93\x1a0\xacBR\x84]\x92l\x00\x007HK\xb9\
+\x1fG[\xc2\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x00\x8a\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00<IDAT\x18\x95c\
+`\xa0*HJJjHJJj@\x16cF\x96\
+\xfc\xff\xff\x7f=\x03\x03\x83\x83\x91\x91\x11\xe3\xf9\xf3\xe7\
+\x0f\xc0\x15 I\xc2\x00\x5c\x11#\x16I8`dd\
+l\xa4\xdc\xe1\x00\xaf%\x1bF\xbbO=]\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x00{\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00-IDAT\x18\x95c\
+`\xc0\x02\xfe\xff\xff\xdf\x80M\x1c.\xf9\xff\xff\xff\xff\
+x%\xb1*@\x96DV\xc0\x84\xd3.\x92\xad \xca\
+\x91\xc8\x8a`l\x00\x80\x15<J>j\xf41\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00{\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x0c\x00\x00\x00\x0c\x08\x06\x00\x00\x00Vu\x5c\xe7\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00-IDAT(\x91c\
+`\x18|\xe0\xff\xff\xff\x0d\xff\x89\x07\x0d\xa4hj \
+\xc5\xa6\x06\x0c\xa7\xe1\xd1\x84]1\x0eM\xf8\x15\xa3i\
+\x22N\xf1\xc0\x03\x00!\xb2\xa1e\x81\xfd\x85\xee\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00y\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00+IDAT\x18\x95c\
+`\x80\x82\xff\xff\xff70\xe0\x03\xff!\x00\xb7\xa2\xff\
+\x08\x80]\xd1\x7fT\x00W\xc4\x84\xd7^r\xac\xc0\xeb\
+H\xac\x92\x00\xb8\xf0<J{\xb6\x02\x0b\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x01\xe8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00$\x00\x00\x00$\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01\x9aIDATX\x85\xed\
+\xd8\xb1\x8e\xda@\x14\x85\xe1\xff\x1a\x84;[Ym\xe9\
+'\xa0\x9a\x9e\xad\xa3HID\x1b\xc9\x0d \x1ek\x04\
+4h\xb7EI\xa4\x886\xa1\x9f*O\xe0\x12i\xe5\
+\xe9@\xc8\x93\x22;\xc4bA\xde\xc28\x14>\xe5i\
+\xceg\xd9.f\xe0\xc6\x22\xa7\x85sN\xe6\xf3\xf9G\
+`\x0a\x0c\x80\xfb\x9a7\xb7\xc0\x06\xd0\xe3\xf1\xf8\xbb\x88\
+\xb8\x8b \xad\xf5]\xa7\xd3yt\xce\xbd\xaf\x19q6\
+\x22\xb2\xee\xf5z_\xd24}~\x05\xd2Z\xdf\x05A\
+\xf0\x13\xe87\x81)\xe5w\x18\x86\x0f\x1e\xd5\x85\xbf\xaf\
+i\xb1X<:\xe7\xfa\x00\xddn\x17\xa5\x14I\x92\x10\
+\xc71A\x10\xd4\xb2\x5c\x14\x05y\x9e\x93e\x19\xc6\x18\
+\x0e\x87\x03@\x7f\xbf\xdf?9\xe7>\x88\x88\x13\x80\xd9\
+l\xf6\x09\xf8\xea1\xc3\xe1\x90(\x8ajA\x5c\x8a\xb5\
+\x96\xd5j\xe5Q\x00\x9f'\x93\xc97\xff\xe8S\xdf*\
+\xa5\xae\x8e\x01\x88\xa2\x08\xa5T\xb9\x9a\x02x\xd0\xc0\xb7\
+I\x92\x5c\x1dsakP\x06\x1d\x7f\xed8\x8e\x1b\x03\
+\x9dl\xdd\x97A\xc7\xd4\xf5\x01\xbf%\xe7\xb6\x9a[\x7f\
+cZPUZPUZPUZPUZPU\
+ZPUZPUZPU^\x81\x8a\xa2hl\xfc\
+\xdc\x96\x07m}\x91\xe7yS\x9e\xd3\xadm\x19\xb4\xf1\
+m\x96e\x8d\x81N\xb66e\x90\xf6\xad1\x06k\xed\
+\xd51\xd6Z\x8c1\xe5J\xc3\xcb\xd9\xfe\xe5(\xfd\xc3\
+_24|\x94FD\xd6\xa3\xd1\xe8\xdfQ\x1a`\xb9\
+\x5c\xbe\xdb\xedv\xbf\xf8\xcf\x97\x0d\xc7GO\xd3\xf49\
+\x0c\xc3\x07\x11Y7%\x11\x91u\x19\x037xau\
+s\xf9\x03\x8a\x98\xa1\x0fg6\x07\xf0\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x01\xaf\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01aIDAT8\x8d\x9d\
+\x92\xb1N\x1c1\x10\x86\xbf\xf1n\x8e\x22GC\x93g\
+@T)\xe9B\x9b&\xdd5Tw\xa7\x8dDGs\
+\x12\x12o\x10\x89\x0a%\xcd\xe9\xce\xdbEr\x11\x89\x06\
+\x1a$*\x8a{\x02\x1e\x01\xf1\x04Q\xb2k\xffi\x9c\
+(\x1c\xbe\x84\xe4\x97\xac\x99\xb1\xc7\xdfxlCA!\
+\x84A\x08\xa1*\xad\xad\xcb~\x0f\x96\xcb\xe5;\xe0\x04\
+x\x0dt\x92Vfv:\x99LV\x7f\x05x\xef?\
+H\x9a\xe5\xb0\x07\x5c\x1e\xd1\xcc\x8e\xc6\xe3\xf1\xbc\x04p\
+?+K\x9a\x99\xd9\xbd\xa4\xb7\xc3\xe1\xf0e\xd7u\xdb\
+\x92\xc6\xc07I\xe7m\xdb\xee\x95\x00u\xb6'\x00)\
+\xa5\xe9t:\xbd\xcas\xdf\x81\xd6{\xbf#\xe9,\xa5\
+t\x0c4ON\x10B\x18\xe4\x9e\xfb\xbe\xef\xaf\x0bE\
+.\xb3\xdd\xdf\xd4B\x04\xba\xec\xbfXOH)me\
+\xf7k\x110\x1a\x8d\xa2\xa4\x15\xe0\xea\xba\x1e=Ip\
+\xee0\xbb\xb7%@\x0d`f\xa7\xc0\x1b3\xfb\xe8\xbd\
+\xdf\x01.SJ[\xce\xb9\xc3\x94\xd2\xcc\xcc\xa2$_\
+\x02\xfcz\xc6\xc5b\xf1\xde\xcc\xce\x81\xc1ZN\x04*\
+\xe0.\xc6x\xd04\xcdC\x11\x00\xd0\xb6\xed^\xbe\xed\
+\xfd\xdc\xf3\xad$of\x9f\x81\xdd\x12\xe4\x11`\x93\xe6\
+\xf3\xf9\xab\xaa\xaanJ\x90g\x01\xfe\x04q\xcf\x054\
+M\xf3\x10c<\x00\xee\x80\xdd\xaa\xaa>A\xfe\xca\xff\
+\x01\xf9\x22\xe9\xe2_\xf6n\xd4\x0f\xe0\x92\xa2\xbb\x1a\xe2\
+[\xf8\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03\x04\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x02\xb6IDATX\x85\xcd\
+\x96\xbfkSQ\x14\xc7\xbf\xe7\xf6\xa5\x96\xe6\x15\x1d\x1c\
+\x14*.\x82d\x91B'\xd1I\x87N\xba\x19+E\
+\x92w\xd3RED\xff\x85\x0a\x82\x8bK\x17\x0d\xaf7\
+/C\x0bm\xa7\x82fk\x8b\x0a\xe2*\xb4\xa3.%\
+\xb8\x14\x97:$\x14_\xbe\x0eM\xca\xeb%&\xef\xc5\
+D\xfdn\xf7{\xdf=\xe7\xf3\xce\xfd\x09\xfccI\xdc\
+\x0f\xd7\xd7\xd7\x87\x0f\x0e\x0e\xce\x93\xacW\xab\xd5\xfd\x85\
+\x85\x85\xc6\xc0\x01\x8a\xc5\xe2\xd9T*5O2+\x22\
+W\x22]\x87\x00\xb6Dd9\x9dN\xafe\xb3\xd9\xb0\
+\xaf\x00$%\x08\x82\xc7\x00\x9e\x018\xdd%\xc6\x8eR\
+\xeaa>\x9f\xff\xd8\x17\x80 \x08FH\x96\x00\xdcK\
+\x10\xe7'\xc9\x07\x85B\xc1$\x05P\xd1\x06I\xe9\x90\
+\xbc\x06\xe0+\x80=\x00\xf6\xfc;\x22\xb2T*\x95\xee\
+\xfe\x11@\xb3\xecv\xf2]\x007]\xd7\x1d\xd3Z_\
+\xd2Z_$yFD\x1e\x01\xf8a}[6\xc6\x5c\
+N\x02p<\x05\xcd\x05\xf7\x05'\xe7\xfc\x95\xeb\xbaO\
+\xb3\xd9\xeca\xbb\xc1\xbe\xef\x8f+\xa5*\xd6\x02}\xa3\
+\xb5\xbe\x1d\x17\xe0\xb8\x02\xa9Tj\xdeJ\xbe\xdb)9\
+\x00\xcc\xcd\xcdU\x95R9\x00\xd1]p\xcb\xf7\xfdL\
+b\x00\x92Y\xab\xefI\xa7\xe4-y\x9e\xf7\x99d1\
+\xea\x0d\x0d\x0d\xddI\x04\xb0\xb8\xb8x\xca*c\xcdu\
+\xdd\xf7\xb1\x83(U\xb1\xac\xc9D\x00\xa3\xa3\xa3\xe7,\
+\xff[\x92\xc3%\x0c\xc3=\xcb\xba\x90\x08\x80d\xdd\xf2\
+Sq\x03\x00\x80Rj\xd8\xb2j\x89\x00\xaa\xd5\xea>\
+\x8e\x8e\xd7\x96\xc6\x8d1cq\x83\x90\xccXm\xbb\x22\
+\x9d\x01\x9a\x17\xcbV\xd4WJ\xdd\x8f\x99\x5cDD[\
+\xf6f\x22\x00\x00\x10\x91e+\xf0\x0b\xdf\xf7\xc7\xbb\x05\
+(\x95J9\x007\x22V\xddq\x9c\x8d\xc4\x00\xe9t\
+z\x0d\xc0N\xa4oL)U\x09\x82`\xa2\xdd@\x92\
+b\x8c\xc9\x8b\xc8k\xab\xebe.\x97\xfb\x1e\x17\xe0\xc4\
+eT.\x97\xaf5\x1a\x8dw\x00\x9c\x88\x1d\x92,*\
+\xa5*a\x18\xee)\xa5\x86If\x9ae\x8f\xfeyK\
+Zk\x1d\xf4\x04\x00\x00\xc6\x98\x82\x88,\xc5\x0d\xd0F\
+\x0d\x11\x99\xf1<o\xb5'\x00\x00h\xdeje\x00#\
+\x83\x86P\xedL\xad\xf5\x1a\xc9\x09\x00o\xbb\x8c\xaf\x03\
+x\x0e@\xe3\xe4\x15\xadH\xae\x04A0\xdd\x0d\xa0\xeb\
+\x9b\xd0\xf7\xfdL\xf3l\x9f\xc4\xd1\x09Wk\xee\xf3M\
+\xc7q6Z\x0b.\x08\x82i\x92+\xd6Ou\xadD\
+\xecGi\x1c\xf5\x02\xd1W\x80^ \xfa\x0e\x90\x14b\
+ \x00I \x06\x06\xd0\x09\x82\xe4\xf5B\xa1\xf0\x09\xf8\
+\xcd6\xec\x97<\xcf[\x15\x91\x19X[\x14\xc0T\xb4\
+1P\xb5\x81 \xc9\xedV\xff@\xa7 *c\xccU\
+\x00S$\xb7ggg?\xfc\xad\xbc\xff\xbf~\x01\x17\
+R.{\xc2\x89*\x1e\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x00\x9b\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00MIDATH\x89\xed\
+\xd0\xc9\x15\x00 \x08CAJ\xa7s\xbc\xab(K\xb8\
+%\x05\xfcy \xc2q\xed\x99\x99\xda\xdct\x12\xd1\xc9\
+K\xf4x\x15\x10\xb9\xc7A\xc8;\xdeDb\xf1\x22\x92\
+\x8b'\x91Z<\x88\xf4\xe2\x1f\x04\x13w\x10l|C\
+f\xe2\x1c\xe7n\x01\xa5\x18a\xc7IP6O\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00\xad\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00_IDAT8\x8d\xa5\
+\x93\xc1\x0d\xc00\x08\x03CGe\x91\xa4\x8b\xb0*\xfd\
+\xa71\xd8\xad\x9fHw\x02G\x19C\x88\xbb\xaf}v\
+)pf\xceO\x02\x04S\x82\x0an\x05\x1d\x5c\x0a\x18\
+\x18\x0aX\xf8(P`\xb8\x81\x92\x97 \x22\x96\x99\xdd\
+\xbf6P$\xf0\x04VRv\xc0H\xda\x12;\x09\xf5\
+\x0aj\xb10\xa7\xef\xfc\x00M{8\x8b;\xdd\x07\xbd\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01\x0c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x12\x00\x00\x00\x12\x08\x06\x00\x00\x00V\xce\x8eW\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\xbeIDAT8\x8d\xcd\
+\xd4\xb1\x09\xc2`\x14\x04\xe0\xbb\xa7\x04$n`\x13\x5c\
+!\x95\x0b\xa8\x95\xb5d\x828Q\x5c@Ik'N\
+`\x93\x15$\x95\x13D\x84\x809\x1bEH\x11\x7f\x92\
+\x14\xb9\xf2\x87\xff{\xc7+\x1e\x01\x00\x12\x83\xfdcI\
+U!E\x0f\x0e\x11U\x8a\x96\xe5\xb1\x7f\x01)B\xe2\
+<)\x8e\x02\xb6.@=\x04\xd2\xdbn\x1a1H\x8a\
+\x15\xa5s\x1b\xe4\xd7\x8ek\xa3\xaa\xb0\x0b\x02\x00T\x15\
+\x9a\xebN\x9a!z\xd6\x15\xf9fx\xd0\xb8\xfep\xd8\
+L\xb0\x98\x8d\x1a?]\xef/D\xa7gs#\xf2\xff\
+t\xc9\xa1Q}\x92k\x86\xb7\xec\xfe QeWD\
+Ti\xa2e\xdd!\xcb,\x8f\xfd\x0b\x81\xb4-B \
+\xfd\x18\xe8\xe5\xb0\xbd\x01\xda\x16K\x84\xbe3\x0aC\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x00\xaa\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x5cIDAT8\x8dc\
+`\x18\x05xARRRCRRR\x03>5\xcc\
+\xf84\xff\xff\xff\xbf\x9e\x81\x81\xc1\xc1\xc8\xc8\x88\xf1\xfc\
+\xf9\xf3\x07\x886\x00I3\x0c\xe04\x04\xc3\x00,\x9a\
+\xf1\x1a\x82b\x00\x1e\xcd8\x0d\x81\x1b@\x84f\xac\x86\
+0\x93\xa8\x19\xc3\x10F24\xc3\x01##c#9\
+\xfa\x86\x1b\x00\x00\x18J?\xea.\x16]\x05\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x00r\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x08\x00\x00\x00\x08\x08\x06\x00\x00\x00\xc4\x0f\xbe\x8b\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00$IDAT\x18\x95c\
+`\xa0*\xf8\xff\xff\x7f\xc3\xff\xff\xff\x1b\xf0I\xc2@\
+\x03>ITE8$\xb1\x9bD\x16\x00\x00\xf0\xf3K\
+\xb9\x8dP\xc3\x99\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x00\xae\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00`IDAT8\x8d\xed\
+\xcc\xc1\x0d\x80 \x14\x04\xd1\xf9\xa1#*\xb0\x96mD\
+l\x84Z\xec\x80\x92\xf0D\x82\x8a\x0a^u\x8f\x9b\xcc\
+\x83\x7f&)\xe4\x9c\xe7W\xb1\xd9\xe2RJ\xab\xf7\xde\
+\x80i4\x8e1\x06\x070\x8a\x94\x18\xc0\x95\xb3\x17\xa9\
+\xe3\x1d\xd0\x83\x1c\xe3\x13p\x87\xb4\xe2&\xd0B\xae\xe2\
+\xc7I\x0a\x92\xc6\xc3\x8fm\x03M\xaa2R\xe7t>\
+\x08\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01\xea\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x12\x00\x00\x00\x12\x08\x06\x00\x00\x00V\xce\x8eW\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x01\x9cIDAT8\x8d\xad\
+\xd4\xbdK[Q\x18\xc7\xf1\xefs\xe25\xe6F\xa4\xe0\
+K\xc1\xc1\xaa\x8b\xa2\x94\x22\xd9\x1c\x14\x04\xad\xba\x88\x83\
+\xa5/\x83\x88\x16\xed\x1fP\x1c\xba\x15\xfa\x07\xd4%\x0a\
+\xce&{D\xc5\xc5\xc9v\xd0\x88C\x0b\x82\x22\x0e\x96\
+R\xc4-5\x97k\xee}:D[\xaf\xde\x94\x98\xf6\
+7\x9e\x97\xcfy\x9e\xc3\xe1\x08\x00\xaa\xd2\xba\xf8sH\
+\xd4O\x88J5eDE]\x15\x93=\x99\x8bo\x22\
+\xa2\x82\xaa\xb4's+\x0a\xcf\xcb\x01nG }\xfc\
+\xa6\xf6\xa5\xb4&sOEu\xa3\x12\xe4Ou2l\
+D\xfd\xc4\xbf \x00\xa2~\xc2\x94{'\xbf7\x01\x1d\
+\xf5\x86\x88\xdc\x84\xa4\xda\xdc\x17y\xdf\x17e\xfd\x99\xcd\
+x\x87\x15\x98\xbb\x174\xf5\xc4\xe2U\xb7\x85\xeb\xc1\xc1\
+\xb9W\x194\xf0\xa8\x8aw\xbdQ\x00\xden9|9\
+\xf3KC-u\x86\x0f\xfdQ\xda\x1e\x04\xfd\xcez\xc3\
+\xc2`\x14\x01>\xee\xbad\x0e\x0bw\x0e\x0a\xec\x18l\
+\x8b\xf0\xa2\xcb\x225\x16\xa3\xfd\x0ak\x88\x09\xcb\xa31\
+lK\xc8\x1c\x15X\xd8qC+\x0e@+_/\xf9\
+t\xea\xd1d\x0b\xa9\xb1\x18]\x0d\x86\xa5\x91\x1a\x9ak\
+\x85\xfd\x1f\x1e\xf3[\x0eZ\xa2\xf5\x00\x94/\xc0\xeb\xf5\
+<\x9f\xbfy4\xda\xc2\xea\x84M\xcf\xc3\x08\xdfs\xca\
+\xec\x86\x83s\xb7\xa3p\xe8\x1a\x9bY+b\xd7\x99^\
+\xcbsvQ\xaa\x96b\xaa\xc2\x06\x8b\x959L>\xb6\
+\xd8>-pp\xee\x87-\x0bB*\xea\x16\x9fZ0\
+\x17\x97Jr/\xfcboGE]\xa3b\xb2e\xad\
+\xfe+d\xb2\xe6d.\xbe)\x90\xae\x14\x11H_\x19\
+\xfc\x97\x8f\xed\x17\x90\xf3\x96\xbeDoB\x08\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x00\xaa\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x5cIDAT8\x8d\x9d\
+\xd3\xb1\x11\xc00\x08CQ\xe3QY$\xf1\x22\xacJ\
+z\x02BX%w\xff\x9d\x1b\xaf\x15\xa6\xaao\xbc\xa1\
+\xedxp\xf7g\x82\xfc\x80)\x92\x02\x13\xa4\x04X\x04\
+\x02\x0c\xd2\x02\x1dB\x01\x08\xa1\x81j4 \x22\xc7\xcc\
+\xee^P\xc5\x14\x80\xe2\x16\xe8b\x080q\x09\xb0q\
+\xba\xe9w\xfe\x00lS8\x8bF\xb9W\xc8\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x00\x89\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00;IDAT8\x8dc\
+`\x18\x05x\xc1\xff\xff\xff\x1b\xfe\xff\xff\xdf@\x89f\
+\x18 \xcd\x104\xcd\xa4\x19\x82C3q\x86\x10\xd0\x8c\
+\xdf\x10\x225c7\x84D\xcd\xa8\x86\x90\xa9\x19\xbbK\
+F(\x00\x00\xc8\xf7\x17\x00A\xe6\x9c\xbe\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x00\x86\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x008IDAT8\x8dc\
+`\x18\x05\x0c\xff\xff\xffo\xf8O>h\xa0\xc4\x90\x06\
+J\x5c\xd2\x80\xe1\x15\x12\x0c\xc1\xae\x99HC\xf0k&\
+`\x08q\x9aq\x18B\x9af4C\xc8\xd3<\x82\x00\
+\x00\xc8M\x17\x00&\xcf\xcdr\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x00\x9f\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00QIDAT8\x8d\xa5\
+\xd2A\x0a\x00 \x08DQ\xe9\xe4\xdd|Z\x05bV\
+\x8e\xe32\xfa\x8f\x84\xcc\x88\x010\x99\xfbG\x0c\x00R\
+\xdc\x02|L\x031\xa6\x80,.\x03\xb7\xb8\x04\xbc\xe2\
+\x0c\x18\xe5\x9d\x98\x91V\xf8!\xf2K\xd8m\xb4\x8f\x94\
+!-\xc0#m`#\xf1l\x01\xd3\x1f\xf7\x92\x94\x84\
+\x9c2\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03>\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00$\x00\x00\x00$\x08\x06\x00\x00\x00\xe1\x00\x98\x98\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x02\xf0IDATX\x85\xcd\
+\xd8OH\x93a\x1c\xc0\xf1\xef\xfbnss,\x08J\
+\x94\x944\x90(32\xa8\x83A\xa8\x83\xa0\x04\xa1[\
+)#\x88R\xeb`\x1d\xbc\x14\x11b\xd1!\xea\xd4\xa5\
+\xa6u\x09\xabS\xa0\x87\xd0\x92bY\x1e\xa2C\x87f\
+\xf4O\x135T4\x1dc\xb9w\xbe\xee};\xec\x9f\
+\xaf\xba\xb9\x99\xaf\xaf\xbf\xdb\x1e\x9e\xf1|\xde\xe7\xf7\xfb\
+\xedy\xf7\xc0&\x0bA\xf3\xa9E\x15\x8br\x03\x0d\x02\
+4\x00\xa5\x80E\xa7ue\xc0\xabB\xdb\xf0\xa4\xa3\x8d\
+VAY\x06*\xb8?\x97oQ\xc3\x1d@\xa5N\x88\
+d\xe1\x91\x05\x93k\xec\xa2\xfd7\x80\x08@\x8b*Z\
+\xd4\xf0\x13\x030\x00\x95\x165\xdcA\x8b*\xc6AE\
+\xb9\x81\x06\xa0\xc2\x00L\x1cU\x94\x17\xa8\x8f\x83\xa25\
+ch\x08*\x8d\x10KY\xa4\x80\x8d\x8eRH\x80\xf4\
+\xea\xa6L\xc2\x02\x09\xd0\xa6\x09\xf3F,b3\xc3\xc9\
+\xdd\x91$t~\x97\x91\x16\x0c\x04\x99ExT\x9dM\
+y\xbe\x09\x80\xaa\x9d&\x1a{\xa4\xa4\xf3uM\x99\x00\
+\xdc8j\x8dc\x00\x9c\x85\xa9\xf7@W\xd0\xd9\x03\x16\
+N\x97h\xfb\xe5\xfdX\xd8\x18\x90\xb3\xd0\xcc\xb5#V\
+\xcd\xd8\xa8_\xa1\xf9M\xf2t\xe9\x06\xda\xb3M\xe4\xde\
+1\xab\xe6\xe4\x0e\xcc\xab\x9c\xef\x96\x98\x09\xaa\x1b\x0b\xca\
+\xb1\x0b<\xac\xce\xc6nIp\x14\x15\x9az%~\xcc\
+()\xbe\x19\x89\x94\x15&\x00\xfbr\x22\xe6\x81)\x85\
+\xd4\xcf\x16io\xf7q\x1b;\x1c\xda\xb7\x9a\x9b\xfd!\
+\xde\x8e\xa4\xae\x9d\xb4@W\xca\xad\xd4\x97E\x8a\xf2\xd9\
+\x17\x99\xeb}!\x94$*\x01\xb8]e\xa3,\xd7\xa4\
+\x19\xef\xf0\xca<\xfe,\xa7\x85\x81URvf\x7f\xa2\
+CjK,\xdc\xaa\xb0\x22\x0a+\xcf\xbdt(\x8b\x9a\
+b\xed\xf3\xbd\x1b\x0d\xd3\xda\x1fZug\xd3\x06\xfd\xf2\
+is~j\xef\xca\xa8\x9ab3\x97\x0fgi\xc6\x06\
+}\x0aM\xbd\x12\xe1\xd5\xcb&}P\xd3+\x89\xe9%\
+]\xb1\x14u0\xd7\xc4\x1d\xa7M3gVR9\xf7\
+B\xc2\x1f\xcado\xd2\x00\x0d\xfa\x14\xea\xba\x82IQ\
+\x05[D\xdc'ld-*\x9b\x05\x05.\xf4H\x8c\
+\xf83\xdc\x9at@\x00?g\x15j;WF\xf5\xb9\
+\xecl\xcf\xd6\xe6\xef\xaaG\xe2\xe3xz\x1d\xb5&\x10\
+Dv\xaa\xb63\xc8\xd4\x5c\xea\x14<\xf84\xcf\xf3o\
+)\x8e\xf2\xf5\x02\xc5Pu]\xc9Q/\x7f-p\xf7\
+\xc3\xfc\x7fa2\x02\xc5P\xb5+\xa0\x06\xa6\x15\x9a_\
+'\xff\x8d\xd2\x0d\x040\x14E\x8d\x07\x22\xab\x8f\xf8\x15\
+\xea\xbb\x83\xcc\xc9\xeb\xa0a\x8d/hC>\x05\xe7\xd3\
+\xbf\xec\xda*2\xe4S\x98_{\x0d\xaf\x0f\x08 \x14\
+\x86\xaf\x7f\xd6\xd6\xda\xa9\x22\x96\xb2\xf4\x0f\x1b\xfdB\x86\
+\x04\xc8k $\x16^\x88\x82Th3\xd6\x02\xaa\x80\
+\x1b\xa2\xa0\xe1IG\x1b\xe01\xd0\xe3\x19\x9ep\xb4\xc7\
+A\xb4\x0a\x8a,\x98\x5c\x06\xa1<\xb2`r\xc5\xee\x88\
+\x96_X\xe5\x05\xea\xa3\x7f\xfc\xf5\xbf\xb0\x12p\x0fO\
+8\xda\x17_Xm\xba\xf8\x072S\x09\xba\x7f)\xba\
+\xb4\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x18\
+\x08}\xe0\x07\
+\x00r\
+\x00i\x00g\x00h\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\
+\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x04\xac<\xa7\
+\x00d\
+\x00o\x00w\x00n\x00-\x00a\x00r\x00r\x00o\x00w\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0e\xc8:\xc7\
+\x00l\
+\x00e\x00f\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00.\x00p\x00n\x00g\
+\x00\x16\
+\x01u\xd9\x07\
+\x00c\
+\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00-\x00u\x00n\x00c\x00h\x00e\x00c\x00k\x00e\
+\x00d\x00.\x00p\x00n\x00g\
+\x00\x1d\
+\x0c\x0b\xd6\x07\
+\x00c\
+\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00-\x00i\x00n\x00d\x00e\x00t\x00e\x00r\x00m\
+\x00i\x00n\x00a\x00t\x00e\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x02\x89\xc5\x87\
+\x00r\
+\x00i\x00g\x00h\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00.\x00p\x00n\x00g\
+\x00\x14\
+\x0a\x00\x1bg\
+\x00d\
+\x00o\x00w\x00n\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\x00.\
+\x00p\x00n\x00g\
+\x00\x0c\
+\x06\xf0&g\
+\x00u\
+\x00p\x00-\x00a\x00r\x00r\x00o\x00w\x00.\x00p\x00n\x00g\
+\x00\x14\
+\x0d8\x17\x87\
+\x00l\
+\x00e\x00f\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\x00.\
+\x00p\x00n\x00g\
+\x00\x0e\
+\x04\xa2\xfc\xa7\
+\x00d\
+\x00o\x00w\x00n\x00_\x00a\x00r\x00r\x00o\x00w\x00.\x00p\x00n\x00g\
+\x00\x15\
+\x05\xb7\xe9'\
+\x00r\
+\x00i\x00g\x00h\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\
+\x00.\x00p\x00n\x00g\
+\x00\x19\
+\x0b\x7fx\x07\
+\x00c\
+\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00-\x00u\x00n\x00c\x00h\x00e\x00c\x00k\x00e\
+\x00d\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x08\x94`G\
+\x00s\
+\x00e\x00a\x00r\x00c\x00h\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x00\xeaE'\
+\x00s\
+\x00e\x00a\x00r\x00c\x00h\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x09%\xc3'\
+\x00d\
+\x00o\x00w\x00n\x00_\x00a\x00r\x00r\x00o\x00w\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\
+\x00\x11\
+\x05B\x8f\xe7\
+\x00l\
+\x00e\x00f\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\
+\x00\x1a\
+\x04\x07\xaeG\
+\x00c\
+\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00-\x00i\x00n\x00d\x00e\x00t\x00e\x00r\x00m\
+\x00i\x00n\x00a\x00t\x00e\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x04\x89\x8a\xe7\
+\x00u\
+\x00p\x00-\x00a\x00r\x00r\x00o\x00w\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x0dH.\xe7\
+\x00u\
+\x00p\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\x00.\x00p\x00n\
+\x00g\
+\x00\x11\
+\x05%\xc2g\
+\x00d\
+\x00o\x00w\x00n\x00-\x00a\x00r\x00r\x00o\x00w\x00@\x002\x00x\x00.\x00p\x00n\x00g\
+\
+\x00\x14\
+\x0d,\xd1\xc7\
+\x00c\
+\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00-\x00c\x00h\x00e\x00c\x00k\x00e\x00d\x00.\
+\x00p\x00n\x00g\
+\x00\x12\
+\x0a\xb7\x07\xc7\
+\x00r\
+\x00i\x00g\x00h\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00@\x002\x00x\x00.\x00p\x00n\
+\x00g\
+\x00\x15\
+\x04\x00\xfeg\
+\x00u\
+\x00p\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\x00@\x002\x00x\
+\x00.\x00p\x00n\x00g\
+\x00\x17\
+\x07Xig\
+\x00d\
+\x00o\x00w\x00n\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\x00@\
+\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x17\
+\x07\x96\xf0g\
+\x00l\
+\x00e\x00f\x00t\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00w\x00h\x00i\x00t\x00e\x00@\
+\x002\x00x\x00.\x00p\x00n\x00g\
+\x00\x17\
+\x0b\xf2\xf3'\
+\x00c\
+\x00h\x00e\x00c\x00k\x00b\x00o\x00x\x00-\x00c\x00h\x00e\x00c\x00k\x00e\x00d\x00@\
+\x002\x00x\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x1a\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x02>\x00\x00\x00\x00\x00\x01\x00\x00\x0br\
+\x00\x00\x01\xa1TL2O\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x01\xc2\
+\x00\x00\x01\xa1TL2N\
+\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x04\xc6\
+\x00\x00\x01\xa1TL2L\
+\x00\x00\x03\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x15L\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x00\x0f\xca\
+\x00\x00\x01\xa1TL2O\
+\x00\x00\x02\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x10\xda\
+\x00\x00\x01\xa1TL2L\
+\x00\x00\x01\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x06\xd7\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x00F\x00\x00\x00\x00\x00\x01\x00\x00\x00\xa3\
+\x00\x00\x01\xa1TL2L\
+\x00\x00\x036\x00\x00\x00\x00\x00\x01\x00\x00\x11\xfe\
+\x00\x00\x01\xa1TL2L\
+\x00\x00\x02\x86\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x19\
+\x00\x00\x01\xa1TL2L\
+\x00\x00\x01\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x07V\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x01N\x00\x00\x00\x00\x00\x01\x00\x00\x05\xca\
+\x00\x00\x01\xa1TL2L\
+\x00\x00\x03\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x15\xd9\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x04\x1a\x00\x00\x00\x00\x00\x01\x00\x00\x16c\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x02$\x00\x00\x00\x00\x00\x01\x00\x00\x09\xbf\
+\x00\x00\x01\xa1TL2O\
+\x00\x00\x02^\x00\x00\x00\x00\x00\x01\x00\x00\x0ez\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x01 \x00\x00\x00\x00\x00\x01\x00\x00\x05U\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x03\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x14\x9e\
+\x00\x00\x01\xa1TL2L\
+\x00\x00\x01\xec\x00\x00\x00\x00\x00\x01\x00\x00\x07\xd3\
+\x00\x00\x01\xa1TL2O\
+\x00\x00\x04N\x00\x00\x00\x00\x00\x01\x00\x00\x17\x06\
+\x00\x00\x01\xa1TL2N\
+\x00\x00\x00\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x03\x19\
+\x00\x00\x01\xa1TL2O\
+\x00\x00\x03^\x00\x00\x00\x00\x00\x01\x00\x00\x12\xb0\
+\x00\x00\x01\xa1TL2N\
+\x00\x00\x01l\x00\x00\x00\x00\x00\x01\x00\x00\x06X\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x03\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x11\x88\
+\x00\x00\x01\xa1TL2M\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x019\
+\x00\x00\x01\xa1TL2L\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Label Rendering Cache
+This module keeps the expensive parts of painting rich text labels in shared caches. QLabel lays out its rich
+text again after every resize, even one that keeps the width, lays out its own copy of text that other labels
+show too, and draws the laid-out text glyph by glyph on every repaint. CachedRichTextLabel takes a QTextDocument
+laid out once per (content, width, style) from a layout cache, draws it once into a pixmap kept in a pixmap
+cache per (content, size, device pixel ratio), and repaints by drawing that pixmap. Both caches are shared by
+every label and evict the least recently used entries.
+
+Run directly, it measures the repaint and resize cost of screens with hundreds of labels styled like the HTML
+examples of the label gallery, with and without the caches.
+
+Usage:
+    python label_cache.py
+    python label_cache.py --labels 500 --frames 50 --offscreen
+"""
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+from collections import OrderedDict
+
+from PySide6.QtCore import QEvent, QRectF, QSize
+# QtGui's Qt namespace also holds the rich text helpers, e.g. Qt.mightBeRichText
+from PySide6.QtGui import (
+    Qt,
+    QAbstractTextDocumentLayout,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QTextDocument,
+    QTextOption,
+)
+from PySide6.QtWidgets import QLabel, QStyle
+
+# Laid-out documents kept, each one is a few kilobytes
+LAYOUT_CACHE_ENTRIES = 256
+# Bytes of scaled pixmaps kept
+PIXMAP_CACHE_BYTES = 32 * 1024 * 1024
+# Text interaction that QLabel paints itself, e.g. a selection or a cursor
+_INTERACTIVE_TEXT = Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard | Qt.TextEditable
+
+
+class LruCache:
+    """Least recently used cache that evicts entries once their total cost exceeds a budget"""
+
+    def __init__(self, max_cost, cost=lambda value: 1):
+        self.max_cost = max_cost
+        self.cost = cost
+        self.total_cost = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, create):
+        """Return the value cached under key, or create(), cache and return it"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = create()
+        cost = self.cost(value)
+        self._entries[key] = (value, cost)
+        self.total_cost += cost
+        # The newest entry is kept even if it alone is over the budget
+        while self.total_cost > self.max_cost and len(self._entries) > 1:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self.total_cost -= evicted_cost
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.total_cost = 0
+        self.hits = 0
+        self.misses = 0
+
+
+def _pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+layout_cache = LruCache(LAYOUT_CACHE_ENTRIES)
+pixmap_cache = LruCache(PIXMAP_CACHE_BYTES, _pixmap_bytes)
+
+
+def _laid_out_document(text, width, font, alignment, word_wrap):
+    """Return a document with text laid out the way QLabel lays out its rich text"""
+    document = QTextDocument()
+    document.setUndoRedoEnabled(False)
+    document.setDefaultFont(font)
+    document.setHtml(text)
+    option = document.defaultTextOption()
+    option.setAlignment(alignment)
+    option.setWrapMode(QTextOption.WordWrap if word_wrap else QTextOption.ManualWrap)
+    document.setDefaultTextOption(option)
+    frame_format = document.rootFrame().frameFormat()
+    frame_format.setMargin(0)
+    document.rootFrame().setFrameFormat(frame_format)
+    document.setTextWidth(width)
+    # Lay out now, painting only reads the layout
+    document.size()
+    return document
+
+
+def _rendered_text(document, width, height, palette, ratio):
+    """Return a transparent pixmap of width x height with the document drawn in the colors of palette"""
+    pixmap = QPixmap(QSize(width, height) * ratio)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    context = QAbstractTextDocumentLayout.PaintContext()
+    context.palette = palette
+    painter.setClipRect(0, 0, width, height)
+    document.documentLayout().draw(painter, context)
+    painter.end()
+    return pixmap
+
+
+class CachedRichTextLabel(QLabel):
+    """QLabel that paints rich text from a document shared through the layout cache
+
+    The laid-out text is drawn once into a pixmap in the pixmap cache, so a repaint only draws the frame and
+    the pixmap. Plain text and selectable text are painted by QLabel itself.
+    """
+
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        # (signature, position, pixmap) of the last paint, see _paint_signature
+        self._painted = None
+
+    def _paint_signature(self):
+        """Return what the painted text depends on besides the events that clear _painted"""
+        return (self.text(), self.textFormat(), self.alignment(), self.wordWrap(), self.margin(), self.indent(),
+                self.textInteractionFlags(), self.devicePixelRatioF())
+
+    def _is_cached(self):
+        if self.textInteractionFlags() & _INTERACTIVE_TEXT:
+            return False
+        text_format = self.textFormat()
+        return text_format == Qt.RichText or (text_format == Qt.AutoText and Qt.mightBeRichText(self.text()))
+
+    def _document_rect(self):
+        """Return the rect QLabel lays its text out in: the contents rect less the margin and indent"""
+        rect = self.contentsRect()
+        margin = self.margin()
+        rect.adjust(margin, margin, -margin, -margin)
+        indent = self.indent()
+        if indent < 0 and self.frameWidth():
+            indent = self.fontMetrics().horizontalAdvance("x") // 2 - margin
+        if indent > 0:
+            alignment = QStyle.visualAlignment(self.layoutDirection(), self.alignment())
+            if alignment & Qt.AlignLeft:
+                rect.setLeft(rect.left() + indent)
+            if alignment & Qt.AlignRight:
+                rect.setRight(rect.right() - indent)
+            if alignment & Qt.AlignTop:
+                rect.setTop(rect.top() + indent)
+            if alignment & Qt.AlignBottom:
+                rect.setBottom(rect.bottom() - indent)
+        return rect
+
+    def _render(self):
+        """Return the position and the cached pixmap of the text, placed the way QLabel places it"""
+        rect = self._document_rect()
+        text, font, alignment, word_wrap = self.text(), self.font(), self.alignment(), self.wordWrap()
+        layout_key = (text, rect.width(), font.key(), int(alignment), word_wrap)
+        document = layout_cache.get(
+            layout_key, lambda: _laid_out_document(text, rect.width(), font, alignment, word_wrap)
+        )
+
+        # Vertical alignment is applied to the whole document, as QLabel does
+        offset = 0.0
+        if alignment & Qt.AlignVCenter:
+            offset = max((rect.height() - document.size().height()) / 2, 0.0)
+        elif alignment & Qt.AlignBottom:
+            offset = max(rect.height() - document.size().height(), 0.0)
+        layout_rect = QRectF(rect.x(), rect.y() + offset, rect.width(), rect.height()).toAlignedRect()
+        # Text overflowing the label is clipped at the bottom of the layout rect
+        height = min(layout_rect.height(), math.ceil(document.size().height()))
+        if layout_rect.width() <= 0 or height <= 0:
+            return layout_rect.topLeft(), None
+
+        # Text is drawn in the label's foreground color, e.g. the color of its stylesheet
+        palette = QPalette(self.palette())
+        if self.foregroundRole() != QPalette.Text and self.isEnabled():
+            palette.setColor(QPalette.Text, palette.color(self.foregroundRole()))
+        ratio = self.devicePixelRatioF()
+        key = (*layout_key, height, palette.color(QPalette.Text).rgba(), palette.color(QPalette.Link).rgba(), ratio)
+        pixmap = pixmap_cache.get(key, lambda: _rendered_text(document, rect.width(), height, palette, ratio))
+        return layout_rect.topLeft(), pixmap
+
+    def resizeEvent(self, event):
+        self._painted = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        # Font, palette, stylesheet and contents margin changes all arrive here
+        self._painted = None
+        super().changeEvent(event)
+
+    def paintEvent(self, event):
+        signature = self._paint_signature()
+        if self._painted is None or self._painted[0] != signature:
+            self._painted = (signature, *self._render()) if self._is_cached() else (signature, None, None)
+        _, position, pixmap = self._painted
+        if position is None:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        self.drawFrame(painter)
+        if pixmap is not None:
+            painter.drawPixmap(position, pixmap)
+
+
+def gallery_label_specs():
+    """Return (text, stylesheet) of the rich text labels of the label gallery's HTML example"""
+    from label_styles import LabelStylesWindow
+
+    window = LabelStylesWindow()
+    specs = [(label.text(), label.styleSheet()) for label in window.findChildren(QLabel)
+             if Qt.mightBeRichText(label.text())]
+    window.close()
+    return specs
+
+
+def _frame_times(app, host, frames, widths):
+    """Repaint host once per frame, resizing it to the next of widths first if there are several"""
+    timings = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        if len(widths) > 1:
+            host.resize(widths[frame % len(widths)], host.height())
+            app.sendPostedEvents(None, QEvent.LayoutRequest)
+        host.repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def benchmark(label_count, frames):
+    """Print the repaint and resize cost of a screen of label_count gallery rich text labels with and without caching"""
+    from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+
+    app = QApplication.instance()
+    specs = gallery_label_specs()
+    columns = 5
+
+    print(f"{label_count} labels, {frames} frames; median / max ms per frame")
+    for cached in (False, True):
+        layout_cache.clear()
+        pixmap_cache.clear()
+        host = QWidget()
+        grid = QGridLayout(host)
+        for number in range(label_count):
+            text, stylesheet = specs[number % len(specs)]
+            label = CachedRichTextLabel(text) if cached else QLabel(text)
+            label.setStyleSheet(stylesheet)
+            grid.addWidget(label, number // columns, number % columns)
+        # Every label on screen, the window being as large as the labels need
+        host.resize(grid.sizeHint())
+        host.show()
+        app.processEvents()
+
+        width = host.width()
+        repaint = _frame_times(app, host, frames, [width])
+        # A window dragged back and forth between a few widths
+        resize = _frame_times(app, host, frames, [width, width + 100, width + 200, width + 100])
+        line = (f"    {'cached' if cached else 'QLabel':6} repaint {statistics.median(repaint):7.2f} / "
+                f"{max(repaint):7.2f}, resize {statistics.median(resize):7.2f} / {max(resize):7.2f}")
+        if cached:
+            line += (f"; {len(layout_cache)} documents, {len(pixmap_cache)} pixmaps "
+                     f"({pixmap_cache.total_cost / 1024:.0f} KB), {pixmap_cache.hits} pixmap hits, "
+                     f"{pixmap_cache.misses} misses")
+        print(line)
+        host.close()
+        host.deleteLater()
+        app.processEvents()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark label repaints with and without the rendering caches")
+    parser.add_argument("--labels", type=int, default=300, help="labels per screen")
+    parser.add_argument("--frames", type=int, default=40, help="frames timed per measurement")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    benchmark(args.labels, args.frames)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
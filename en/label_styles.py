@@ -18,6 +18,10 @@ from PySide6.QtWidgets import (
     QGridLayout
 )
 from PySide6.QtGui import QFont, QColor
+from locale_switcher import install_language_menu
+from style_classes import SECTION_HEADER, install_class_styles, set_style_class
+from qss_compiler import compiled_stylesheet
+from label_cache import CachedRichTextLabel
 
 class LabelStylesWindow(QMainWindow):
     """QLabel stylesheet example window"""
@@ -30,6 +34,8 @@ class LabelStylesWindow(QMainWindow):
         # Create central widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
+        # Section labels are styled by their class, from one stylesheet here
+        install_class_styles(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
         # Add title
@@ -50,11 +56,14 @@ class LabelStylesWindow(QMainWindow):
         self.create_gradient_style_example()
         self.create_html_style_example()
         self.create_image_style_example()
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
     
     def create_basic_style_example(self):
         """Basic style sheet example"""
         section_label = QLabel("Basic Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -78,7 +87,7 @@ class LabelStylesWindow(QMainWindow):
     def create_font_style_example(self):
         """Font style sheet example"""
         section_label = QLabel("Font Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QGridLayout()
@@ -126,7 +135,7 @@ class LabelStylesWindow(QMainWindow):
     def create_background_style_example(self):
         """Background style sheet example"""
         section_label = QLabel("Background Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -157,7 +166,7 @@ class LabelStylesWindow(QMainWindow):
     def create_border_style_example(self):
         """Border style sheet example"""
         section_label = QLabel("Border Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -202,21 +211,21 @@ class LabelStylesWindow(QMainWindow):
     def create_shadow_style_example(self):
         """Shadow effect style sheet example"""
         section_label = QLabel("Shadow Effects")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
         
         # Text shadow label
         text_shadow_label = QLabel("Text Shadow")
-        text_shadow_label.setStyleSheet("""
+        text_shadow_label.setStyleSheet(compiled_stylesheet("""
             color: white;
             background-color: #3F51B5;
             padding: 10px;
             text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.5);  /* Horizontal offset, vertical offset, blur radius, color */
             font-size: 16px;
             font-weight: bold;
-        """)
+        """))
         layout.addWidget(text_shadow_label)
         
         # Box shadow label
@@ -238,7 +247,7 @@ class LabelStylesWindow(QMainWindow):
     def create_gradient_style_example(self):
         """Gradient background style sheet example"""
         section_label = QLabel("Gradient Backgrounds")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -297,13 +306,13 @@ class LabelStylesWindow(QMainWindow):
     def create_html_style_example(self):
         """HTML style sheet example"""
         section_label = QLabel("HTML Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QVBoxLayout()
         
-        # Text with HTML tags
-        html_label = QLabel()
+        # Text with HTML tags, laid out once and repainted from the shared label cache
+        html_label = CachedRichTextLabel()
         html_label.setText("""
             <html>
             <head></head>
@@ -318,7 +327,7 @@ class LabelStylesWindow(QMainWindow):
         layout.addWidget(html_label)
         
         # Combining stylesheets with HTML
-        mixed_label = QLabel()
+        mixed_label = CachedRichTextLabel()
         mixed_label.setText("<html><body><p>Stylesheet + HTML</p></body></html>")
         mixed_label.setStyleSheet("""
             background-color: #00BCD4;
@@ -333,7 +342,7 @@ class LabelStylesWindow(QMainWindow):
     def create_image_style_example(self):
         """Image style sheet example"""
         section_label = QLabel("Image Backgrounds")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
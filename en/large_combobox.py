@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Large-List ComboBox
+This module is a combobox mode for option lists with hundreds of thousands of entries. The popup shows a
+lazily fetched model, so opening it only measures and lays out the rows fetched so far, and its view uses
+uniform item sizes. Typing filters through an index built once over all entries: prefix queries are a binary
+search over the sorted entries, and substring queries run str.find over one packed lowercase string, so
+only the first page of matches is ever produced before it is shown.
+
+Usage:
+    python large_combobox.py                          # benchmark popup latency under the gallery's styles
+    python large_combobox.py --sizes 50000 500000 --repeat 10
+"""
+
+import argparse
+import bisect
+import os
+import statistics
+import sys
+import time
+from itertools import islice
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, Signal
+from PySide6.QtWidgets import QComboBox, QCompleter, QLineEdit
+
+# Rows fetched per batch, i.e. per popup scroll to the end of the fetched rows
+FETCH_BATCH_SIZE = 500
+MATCH_PREFIX = "prefix"
+MATCH_CONTAINS = "contains"
+
+
+class OptionIndex:
+    """Prebuilt prefix and substring index over a list of option texts"""
+
+    def __init__(self, entries):
+        self.size = len(entries)
+        lowered = [entry.lower() for entry in entries]
+
+        # Prefix search: lowercase keys in sorted order, with the row each one came from
+        order = sorted(range(self.size), key=lowered.__getitem__)
+        self.sorted_keys = [lowered[row] for row in order]
+        self.sorted_rows = order
+
+        # Substring search: every entry in one string, one per line, and where each line starts
+        self.packed = "\n".join(lowered)
+        self.line_starts = []
+        position = 0
+        for text in lowered:
+            self.line_starts.append(position)
+            position += len(text) + 1
+
+    def matches(self, query, mode=MATCH_CONTAINS):
+        """Yield the rows matching a query, lazily, so that only the rows shown are ever searched for"""
+        query = query.lower()
+        if not query:
+            return iter(range(self.size))
+        if mode == MATCH_PREFIX:
+            return self._prefix_matches(query)
+        return self._substring_matches(query)
+
+    def _prefix_matches(self, query):
+        position = bisect.bisect_left(self.sorted_keys, query)
+        while position < self.size and self.sorted_keys[position].startswith(query):
+            yield self.sorted_rows[position]
+            position += 1
+
+    def _substring_matches(self, query):
+        if "\n" in query:
+            return
+        position = self.packed.find(query)
+        while position != -1:
+            row = bisect.bisect_right(self.line_starts, position) - 1
+            yield row
+            # Continue at the next entry, an entry is reported once however often it matches
+            if row + 1 >= self.size:
+                return
+            position = self.packed.find(query, self.line_starts[row + 1])
+
+
+class LazyListModel(QAbstractListModel):
+    """List model over a subset of entries that fetches its rows in batches as the view scrolls"""
+
+    def __init__(self, entries, batch_size=FETCH_BATCH_SIZE, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.batch_size = batch_size
+        self._rows = []
+        self._source = iter(())
+        self._exhausted = True
+        self.set_rows(range(len(entries)))
+
+    def set_rows(self, rows):
+        """Show the entries of an iterable of rows, fetching only the first batch now"""
+        self.beginResetModel()
+        self._rows = []
+        self._source = iter(rows)
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def source_row(self, row):
+        """Return the entry row shown at a model row"""
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self.entries[self._rows[index.row()]]
+        return None
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent):
+        if parent.isValid() or self._exhausted:
+            return
+        batch = list(islice(self._source, self.batch_size))
+        if len(batch) < self.batch_size:
+            self._exhausted = True
+        if batch:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(batch) - 1)
+            self._rows.extend(batch)
+            self.endInsertRows()
+
+
+class LargeComboBox(QComboBox):
+    """Combobox for huge option lists, with indexed filter-as-you-type when editable"""
+
+    # Emitted with the entry row when the user picks a different option
+    option_selected = Signal(int)
+
+    def __init__(self, entries, editable=False, match_mode=MATCH_CONTAINS, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.match_mode = match_mode
+        self.selected_row = None
+
+        self.option_model = LazyListModel(entries, parent=self)
+        self.setModel(self.option_model)
+        # Never size the combobox by measuring every option
+        self.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.setMinimumContentsLength(20)
+        self.view().setUniformItemSizes(True)
+        self.activated.connect(lambda row: self._select(self.option_model.source_row(row)))
+
+        self.index = None
+        self.filter_model = None
+        if editable:
+            self._setup_filtering()
+
+    def _setup_filtering(self):
+        self.index = OptionIndex(self.entries)
+        self.filter_model = LazyListModel(self.entries, parent=self)
+        self.filter_model.set_rows(range(0))
+
+        # The completer shows the index results as they are; filtering the combobox's own model instead
+        # would reset the text being typed
+        completer = QCompleter(self.filter_model, self)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.popup().setUniformItemSizes(True)
+        completer.activated[QModelIndex].connect(
+            lambda index: self._select(self.filter_model.source_row(index.row()))
+        )
+
+        # A line edit that already has a completer keeps it, setEditable() would create a default one over
+        # the option model, and QCompleter fetches until its model is exhausted
+        line_edit = QLineEdit(self)
+        line_edit.setCompleter(completer)
+        self.setLineEdit(line_edit)
+        self.setInsertPolicy(QComboBox.NoInsert)
+        line_edit.textEdited.connect(self.filter_options)
+
+    def filter_options(self, text):
+        """Show the options matching the typed text in the completer popup"""
+        # QCompleter fetches again after every row insert until its model is exhausted, which would produce every
+        # match, so the completer is given the first batch of matches only
+        matches = self.index.matches(text, self.match_mode)
+        self.filter_model.set_rows(islice(matches, self.filter_model.batch_size))
+        if text:
+            self.completer().complete()
+
+    def _select(self, row):
+        # Both the completer and the combobox itself report a pick from the completer popup
+        if row == self.selected_row:
+            return
+        self.selected_row = row
+        self.option_selected.emit(row)
+
+
+def sample_entries(count):
+    """Return count option texts that read like the names of production options"""
+    words = [
+        "Amber", "Basalt", "Cedar", "Delta", "Ember", "Fjord", "Granite", "Harbor", "Indigo", "Juniper",
+        "Kelp", "Lumen", "Meadow", "Nimbus", "Orchid", "Pebble", "Quartz", "Raven", "Summit", "Tundra",
+        "Umber", "Violet", "Willow", "Xenon", "Yarrow", "Zephyr",
+    ]
+    return [f"{words[i % 26]} {words[i // 26 % 26]} {i:06d}" for i in range(count)]
+
+
+def window_combobox_styles():
+    """Return (name, stylesheet) for every styled combobox of the gallery window"""
+    from PySide6.QtWidgets import QLabel
+    from combobox_styles import ComboBoxStylesWindow
+
+    window = ComboBoxStylesWindow()
+    styles = [("No stylesheet", "")]
+    section = ""
+    for position in range(window.main_layout.count()):
+        item = window.main_layout.itemAt(position)
+        if isinstance(item.widget(), QLabel):
+            section = item.widget().text()
+        elif item.layout() is not None:
+            for number in range(item.layout().count()):
+                combobox = item.layout().itemAt(number).widget()
+                if isinstance(combobox, QComboBox) and not isinstance(combobox, LargeComboBox):
+                    if combobox.styleSheet():
+                        styles.append((f"{section} #{number + 1}", combobox.styleSheet()))
+    window.close()
+    return styles
+
+
+def popup_latency(combobox, repeat):
+    """Return the cold and the median warm popup-open latency of a combobox, in milliseconds"""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    timings = []
+    for _ in range(repeat + 1):
+        start = time.perf_counter()
+        combobox.showPopup()
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+        combobox.hidePopup()
+        app.processEvents()
+    return timings[0], statistics.median(timings[1:])
+
+
+def benchmark(sizes, repeat, baseline):
+    """Print popup-open and keystroke latencies of large comboboxes under every gallery style"""
+    from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
+
+    app = QApplication.instance()
+    styles = window_combobox_styles()
+    for size in sizes:
+        entries = sample_entries(size)
+        start = time.perf_counter()
+        index = OptionIndex(entries)
+        print(f"{size} options: index built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # Filter-as-you-type: time until the first page of matches is ready, per keystroke
+        for query in ("z", "ze", "zep", "phyr ra", "000042", "no match"):
+            model = LazyListModel(entries)
+            for mode in (MATCH_PREFIX, MATCH_CONTAINS):
+                start = time.perf_counter()
+                model.set_rows(index.matches(query, mode))
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"    type {query!r:12} {mode:8} {elapsed:7.2f} ms, {model.rowCount()} rows")
+
+        host = QWidget()
+        layout = QVBoxLayout(host)
+        host.show()
+        for name, stylesheet in styles:
+            combobox = LargeComboBox(entries)
+            combobox.setStyleSheet(stylesheet)
+            layout.addWidget(combobox)
+            app.processEvents()
+            cold, warm = popup_latency(combobox, repeat)
+            line = f"    popup {name:32} cold {cold:7.2f} ms, warm {warm:7.2f} ms"
+            if baseline:
+                plain = QComboBox()
+                plain.addItems(entries)
+                plain.setStyleSheet(stylesheet)
+                layout.addWidget(plain)
+                app.processEvents()
+                plain_cold, plain_warm = popup_latency(plain, repeat)
+                line += f" (QComboBox.addItems: cold {plain_cold:.2f} ms, warm {plain_warm:.2f} ms)"
+                plain.deleteLater()
+            print(line)
+            combobox.deleteLater()
+        host.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the large-list combobox under the gallery's styles")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50_000, 500_000], help="option counts")
+    parser.add_argument("--repeat", type=int, default=5, help="popup openings per style after the first one")
+    parser.add_argument("--baseline", action="store_true", help="also time a plain QComboBox filled with addItems")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtCore import qInstallMessageHandler
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    if args.offscreen:
+        # The offscreen platform warns about every popup it cannot raise or grab for
+        qInstallMessageHandler(lambda *args: None)
+    benchmark(args.sizes, args.repeat, args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
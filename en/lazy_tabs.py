@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lazy Tab Pages
+This module is a tab widget whose pages are built the first time they are activated. Each tab holds a light
+placeholder page until then, and pages that have not been current for a while can be unloaded back to their
+placeholder, to be rebuilt when the user returns to them.
+
+Run directly, it compares eager, lazy and unloading tab widgets with many tabs under every tab style of the
+tab widget gallery, measuring construction time, memory and tab switch latency.
+
+Usage:
+    python lazy_tabs.py
+    python lazy_tabs.py --tabs 200 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtWidgets import QTabWidget, QVBoxLayout, QWidget
+
+# How often pages are checked for inactivity, at most, in milliseconds
+UNLOAD_CHECK_INTERVAL_MS = 5000
+BENCHMARK_MODES = ("eager", "lazy", "unload")
+
+
+class LazyTabPage(QWidget):
+    """Placeholder tab page that holds the content of its builder while the content is loaded"""
+
+    def __init__(self, builder, parent=None):
+        super().__init__(parent)
+        self.builder = builder
+        self.content = None
+        # When the page last stopped being the current page
+        self.last_active = time.monotonic()
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    def is_loaded(self):
+        return self.content is not None
+
+    def load(self):
+        """Build the content unless it is loaded, and return whether it was built"""
+        if self.content is not None:
+            return False
+        self.content = self.builder()
+        self._layout.addWidget(self.content)
+        return True
+
+    def unload(self):
+        """Delete the content, leaving the empty placeholder"""
+        if self.content is not None:
+            self._layout.removeWidget(self.content)
+            self.content.deleteLater()
+            self.content = None
+
+
+class LazyTabWidget(QTabWidget):
+    """Tab widget that builds pages on first activation and can unload pages that stay inactive"""
+
+    # Emitted with the tab index after a page was built, e.g. to translate its text
+    page_built = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.unload_after_ms = None
+        self._current_page = None
+        self._unload_timer = QTimer(self)
+        self._unload_timer.timeout.connect(lambda: self.unload_inactive(self.unload_after_ms))
+        self.currentChanged.connect(self._on_current_changed)
+
+    def add_lazy_tab(self, builder, title):
+        """Add a tab whose page is builder(), called the first time the tab is activated"""
+        return self.addTab(LazyTabPage(builder), title)
+
+    def _on_current_changed(self, index):
+        if self._current_page is not None:
+            self._current_page.last_active = time.monotonic()
+        self._current_page = self.widget(index)
+        if isinstance(self._current_page, LazyTabPage) and self._current_page.load():
+            self.page_built.emit(index)
+
+    def lazy_pages(self):
+        return [page for page in map(self.widget, range(self.count())) if isinstance(page, LazyTabPage)]
+
+    def loaded_count(self):
+        return sum(page.is_loaded() for page in self.lazy_pages())
+
+    def build_all(self):
+        """Build every page now, as an eagerly built tab widget would"""
+        for index in range(self.count()):
+            page = self.widget(index)
+            if isinstance(page, LazyTabPage) and page.load():
+                self.page_built.emit(index)
+
+    def set_unload_after(self, milliseconds):
+        """Unload pages that have not been current for the given time, or never if it is None"""
+        self.unload_after_ms = milliseconds
+        if milliseconds is None:
+            self._unload_timer.stop()
+        else:
+            self._unload_timer.start(max(1, min(milliseconds, UNLOAD_CHECK_INTERVAL_MS)))
+
+    def unload_inactive(self, max_idle_ms):
+        """Unload the pages other than the current one that were inactive for max_idle_ms, return how many"""
+        deadline = time.monotonic() - max_idle_ms / 1000
+        unloaded = 0
+        for page in self.lazy_pages():
+            if page is not self.currentWidget() and page.is_loaded() and page.last_active <= deadline:
+                page.unload()
+                unloaded += 1
+        return unloaded
+
+
+def benchmark_style(style_index, mode, tab_count):
+    """Measure one tab style of the gallery with tab_count tabs built eagerly, lazily or lazily with unloading"""
+    from PySide6.QtCore import QEvent, QObject
+    from PySide6.QtWidgets import QApplication
+    from soak_test import rss_bytes
+    from tabwidget_styles import TabWidgetStylesWindow
+
+    app = QApplication.instance()
+
+    def settle():
+        app.processEvents()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    window = TabWidgetStylesWindow()
+    window.style_combobox.setCurrentIndex(style_index)
+    window.show()
+    settle()
+    style_name = window.style_combobox.currentText()
+    tab_widget = window.tab_widget
+
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+    for number in range(tab_widget.count(), tab_count):
+        window.create_tab(f"Tab {number + 1}", f"This is the content of tab {number + 1}.")
+    if mode == "eager":
+        tab_widget.build_all()
+    settle()
+    construct_ms = (time.perf_counter() - start) * 1000
+
+    def visit_all():
+        timings = []
+        for index in range(tab_widget.count()):
+            start = time.perf_counter()
+            tab_widget.setCurrentIndex(index)
+            app.processEvents()
+            timings.append((time.perf_counter() - start) * 1000)
+            if mode == "unload":
+                tab_widget.unload_inactive(0)
+                settle()
+        return timings
+
+    first_visit = visit_all()
+    revisit = visit_all()
+    settle()
+    report = {
+        "style": style_name,
+        "mode": mode,
+        "construct_ms": construct_ms,
+        "rss_mb": (rss_bytes() - rss_before) / (1024 * 1024),
+        "qobjects": len(window.findChildren(QObject)),
+        "loaded": tab_widget.loaded_count(),
+        "first_visit_ms": (statistics.median(first_visit), max(first_visit)),
+        "revisit_ms": (statistics.median(revisit), max(revisit)),
+    }
+    window.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark eager, lazy and unloading tab pages under every tab style")
+    parser.add_argument("--tabs", type=int, default=120, help="tabs per tab widget")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    args = parser.parse_args()
+
+    from soak_test import _init_soak_worker
+
+    _init_soak_worker()
+    from tabwidget_styles import TabWidgetStylesWindow
+
+    style_count = TabWidgetStylesWindow().style_combobox.count()
+
+    # One process per measurement so that RSS growth is attributed to the right mode
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=context, initializer=_init_soak_worker,
+                             max_tasks_per_child=1) as pool:
+        futures = [pool.submit(benchmark_style, style_index, mode, args.tabs)
+                   for style_index in range(style_count) for mode in BENCHMARK_MODES]
+        print(f"{args.tabs} tabs per style; switch latency as median / max")
+        for future in futures:
+            report = future.result()
+            print(f"{report['style']:20} {report['mode']:6} built in {report['construct_ms']:7.1f} ms, "
+                  f"RSS {report['rss_mb']:+6.1f} MB, {report['qobjects']:5d} QObjects, "
+                  f"{report['loaded']:3d} pages loaded, first visit "
+                  f"{report['first_visit_ms'][0]:5.2f} / {report['first_visit_ms'][1]:6.2f} ms, revisit "
+                  f"{report['revisit_ms'][0]:5.2f} / {report['revisit_ms'][1]:6.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
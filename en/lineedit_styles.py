@@ -7,7 +7,7 @@ This file demonstrates various stylesheet usages for the QLineEdit widget in Qt,
 """
 
 import sys
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QEvent
 from PySide6.QtWidgets import (
     QApplication, 
     QMainWindow, 
@@ -18,18 +18,37 @@ from PySide6.QtWidgets import (
     QLabel
 )
 from PySide6.QtGui import QFont, QColor
+from locale_switcher import install_language_menu
+from style_classes import SECTION_HEADER, install_class_styles, set_style_class
+from qss_compiler import compiled_stylesheet
+from icon_resources import load_icon_resources
+from large_combobox import sample_entries
+from search_completion import (
+    CompactPrefixIndex,
+    DebouncedValidator,
+    IndexedCompleter,
+    corpus_validator,
+    run_in_pool
+)
+
+# Entries of the corpus the search field completes from
+SEARCH_CORPUS_SIZE = 1000000
 
 class LineEditStylesWindow(QMainWindow):
     """QLineEdit stylesheet example window"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Register the :/icons/ images the stylesheets refer to before anything is polished
+        load_icon_resources()
         self.setWindowTitle("QLineEdit Style Sheet Example")
         self.resize(800, 600)
         
         # Create central widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
+        # Section labels are styled by their class, from one stylesheet here
+        install_class_styles(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
         # Add title
@@ -50,11 +69,15 @@ class LineEditStylesWindow(QMainWindow):
         self.create_custom_cursor_style_example()
         self.create_icon_style_example()
         self.create_readonly_style_example()
+        self.create_completion_style_example()
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
     
     def create_basic_style_example(self):
         """Basic style sheet example"""
         section_label = QLabel("Basic Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -83,7 +106,7 @@ class LineEditStylesWindow(QMainWindow):
     def create_state_style_example(self):
         """State style sheet example (normal, hover, focus)"""
         section_label = QLabel("State Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -91,7 +114,7 @@ class LineEditStylesWindow(QMainWindow):
         # Hover and focus state styles
         state_lineedit = QLineEdit()
         state_lineedit.setPlaceholderText("Hover and Focus Effects")
-        state_lineedit.setStyleSheet("""
+        state_lineedit.setStyleSheet(compiled_stylesheet("""
             QLineEdit {
                 background-color: #FFFFFF;
                 color: #333333;
@@ -108,7 +131,7 @@ class LineEditStylesWindow(QMainWindow):
                 background-color: #F5F5F5;
                 outline: none;  /* Remove default focus outline */
             }
-        """)
+        """))
         layout.addWidget(state_lineedit)
         
         # Different color theme line edit
@@ -134,7 +157,7 @@ class LineEditStylesWindow(QMainWindow):
     def create_placeholder_style_example(self):
         """Placeholder text style sheet example"""
         section_label = QLabel("Placeholder Text Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -142,7 +165,7 @@ class LineEditStylesWindow(QMainWindow):
         # Custom placeholder text style
         placeholder_lineedit = QLineEdit()
         placeholder_lineedit.setPlaceholderText("Custom Placeholder Style")
-        placeholder_lineedit.setStyleSheet("""
+        placeholder_lineedit.setStyleSheet(compiled_stylesheet("""
             QLineEdit {
                 background-color: #FFFFFF;
                 color: #333333;
@@ -154,13 +177,13 @@ class LineEditStylesWindow(QMainWindow):
                 color: #999999;
                 font-style: italic;
             }
-        """)
+        """))
         layout.addWidget(placeholder_lineedit)
         
         # Colored placeholder
         color_placeholder_lineedit = QLineEdit()
         color_placeholder_lineedit.setPlaceholderText("Colored Placeholder")
-        color_placeholder_lineedit.setStyleSheet("""
+        color_placeholder_lineedit.setStyleSheet(compiled_stylesheet("""
             QLineEdit {
                 background-color: #FFFFFF;
                 border: 2px solid #CCCCCC;
@@ -171,7 +194,7 @@ class LineEditStylesWindow(QMainWindow):
                 color: #FF9800;
                 font-weight: bold;
             }
-        """)
+        """))
         layout.addWidget(color_placeholder_lineedit)
         
         self.main_layout.addLayout(layout)
@@ -179,7 +202,7 @@ class LineEditStylesWindow(QMainWindow):
     def create_password_style_example(self):
         """Password field style sheet example"""
         section_label = QLabel("Password Field Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -220,7 +243,7 @@ class LineEditStylesWindow(QMainWindow):
     def create_gradient_style_example(self):
         """Gradient background style sheet example"""
         section_label = QLabel("Gradient Background Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -269,7 +292,7 @@ class LineEditStylesWindow(QMainWindow):
     def create_custom_cursor_style_example(self):
         """Custom cursor style sheet example"""
         section_label = QLabel("Custom Cursor Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -277,7 +300,7 @@ class LineEditStylesWindow(QMainWindow):
         # Custom cursor color
         cursor_lineedit = QLineEdit()
         cursor_lineedit.setPlaceholderText("Custom Cursor Color")
-        cursor_lineedit.setStyleSheet("""
+        cursor_lineedit.setStyleSheet(compiled_stylesheet("""
             QLineEdit {
                 background-color: #FFFFFF;
                 color: #333333;
@@ -287,13 +310,13 @@ class LineEditStylesWindow(QMainWindow):
                 /* Custom cursor color via caret-color property */
                 caret-color: #F44336;
             }
-        """)
+        """))
         layout.addWidget(cursor_lineedit)
         
         # Big cursor line edit
         big_cursor_lineedit = QLineEdit()
         big_cursor_lineedit.setPlaceholderText("Big Cursor")
-        big_cursor_lineedit.setStyleSheet("""
+        big_cursor_lineedit.setStyleSheet(compiled_stylesheet("""
             QLineEdit {
                 background-color: #FFFFFF;
                 color: #333333;
@@ -305,7 +328,7 @@ class LineEditStylesWindow(QMainWindow):
             }
             /* Note: Qt stylesheets don't directly support setting cursor width */
             /* In real projects, you need to subclass QLineEdit and override paintEvent to implement this */
-        """)
+        """))
         layout.addWidget(big_cursor_lineedit)
         
         self.main_layout.addLayout(layout)
@@ -313,7 +336,7 @@ class LineEditStylesWindow(QMainWindow):
     def create_icon_style_example(self):
         """Line edit with icon style sheet example"""
         section_label = QLabel("Line Edit with Icon Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -329,12 +352,11 @@ class LineEditStylesWindow(QMainWindow):
                 border-radius: 4px;
                 padding: 5px;
                 padding-left: 30px;  /* Space for left icon */
-                background-image: url(:/icons/search.png);  /* Use icon in real projects */
+                background-image: url(:/icons/search.png);  /* From the icon resource bundle, see icon_resources.py */
                 background-repeat: no-repeat;
                 background-position: left center;
-                background-origin: content;
+                background-origin: padding;  /* In the left padding, not under the text */
             }
-            /* Since we don't have actual icon files, we simulate with Unicode symbols */
         """)
         # In real projects, you can add icons using QAction
         # action = QAction(self)
@@ -362,7 +384,7 @@ class LineEditStylesWindow(QMainWindow):
     def create_readonly_style_example(self):
         """Read-only state style sheet example"""
         section_label = QLabel("Read-only State Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -406,6 +428,81 @@ class LineEditStylesWindow(QMainWindow):
         layout.addWidget(disabled_lineedit)
         
         self.main_layout.addLayout(layout)
+    
+    def create_completion_style_example(self):
+        """Completion and validation state style sheet example"""
+        section_label = QLabel("Completion and Validation")
+        set_style_class(section_label, SECTION_HEADER)
+        self.main_layout.addWidget(section_label)
+        
+        layout = QHBoxLayout()
+        
+        # Search field completing from a million entries, whose index is built the first time it gets focus
+        self.search_lineedit = QLineEdit()
+        self.search_lineedit.setPlaceholderText("Search a million entries...")
+        self.search_lineedit.installEventFilter(self)
+        self.search_lineedit.setStyleSheet("""
+            QLineEdit {
+                background-color: #FFFFFF;
+                color: #333333;
+                border: 2px solid #CCCCCC;
+                border-radius: 4px;
+                padding: 5px;
+            }
+            QLineEdit:focus {
+                border-color: #2196F3;
+            }
+            /* Set by the validator once typing pauses, see search_completion.py */
+            QLineEdit[validationState="valid"] {
+                border-color: #4CAF50;
+            }
+            QLineEdit[validationState="invalid"] {
+                border-color: #F44336;
+                background-color: #FFEBEE;
+            }
+        """)
+        layout.addWidget(self.search_lineedit)
+        
+        # Result of the last validation
+        self.validation_label = QLabel("")
+        layout.addWidget(self.validation_label)
+        
+        self.main_layout.addLayout(layout)
+    
+    def eventFilter(self, watched, event):
+        """Build the search index once the search field first gets focus, not for every window created"""
+        if watched is self.search_lineedit and event.type() == QEvent.FocusIn:
+            self.search_lineedit.removeEventFilter(self)
+            self.search_lineedit.setPlaceholderText(self.locale_switcher.text("Loading completions..."))
+            # Built in the thread pool so that typing goes on meanwhile
+            run_in_pool(
+                self,
+                lambda: CompactPrefixIndex(sample_entries(SEARCH_CORPUS_SIZE)),
+                self.setup_search_completion
+            )
+        return super().eventFilter(watched, event)
+    
+    def setup_search_completion(self, index):
+        """Attach the completer and the debounced validator to the search field"""
+        if isinstance(index, Exception):
+            # The search field completes nothing
+            self.statusBar().showMessage(
+                self.locale_switcher.text("Building the search index failed: {error}").format(error=index))
+            return
+        completer = IndexedCompleter(index, self.search_lineedit)
+        completer.latency_measured.connect(self.show_completion_latency)
+        validator = DebouncedValidator(self.search_lineedit, corpus_validator(index))
+        validator.validated.connect(self.show_validation_result)
+        
+        self.search_lineedit.setPlaceholderText(self.locale_switcher.text("Search a million entries..."))
+    
+    def show_completion_latency(self, ms):
+        """Show the keystroke-to-popup latency in the status bar"""
+        self.statusBar().showMessage(self.locale_switcher.text("Keystroke to popup: {ms:.2f} ms").format(ms=ms))
+    
+    def show_validation_result(self, valid, message):
+        """Show the message of the last validation"""
+        self.validation_label.setText(self.locale_switcher.text(message))
 
 # Startup function
 if __name__ == "__main__":
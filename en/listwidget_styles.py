@@ -22,6 +22,8 @@ from PySide6.QtWidgets import (
     QGroupBox
 )
 from PySide6.QtGui import QFont, QBrush, QColor, QIcon
+from locale_switcher import install_language_menu
+from style_overview import install_style_overview
 
 class ListWidgetStylesWindow(QMainWindow):
     """QListWidget stylesheet example window"""
@@ -31,6 +33,9 @@ class ListWidgetStylesWindow(QMainWindow):
         self.setWindowTitle("QListWidget Style Sheet Example")
         self.resize(800, 600)
         
+        # The checkbox style connects its click handler once, not on every selection
+        self.checkbox_handler_connected = False
+        
         # Create central widget and main layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -85,6 +90,14 @@ class ListWidgetStylesWindow(QMainWindow):
         
         # Show basic list by default
         self.update_list_style(0)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label, self.list_widget)
+        self.locale_switcher.follow(self.reset_button.clicked, self.list_widget)
+        
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
     def create_listwidget(self):
         """Create list widget and add items"""
@@ -305,7 +318,9 @@ class ListWidgetStylesWindow(QMainWindow):
                 item.setText(f"□ {item.text()}")
             
             # Connect signal to toggle checkbox state when clicked
-            self.list_widget.itemClicked.connect(self.toggle_checkbox)
+            if not self.checkbox_handler_connected:
+                self.list_widget.itemClicked.connect(self.toggle_checkbox)
+                self.checkbox_handler_connected = True
             
             self.list_widget.setStyleSheet("""
                 QListWidget {
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Runtime Language Switching
+This module lets a single gallery window switch its visible text between English and Chinese in place.
+Strings are looked up in the compact catalogs under translations/, and only the text of existing widgets
+is touched: no widget is rebuilt and no stylesheet is re-applied, so nothing has to be re-polished.
+"""
+
+import json
+import os
+import re
+import time
+from PySide6.QtCore import QAbstractProxyModel, QSignalBlocker
+from PySide6.QtGui import QAction, QActionGroup, QStandardItemModel
+from PySide6.QtWidgets import (
+    QWidget,
+    QMainWindow,
+    QLabel,
+    QAbstractButton,
+    QGroupBox,
+    QLineEdit,
+    QTextEdit,
+    QComboBox,
+    QTabWidget,
+    QListWidget,
+    QTableWidget,
+    QTableView,
+    QTreeWidget,
+    QTreeWidgetItemIterator,
+    QMenu
+)
+
+# The gallery is written in English, the other languages are catalogs keyed by the English text
+SOURCE_LANGUAGE = "en"
+LANGUAGES = {
+    "en": "English",
+    "zh_CN": "中文",
+}
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translations")
+
+# Decorations that list styles prepend to item text ("□ Item 1", "<span ...>●</span> Item 1")
+_DECORATION = re.compile(r"^(.*(?:</span>|[□☑●])\s)(.+)$", re.S)
+
+# Loaded catalogs, shared by every window in the process: {language: (forward, reverse)}
+_catalogs = {}
+
+
+def load_catalog(language):
+    """Load the catalog of a language once and return its (English -> text, text -> English) mappings"""
+    if language not in _catalogs:
+        if language == SOURCE_LANGUAGE:
+            forward = {}
+        else:
+            with open(os.path.join(TRANSLATIONS_DIR, f"{language}.json"), encoding="utf-8") as catalog_file:
+                forward = json.load(catalog_file)
+        _catalogs[language] = (forward, {text: source for source, text in forward.items()})
+    return _catalogs[language]
+
+
+class LocaleSwitcher:
+    """Switches the text of an existing window between the catalog languages"""
+
+    def __init__(self, window, language=SOURCE_LANGUAGE):
+        self.window = window
+        self.language = language
+        # Latency and size of the last switch, for display and benchmarking
+        self.last_switch_ms = 0.0
+        self.last_update_count = 0
+        self._updates = 0
+
+    def text(self, source):
+        """Translate an English source string into the current language"""
+        forward, _ = load_catalog(self.language)
+        return forward.get(source, source)
+
+    def set_language(self, language):
+        """Switch every text of the window to another language and return the latency in milliseconds"""
+        start = time.perf_counter()
+        self._updates = 0
+        previous, self.language = self.language, language
+        self._retranslate_tree(self.window, previous)
+        self.last_switch_ms = (time.perf_counter() - start) * 1000
+        self.last_update_count = self._updates
+
+        if isinstance(self.window, QMainWindow):
+            self.window.statusBar().showMessage(
+                self.text("Language switched in {ms:.2f} ms ({count} texts updated)").format(
+                    ms=self.last_switch_ms, count=self.last_update_count
+                )
+            )
+        return self.last_switch_ms
+
+    def retranslate(self, *widgets):
+        """Translate text that the window has just (re)set in English, including rebuilt child widgets"""
+        if self.language == SOURCE_LANGUAGE:
+            return
+        for widget in widgets:
+            self._retranslate_tree(widget, SOURCE_LANGUAGE)
+
+    def follow(self, signal, *widgets):
+        """Retranslate the given widgets whenever a signal has updated their text"""
+        signal.connect(lambda *args: self.retranslate(*widgets))
+
+    def _translate(self, text, previous):
+        """Map text shown in the previous language to the current language"""
+        if not text:
+            return text
+
+        _, reverse = load_catalog(previous)
+        forward, _ = load_catalog(self.language)
+        source = reverse.get(text, text)
+        if source in forward or (self.language == SOURCE_LANGUAGE and source != text):
+            return forward.get(source, source)
+
+        # Translate the label part of decorated list items and keep the decoration
+        match = _DECORATION.match(text)
+        if match:
+            return match.group(1) + self._translate(match.group(2), previous)
+        return text
+
+    def _apply(self, getter, setter, previous):
+        """Set a translated text only if it actually differs from the current one"""
+        current = getter()
+        translated = self._translate(current, previous)
+        if translated != current:
+            setter(translated)
+            self._updates += 1
+
+    def _retranslate_tree(self, root, previous):
+        """Retranslate a widget and all of its descendants"""
+        self._apply(root.windowTitle, root.setWindowTitle, previous)
+        self._retranslate_widget(root, previous)
+        for widget in root.findChildren(QWidget):
+            # Dialogs owned by the window carry their own title
+            if widget.isWindow():
+                self._apply(widget.windowTitle, widget.setWindowTitle, previous)
+            self._retranslate_widget(widget, previous)
+
+    def _retranslate_widget(self, widget, previous):
+        """Retranslate the text slots of a single widget"""
+        if isinstance(widget, (QLabel, QAbstractButton)):
+            self._apply(widget.text, widget.setText, previous)
+        elif isinstance(widget, QGroupBox):
+            self._apply(widget.title, widget.setTitle, previous)
+        elif isinstance(widget, QLineEdit):
+            self._apply(widget.placeholderText, widget.setPlaceholderText, previous)
+            # The text of an editable combo box is covered by its items
+            if isinstance(widget.parent(), QComboBox):
+                return
+            # Only text the user cannot edit belongs to the gallery
+            if widget.isReadOnly() or not widget.isEnabled():
+                self._apply(widget.text, widget.setText, previous)
+        elif isinstance(widget, QTextEdit):
+            self._apply(widget.placeholderText, widget.setPlaceholderText, previous)
+            if widget.isReadOnly():
+                self._apply(widget.toPlainText, widget.setPlainText, previous)
+        elif isinstance(widget, QComboBox):
+            # Options of a custom model are data, e.g. the large-list combobox, not gallery text
+            if not isinstance(widget.model(), QStandardItemModel):
+                return
+            blocker = QSignalBlocker(widget)
+            for row in range(widget.count()):
+                self._apply(
+                    lambda: widget.itemText(row), lambda text: widget.setItemText(row, text), previous
+                )
+            blocker.unblock()
+        elif isinstance(widget, QTabWidget):
+            for index in range(widget.count()):
+                self._apply(
+                    lambda: widget.tabText(index), lambda text: widget.setTabText(index, text), previous
+                )
+        elif isinstance(widget, QListWidget):
+            blocker = QSignalBlocker(widget)
+            for row in range(widget.count()):
+                item = widget.item(row)
+                self._apply(item.text, item.setText, previous)
+            blocker.unblock()
+        elif isinstance(widget, QTableWidget):
+            blocker = QSignalBlocker(widget)
+            for column in range(widget.columnCount()):
+                header_item = widget.horizontalHeaderItem(column)
+                if header_item:
+                    self._apply(header_item.text, header_item.setText, previous)
+            for row in range(widget.rowCount()):
+                for column in range(widget.columnCount()):
+                    item = widget.item(row, column)
+                    if item:
+                        self._apply(item.text, item.setText, previous)
+            blocker.unblock()
+        elif isinstance(widget, QTableView):
+            # Column models translate their header and each distinct text once, however many rows show it
+            model = widget.model()
+            while isinstance(model, QAbstractProxyModel):
+                model = model.sourceModel()
+            if hasattr(model, "translate_texts"):
+                self._updates += model.translate_texts(lambda text: self._translate(text, previous))
+        elif isinstance(widget, QMenu):
+            self._apply(widget.title, widget.setTitle, previous)
+            for action in widget.actions():
+                self._apply(action.text, action.setText, previous)
+        elif isinstance(widget, QTreeWidget):
+            # Blocked so that check state handlers don't run for a text change
+            blocker = QSignalBlocker(widget)
+            header_item = widget.headerItem()
+            iterator = QTreeWidgetItemIterator(widget)
+            items = [header_item]
+            while iterator.value():
+                items.append(iterator.value())
+                iterator += 1
+            for item in items:
+                for column in range(widget.columnCount()):
+                    self._apply(
+                        lambda: item.text(column), lambda text: item.setText(column, text), previous
+                    )
+            blocker.unblock()
+
+
+def install_language_menu(window):
+    """Add a language menu to a gallery window and return its LocaleSwitcher"""
+    switcher = LocaleSwitcher(window)
+
+    menu = window.menuBar().addMenu("Language / 语言")
+    group = QActionGroup(menu)
+    group.setExclusive(True)
+    for language, name in LANGUAGES.items():
+        action = QAction(name, menu)
+        action.setCheckable(True)
+        action.setChecked(language == switcher.language)
+        action.triggered.connect(lambda checked, language=language: switcher.set_language(language))
+        group.addAction(action)
+        menu.addAction(action)
+
+    return switcher
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lazy Style Pages
+This module lets a combobox-driven gallery window register each style page as a builder instead of
+constructing every page up front. A page is built the first time its style is selected and then kept in a
+QStackedWidget, so switching styles is a dictionary lookup and a stack index change, with no layout walk.
+"""
+
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QStackedWidget, QWidget, QVBoxLayout
+
+from qss_compiler import compiled_stylesheet
+
+
+class LazyPageStack(QStackedWidget):
+    """Stacked style pages that are built by their builder the first time they are shown"""
+
+    # Emitted with the style index after a page was built, e.g. to translate its text
+    page_built = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._builders = []
+        # Stack index of every page built so far, keyed by style index
+        self._stack_indexes = {}
+
+    def register(self, builder):
+        """Register a builder returning the page of the next style and return that style's index"""
+        self._builders.append(builder)
+        return len(self._builders) - 1
+
+    def page_count(self):
+        return len(self._builders)
+
+    def is_built(self, index):
+        return index in self._stack_indexes
+
+    def _stack_index(self, index):
+        stack_index = self._stack_indexes.get(index)
+        if stack_index is None:
+            stack_index = self._stack_indexes[index] = self.addWidget(self._builders[index]())
+            self.page_built.emit(index)
+        return stack_index
+
+    def page(self, index):
+        """Return the page of a style, building it on first use"""
+        return self.widget(self._stack_index(index))
+
+    def show_page(self, index):
+        """Show the page of a style, building it on first use"""
+        self.setCurrentIndex(self._stack_index(index))
+
+    def built_pages(self):
+        """Return the pages built so far"""
+        return [self.widget(stack_index) for stack_index in self._stack_indexes.values()]
+
+
+def styled_group_builder(widget_class, texts, stylesheets):
+    """Return a builder of a page with one widget_class(text) per text
+
+    A single stylesheet is set once on the page and cascades to every widget; a list sets one per widget.
+    """
+    def build():
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        if isinstance(stylesheets, str):
+            page.setStyleSheet(compiled_stylesheet(stylesheets))
+        for position, text in enumerate(texts):
+            widget = widget_class(text)
+            if not isinstance(stylesheets, str):
+                widget.setStyleSheet(compiled_stylesheet(stylesheets[position]))
+            layout.addWidget(widget)
+        return page
+
+    return build
@@ -6,13 +6,19 @@ This file demonstrates how to customize various style effects for the QProgressB
 """
 
 import sys
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QProgressBar, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox
 from PySide6.QtGui import QColor
+from locale_switcher import install_language_menu
+from qss_compiler import compiled_stylesheet
+from style_overview import install_style_overview
 
 class ProgressBarStylesWindow(QMainWindow):
     """QProgressBar stylesheet example window"""
     
+    # Emitted with the style name after the widgets of a style were built
+    style_built = Signal(str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("QProgressBar Stylesheet Examples")
@@ -33,16 +39,18 @@ class ProgressBarStylesWindow(QMainWindow):
         selector_layout = QHBoxLayout()
         selector_label = QLabel("Select progress bar style:")
         self.style_combobox = QComboBox()
-        self.style_combobox.addItems([
-            "Basic Progress Bar", 
-            "Gradient Progress Bar", 
-            "Circular Progress Bar", 
-            "Segmented Progress Bar",
-            "Glassmorphism Effect",
-            "Neon Effect",
-            "3D Effect",
-            "Custom Text Display"
-        ])
+        
+        # Style registry: styles are registered by name, and the label and progress bar of a style
+        # are only built the first time it is selected
+        self.progress_styles = {}
+        self.style_names = []
+        self.style_widgets = {}
+        self.progress_bars = {}
+        self.current_style = None
+        self.progress_value = 0
+        self.register_progress_styles()
+        
+        self.style_combobox.addItems(self.style_names)
         self.style_combobox.currentIndexChanged.connect(self.update_progress_bar_style)
         
         # Control buttons
@@ -64,94 +72,36 @@ class ProgressBarStylesWindow(QMainWindow):
         self.progress_layout = QVBoxLayout(self.progress_container)
         self.main_layout.addWidget(self.progress_container)
         
-        # Create various progress bars
-        self.create_progress_bars()
+        # Add description
+        self.info_label = QLabel()
+        self.info_label.setWordWrap(True)
+        self.info_label.setStyleSheet("margin-top: 10px; color: #666;")
+        self.progress_layout.addWidget(self.info_label)
         
         # Set up timer for updating progress
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_progress)
-        self.progress_value = 0
         
         # Default to showing basic progress bar
         self.update_progress_bar_style(0)
-    
-    def create_progress_bars(self):
-        """Create various progress bars"""
-        # Basic progress bar
-        self.basic_progress = QProgressBar()
-        self.basic_progress.setValue(0)
-        self.basic_progress.setMinimumHeight(30)
-        self.progress_layout.addWidget(QLabel("1. Basic Progress Bar"))
-        self.progress_layout.addWidget(self.basic_progress)
-        
-        # Gradient progress bar
-        self.gradient_progress = QProgressBar()
-        self.gradient_progress.setValue(0)
-        self.gradient_progress.setMinimumHeight(30)
-        self.progress_layout.addWidget(QLabel("2. Gradient Progress Bar"))
-        self.progress_layout.addWidget(self.gradient_progress)
-        
-        # Circular progress bar
-        self.circular_progress = QProgressBar()
-        self.circular_progress.setValue(0)
-        self.circular_progress.setMinimumSize(150, 150)
-        self.progress_layout.addWidget(QLabel("3. Circular Progress Bar"))
-        self.progress_layout.addWidget(self.circular_progress, alignment=Qt.AlignCenter)
-        
-        # Segmented progress bar
-        self.segmented_progress = QProgressBar()
-        self.segmented_progress.setValue(0)
-        self.segmented_progress.setMinimumHeight(30)
-        self.progress_layout.addWidget(QLabel("4. Segmented Progress Bar"))
-        self.progress_layout.addWidget(self.segmented_progress)
-        
-        # Glassmorphism effect progress bar
-        self.glass_progress = QProgressBar()
-        self.glass_progress.setValue(0)
-        self.glass_progress.setMinimumHeight(30)
-        self.progress_layout.addWidget(QLabel("5. Glassmorphism Effect"))
-        self.progress_layout.addWidget(self.glass_progress)
-        
-        # Neon effect progress bar
-        self.neon_progress = QProgressBar()
-        self.neon_progress.setValue(0)
-        self.neon_progress.setMinimumHeight(30)
-        self.progress_layout.addWidget(QLabel("6. Neon Effect"))
-        self.progress_layout.addWidget(self.neon_progress)
-        
-        # 3D effect progress bar
-        self.three_d_progress = QProgressBar()
-        self.three_d_progress.setValue(0)
-        self.three_d_progress.setMinimumHeight(40)
-        self.progress_layout.addWidget(QLabel("7. 3D Effect"))
-        self.progress_layout.addWidget(self.three_d_progress)
-        
-        # Custom text display progress bar
-        self.custom_text_progress = QProgressBar()
-        self.custom_text_progress.setValue(0)
-        self.custom_text_progress.setMinimumHeight(30)
-        self.progress_layout.addWidget(QLabel("8. Custom Text Display"))
-        self.progress_layout.addWidget(self.custom_text_progress)
-        
-        # Add description
-        self.info_label = QLabel()
-        self.info_label.setWordWrap(True)
-        self.info_label.setStyleSheet("margin-top: 10px; color: #666;")
-        self.progress_layout.addWidget(self.info_label)
         
-        # Apply styles
-        self.apply_styles()
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label)
+        self.locale_switcher.follow(self.start_button.clicked, self.start_button)
+        self.locale_switcher.follow(self.reset_button.clicked, self.start_button)
+        self.locale_switcher.follow(self.style_built, self.progress_container)
         
-        # Hide all progress bars by default
-        for i in range(1, self.progress_layout.count()):
-            widget = self.progress_layout.itemAt(i).widget()
-            if widget and widget != self.info_label:
-                widget.hide()
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
-    def apply_styles(self):
-        """Apply various progress bar styles"""
+    def register_progress_styles(self):
+        """Register the various progress bar styles"""
         # 1. Basic progress bar style
-        self.basic_progress.setStyleSheet("""
+        self.register_progress_style(
+            "Basic Progress Bar",
+            "1. Basic Progress Bar",
+            """
             QProgressBar {
                 background-color: #E0E0E0;
                 border-radius: 10px;
@@ -163,10 +113,15 @@ class ProgressBarStylesWindow(QMainWindow):
                 background-color: #2196F3;
                 border-radius: 10px;
             }
-        """)
+        """,
+            "Basic progress bar uses simple rounded rectangle design, suitable for most application scenarios.",
+        )
         
         # 2. Gradient progress bar style
-        self.gradient_progress.setStyleSheet("""
+        self.register_progress_style(
+            "Gradient Progress Bar",
+            "2. Gradient Progress Bar",
+            """
             QProgressBar {
                 background-color: #E0E0E0;
                 border-radius: 15px;
@@ -181,10 +136,15 @@ class ProgressBarStylesWindow(QMainWindow):
                 border-radius: 15px;
                 border: 1px solid #4CAF50;
             }
-        """)
+        """,
+            "Gradient progress bar uses linear gradient effect to create smooth color transitions.",
+        )
         
         # 3. Circular progress bar style
-        self.circular_progress.setStyleSheet("""
+        self.register_progress_style(
+            "Circular Progress Bar",
+            "3. Circular Progress Bar",
+            """
             QProgressBar {
                 background-color: #F5F5F5;
                 border-radius: 75px;
@@ -199,10 +159,17 @@ class ProgressBarStylesWindow(QMainWindow):
                 border-radius: 75px;
                 border: 8px solid #1976D2;
             }
-        """)
+        """,
+            "Circular progress bar adopts circular design, suitable for displaying percentage completion.",
+            minimum_size=(150, 150),
+            alignment=Qt.AlignCenter,
+        )
         
         # 4. Segmented progress bar style
-        self.segmented_progress.setStyleSheet("""
+        self.register_progress_style(
+            "Segmented Progress Bar",
+            "4. Segmented Progress Bar",
+            """
             QProgressBar {
                 background-color: #E0E0E0;
                 border-radius: 10px;
@@ -217,10 +184,15 @@ class ProgressBarStylesWindow(QMainWindow):
                 margin: 1px;
                 border-radius: 3px;
             }
-        """)
+        """,
+            "Segmented progress bar displays progress as discrete blocks, providing a different visual experience.",
+        )
         
         # 5. Glassmorphism effect progress bar style
-        self.glass_progress.setStyleSheet("""
+        self.register_progress_style(
+            "Glassmorphism Effect",
+            "5. Glassmorphism Effect",
+            """
             QProgressBar {
                 background-color: rgba(224, 224, 224, 150);
                 border-radius: 15px;
@@ -235,10 +207,15 @@ class ProgressBarStylesWindow(QMainWindow):
                 border-radius: 15px;
                 border: 1px solid rgba(25, 118, 210, 200);
             }
-        """)
+        """,
+            "Glassmorphism effect creates a modern interface through semi-transparency and blur effects.",
+        )
         
         # 6. Neon effect progress bar style
-        self.neon_progress.setStyleSheet("""
+        self.register_progress_style(
+            "Neon Effect",
+            "6. Neon Effect",
+            """
             QProgressBar {
                 background-color: #1A1A1A;
                 border-radius: 15px;
@@ -253,10 +230,15 @@ class ProgressBarStylesWindow(QMainWindow):
                 border-radius: 13px;
                 box-shadow: 0 0 10px #00BCD4, 0 0 20px #00BCD4;
             }
-        """)
+        """,
+            "Neon effect creates a futuristic visual effect using glow and shadows.",
+        )
         
         # 7. 3D effect progress bar style
-        self.three_d_progress.setStyleSheet("""
+        self.register_progress_style(
+            "3D Effect",
+            "7. 3D Effect",
+            """
             QProgressBar {
                 background-color: #E0E0E0;
                 border-radius: 20px;
@@ -274,10 +256,16 @@ class ProgressBarStylesWindow(QMainWindow):
                 border: 1px solid #4CAF50;
                 box-shadow: inset 0 2px 4px rgba(255, 255, 255, 0.3);
             }
-        """)
+        """,
+            "3D effect creates a three-dimensional visual experience through multiple shadows and gradients.",
+            minimum_size=(0, 40),
+        )
         
         # 8. Custom text display progress bar style
-        self.custom_text_progress.setStyleSheet("""
+        self.register_progress_style(
+            "Custom Text Display",
+            "8. Custom Text Display",
+            """
             QProgressBar {
                 background-color: #E0E0E0;
                 border-radius: 10px;
@@ -290,47 +278,66 @@ class ProgressBarStylesWindow(QMainWindow):
                 background-color: #F44336;
                 border-radius: 10px;
             }
-        """)
+        """,
+            "Custom text display allows you to modify the format and style of text displayed on the progress bar.",
+            text_format="%v%% Completed",
+        )
+    
+    def register_progress_style(self, name, title, stylesheet, description, minimum_size=(0, 30), alignment=None,
+                                text_format=None):
+        """Register a progress bar style under its name"""
+        self.progress_styles[name] = {
+            "title": title,
+            "stylesheet": compiled_stylesheet(stylesheet),
+            "description": description,
+            "minimum_size": minimum_size,
+            "alignment": alignment,
+            "text_format": text_format,
+        }
+        self.style_names.append(name)
+    
+    def build_style_widgets(self, name):
+        """Build the label and progress bar of a style and return them"""
+        style = self.progress_styles[name]
+        progress_bar = QProgressBar()
+        progress_bar.setValue(self.progress_value)
+        progress_bar.setMinimumSize(*style["minimum_size"])
+        progress_bar.setStyleSheet(style["stylesheet"])
+        if style["text_format"]:
+            progress_bar.setFormat(style["text_format"])
+        label = QLabel(style["title"])
+        
+        # Only the selected style is visible, so the widgets go right above the description (the last item)
+        # in whatever order the styles are first selected
+        position = self.progress_layout.count() - 1
+        self.progress_layout.insertWidget(position, label)
+        if style["alignment"] is None:
+            self.progress_layout.insertWidget(position + 1, progress_bar)
+        else:
+            self.progress_layout.insertWidget(position + 1, progress_bar, alignment=style["alignment"])
         
-        # Set custom text display
-        self.custom_text_progress.setFormat("%v%% Completed")
+        self.style_widgets[name] = (label, progress_bar)
+        self.progress_bars[name] = progress_bar
+        self.style_built.emit(name)
+        return label, progress_bar
     
     def update_progress_bar_style(self, index):
         """Update displayed progress bar style based on selection"""
-        # Hide all progress bars
-        for i in range(1, self.progress_layout.count()):
-            widget = self.progress_layout.itemAt(i).widget()
-            if widget and widget != self.info_label:
-                widget.hide()
+        name = self.style_names[index]
+        if name == self.current_style:
+            return
         
-        # Show selected progress bar
-        progress_bars = [
-            self.basic_progress,
-            self.gradient_progress,
-            self.circular_progress,
-            self.segmented_progress,
-            self.glass_progress,
-            self.neon_progress,
-            self.three_d_progress,
-            self.custom_text_progress
-        ]
-        
-        # Show corresponding label and progress bar
-        self.progress_layout.itemAt(index * 2).widget().show()  # Show label
-        progress_bars[index].show()  # Show progress bar
+        # Hide the previous style and show the selected one, building it on first selection
+        if self.current_style is not None:
+            for widget in self.style_widgets[self.current_style]:
+                widget.hide()
+        widgets = self.style_widgets.get(name) or self.build_style_widgets(name)
+        for widget in widgets:
+            widget.show()
+        self.current_style = name
         
         # Update description
-        descriptions = [
-            "Basic progress bar uses simple rounded rectangle design, suitable for most application scenarios.",
-            "Gradient progress bar uses linear gradient effect to create smooth color transitions.",
-            "Circular progress bar adopts circular design, suitable for displaying percentage completion.",
-            "Segmented progress bar displays progress as discrete blocks, providing a different visual experience.",
-            "Glassmorphism effect creates a modern interface through semi-transparency and blur effects.",
-            "Neon effect creates a futuristic visual effect using glow and shadows.",
-            "3D effect creates a three-dimensional visual experience through multiple shadows and gradients.",
-            "Custom text display allows you to modify the format and style of text displayed on the progress bar."
-        ]
-        self.info_label.setText(descriptions[index])
+        self.info_label.setText(self.progress_styles[name]["description"])
     
     def start_progress(self):
         """Start updating progress"""
@@ -346,19 +353,8 @@ class ProgressBarStylesWindow(QMainWindow):
         self.timer.stop()
         self.progress_value = 0
         
-        # Reset all progress bars
-        progress_bars = [
-            self.basic_progress,
-            self.gradient_progress,
-            self.circular_progress,
-            self.segmented_progress,
-            self.glass_progress,
-            self.neon_progress,
-            self.three_d_progress,
-            self.custom_text_progress
-        ]
-        
-        for progress_bar in progress_bars:
+        # Reset every progress bar built so far
+        for progress_bar in self.progress_bars.values():
             progress_bar.setValue(0)
         
         self.start_button.setText("Start")
@@ -369,19 +365,8 @@ class ProgressBarStylesWindow(QMainWindow):
         if self.progress_value > 100:
             self.progress_value = 0
         
-        # Update all progress bars
-        progress_bars = [
-            self.basic_progress,
-            self.gradient_progress,
-            self.circular_progress,
-            self.segmented_progress,
-            self.glass_progress,
-            self.neon_progress,
-            self.three_d_progress,
-            self.custom_text_progress
-        ]
-        
-        for progress_bar in progress_bars:
+        # Update every progress bar built so far, pages built later start at the current value
+        for progress_bar in self.progress_bars.values():
             progress_bar.setValue(self.progress_value)
 
 # Launch function
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+QSS Compiler
+Some gallery stylesheets use CSS that Qt style sheets do not support, e.g. box-shadow, transition or a
+::placeholder subcontrol, which Qt parses on every polish only to ignore. This module checks a stylesheet
+against the properties, pseudo-states and subcontrols of the Qt style sheet reference, drops the declarations
+and rules that can never apply, with a diagnostic for each, and minimizes what is left.
+
+The windows load their stylesheets through compiled_stylesheet(), which looks the compiled output up in
+compiled_qss.py by the hash of the source. Run directly, this module opens every gallery window, walks
+every style state, reports the dead CSS of every stylesheet it meets and regenerates compiled_qss.py:
+    python qss_compiler.py
+    python -m doctest qss_compiler.py    # check the selector and declaration cases in the docstrings
+"""
+
+import hashlib
+import os
+import re
+import sys
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compiled_qss.py")
+
+# Properties of the Qt style sheet reference
+PROPERTIES = frozenset("""
+    accent-color alternate-background-color background background-attachment background-clip background-color
+    background-image background-origin background-position background-repeat border border-bottom
+    border-bottom-color border-bottom-left-radius border-bottom-right-radius border-bottom-style
+    border-bottom-width border-color border-image border-left border-left-color border-left-style
+    border-left-width border-radius border-right border-right-color border-right-style border-right-width
+    border-style border-top border-top-color border-top-left-radius border-top-right-radius border-top-style
+    border-top-width border-width bottom button-layout color dialogbuttonbox-buttons-have-icons font
+    font-family font-size font-style font-weight gridline-color height icon icon-size image image-position
+    left lineedit-password-character lineedit-password-mask-delay margin margin-bottom margin-left
+    margin-right margin-top max-height max-width messagebox-text-interaction-flags min-height min-width
+    opacity outline outline-bottom-left-radius outline-bottom-right-radius outline-color outline-offset
+    outline-radius outline-style outline-top-left-radius outline-top-right-radius padding padding-bottom
+    padding-left padding-right padding-top paint-alternating-row-colors-for-empty-area placeholder-text-color
+    position right selection-background-color selection-color show-decoration-selected spacing
+    subcontrol-origin subcontrol-position text-align text-decoration titlebar-show-tooltips-on-buttons top
+    widget-animation-duration width -qt-background-role -qt-style-features
+""".split())
+# Properties the reference supports on some widgets only
+PROPERTY_WIDGETS = {"opacity": {"QToolTip"}}
+PSEUDO_STATES = frozenset("""
+    active adjoins-item alternate bottom checked closable closed default disabled editable edit-focus enabled
+    exclusive first flat floatable focus has-children has-siblings horizontal hover indeterminate last left
+    maximized middle minimized movable no-frame non-exclusive off on only-one open next-selected pressed
+    previous-selected read-only right selected top unchecked vertical window
+""".split())
+SUBCONTROLS = frozenset("""
+    add-line add-page branch chunk close-button corner down-arrow down-button drop-down float-button groove
+    indicator handle icon item left-arrow left-corner menu-arrow menu-button menu-indicator right-arrow pane
+    right-corner scroller section separator sub-line sub-page tab tab-bar tear tearoff text title up-arrow
+    up-button
+""".split())
+
+_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+# Descendant and child combinators, outside attribute selectors and arguments
+_COMBINATOR_PATTERN = re.compile(r"\s*>\s*|\s+(?![^\[(]*[\])])")
+# A subcontrol, or a pseudo-state that may be negated or take arguments
+_PSEUDO_PATTERN = re.compile(r"(::?)!?([\w-]+)(\()?")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# A simple selector: a type, .Type or *, then ids, attribute selectors, pseudo-states and subcontrols
+_SIMPLE_SELECTOR = (
+    r"(?=[\w*#.\[:])(?:\*|\.?[A-Za-z_][\w-]*)?"
+    r"""(?:#[\w-]+|\[\s*[\w-]+\s*(?:[~|]?=\s*(?:"[^"]*"|'[^']*'|[\w-]+)\s*)?\]|::?!?[\w-]+(?:\([^()]*\))?)*"""
+)
+# A whole selector, simple selectors joined by child or descendant combinators
+_SELECTOR_PATTERN = re.compile(rf"{_SIMPLE_SELECTOR}(?:(?:\s*>\s*|\s+){_SIMPLE_SELECTOR})*")
+# Source hash: (compiled stylesheet, diagnostics) of every stylesheet compiled in this process
+_compiled = {}
+# Every source passed to compiled_stylesheet(), in order, as the build collects them
+_requested = {}
+
+
+def _line(source, offset):
+    return source.count("\n", 0, offset) + 1
+
+
+def _split_top_level(text, separator):
+    """Split text at separator, except inside parentheses, brackets or quotes, with the offset of each piece"""
+    pieces = []
+    depth = 0
+    quote = None
+    start = 0
+    for position, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth = max(depth - 1, 0)
+        elif char == separator and depth == 0:
+            pieces.append((text[start:position], start))
+            start = position + 1
+    pieces.append((text[start:], start))
+    return pieces
+
+
+def _minimized(text):
+    """Collapse the whitespace of a value or selector, except inside quotes"""
+    pieces = re.split(r"""("[^"]*"|'[^']*')""", text.strip())
+    return "".join(piece if index % 2 else _WHITESPACE_PATTERN.sub(" ", piece) for index, piece in enumerate(pieces))
+
+
+def _selector_problem(selector):
+    """Return why Qt never matches a selector, or None if it may
+
+    The whole selector has to follow the selector grammar; of its pseudo-states and subcontrols, only those of
+    the widget it applies to, its last simple selector, are checked. Qt ignores an unknown pseudo-state after a
+    subcontrol and some pseudo-states with arguments, e.g. :nth-child(even), so rules with either can still
+    apply and are kept.
+
+    >>> _selector_problem("QTabWidget > QTabBar::tab:!selected")
+    >>> _selector_problem('QLineEdit[validationState="invalid"]')
+    >>> _selector_problem("garbage; QLabel")
+    "invalid selector 'garbage; QLabel'"
+    >>> _selector_problem("color: white; QWidget#p")
+    "invalid selector 'color: white; QWidget#p'"
+    """
+    if not _SELECTOR_PATTERN.fullmatch(selector):
+        return f"invalid selector '{selector}'"
+    subject = re.sub(r"\[[^\]]*\]", "", _COMBINATOR_PATTERN.split(selector)[-1])
+    parts = _PSEUDO_PATTERN.findall(subject)
+    if any(arguments for _, _, arguments in parts):
+        return None
+    subcontrols = [name for colons, name, _ in parts if colons == "::"]
+    if subcontrols:
+        if subcontrols[0] not in SUBCONTROLS:
+            return f"unknown subcontrol '::{subcontrols[0]}' in selector '{selector}'"
+        return None
+    for _, name, _ in parts:
+        if name not in PSEUDO_STATES:
+            return f"unknown pseudo-state ':{name}' in selector '{selector}'"
+    return None
+
+
+def _type_names(selectors):
+    """Return the widget class each selector applies to, the type of its last simple selector"""
+    names = set()
+    for selector in selectors:
+        last = _COMBINATOR_PATTERN.split(selector)[-1]
+        names.add(re.match(r"\.?([\w-]*)", last).group(1) or "*")
+    return names
+
+
+def _compile_declarations(body, body_offset, source, selectors, diagnostics):
+    """Return the minimized declarations of a rule body that Qt applies, and diagnose the others"""
+    declarations = []
+    for declaration, offset in _split_top_level(body, ";"):
+        if not declaration.strip():
+            continue
+        line = _line(source, body_offset + offset + len(declaration) - len(declaration.lstrip()))
+        name, colon, value = declaration.partition(":")
+        name = name.strip()
+        # Qt matches property names in any case, but the names of qproperty- declarations as they are
+        if not name.lower().startswith("qproperty-"):
+            name = name.lower()
+        if not colon or not name or not value.strip():
+            diagnostics.append(f"line {line}: invalid declaration '{_minimized(declaration)}'")
+        elif name not in PROPERTIES and not name.lower().startswith("qproperty-"):
+            diagnostics.append(f"line {line}: unknown property '{name}'")
+        elif name in PROPERTY_WIDGETS and not _type_names(selectors) & PROPERTY_WIDGETS[name]:
+            widgets = ", ".join(sorted(PROPERTY_WIDGETS[name]))
+            diagnostics.append(f"line {line}: property '{name}' only applies to {widgets}")
+        else:
+            declarations.append(f"{name}:{_minimized(value)}")
+    return ";".join(declarations)
+
+
+def compile_stylesheet(source):
+    """Return (minimized stylesheet, diagnostics) for a Qt style sheet, without what Qt can never apply
+
+    A stylesheet without braces is a declaration list, as a widget's own stylesheet can be.
+
+    >>> compiled, diagnostics = compile_stylesheet("QPushButton { color: red; } garbage; QLabel{color:blue}")
+    >>> compiled
+    'QPushButton{color:red}'
+    >>> diagnostics[0]
+    "line 1: invalid selector 'garbage; QLabel'"
+    >>> compile_stylesheet("color: white; text-shadow: 1px 1px red; QWidget#p{color:red}")[0]
+    ''
+    >>> compile_stylesheet('COLOR: red; qproperty-toolTip: "tip"')[0]
+    'color:red;qproperty-toolTip:"tip"'
+    """
+    # Comments are blanked rather than removed, so offsets still give the right line
+    text = _COMMENT_PATTERN.sub(lambda match: re.sub(r"[^\n]", " ", match.group(0)), source)
+    diagnostics = []
+    if "{" not in text:
+        return _compile_declarations(text, 0, source, [], diagnostics), diagnostics
+
+    rules = []
+    position = 0
+    for match in re.finditer(r"([^{}]*)\{([^{}]*)\}", text):
+        if text[position:match.start()].strip():
+            diagnostics.append(f"line {_line(source, position)}: text outside of a rule dropped")
+        position = match.end()
+        selector_text, body = match.group(1), match.group(2)
+        line = _line(source, match.start(1) + len(selector_text) - len(selector_text.lstrip()))
+        selectors = []
+        for selector, _ in _split_top_level(selector_text, ","):
+            selector = _minimized(selector)
+            problem = _selector_problem(selector)
+            if problem:
+                diagnostics.append(f"line {line}: {problem}")
+            else:
+                selectors.append(re.sub(r"\s*>\s*", ">", selector))
+        if not selectors:
+            diagnostics.append(f"line {line}: rule dropped, none of its selectors can match")
+            continue
+        # A rule left empty is kept, whether a widget has a rule for a subcontrol can change how it is drawn
+        declarations = _compile_declarations(body, match.start(2), source, selectors, diagnostics)
+        rules.append(f"{','.join(selectors)}{{{declarations}}}")
+    if text[position:].strip():
+        diagnostics.append(f"line {_line(source, position)}: text outside of a rule dropped")
+    return "".join(rules), diagnostics
+
+
+def source_hash(source):
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+def compiled_stylesheet(source):
+    """Return the compiled form of a stylesheet, from compiled_qss.py or compiled now if it is not there"""
+    key = source_hash(source)
+    _requested.setdefault(key, source)
+    entry = _compiled.get(key)
+    if entry is None:
+        import compiled_qss
+
+        output = compiled_qss.STYLESHEETS.get(key)
+        # A stylesheet edited since compiled_qss.py was generated is compiled now
+        entry = _compiled[key] = (output, []) if output is not None else compile_stylesheet(source)
+    return entry[0]
+
+
+def _walk_windows(report):
+    """Open every gallery window and call report(window key, state, widget, stylesheet) in every style state"""
+    from PySide6.QtCore import QEvent
+    from PySide6.QtWidgets import QApplication, QWidget
+    from render_snapshots import create_window, discover_windows, style_states, window_key
+
+    app = QApplication.instance()
+    for path in discover_windows(os.path.dirname(os.path.abspath(__file__))):
+        window = create_window(path)
+        window.show()
+        key = window_key(path)
+        for name, activate in style_states(window):
+            activate()
+            app.processEvents()
+            report(key, name, app, app.styleSheet())
+            for widget in [window] + window.findChildren(QWidget):
+                report(key, name, widget, widget.styleSheet())
+        window.close()
+        window.deleteLater()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def write_table(sources, output=TABLE_PATH):
+    """Write the compiled form of every source into a Python module, keyed by source hash"""
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        "# Generated by qss_compiler.py from the stylesheets the gallery windows compile, do not edit",
+        "",
+        "STYLESHEETS = {",
+    ]
+    for key, source in sorted(sources.items()):
+        lines.append(f"    {key!r}: {compile_stylesheet(source)[0]!r},")
+    lines.append("}")
+    with open(output, "w", encoding="utf-8") as table_file:
+        table_file.write("\n".join(lines) + "\n")
+    return output
+
+
+def build():
+    """Report the dead CSS of every stylesheet of every window state and regenerate compiled_qss.py"""
+    reported = set()
+    # Sources that reach Qt as written, so their dead CSS is still parsed on every polish
+    uncompiled = 0
+
+    def report(key, state, widget, stylesheet):
+        nonlocal uncompiled
+        if not stylesheet or stylesheet in reported:
+            return
+        reported.add(stylesheet)
+        _, diagnostics = compile_stylesheet(stylesheet)
+        if diagnostics:
+            uncompiled += 1
+            print(f"{key} [{state}] {type(widget).__name__} {widget.objectName()}".rstrip())
+            for diagnostic in diagnostics:
+                print(f"    {diagnostic}")
+
+    _walk_windows(report)
+    for source in _requested.values():
+        _, diagnostics = compile_stylesheet(source)
+        if diagnostics:
+            print(f"compiled stylesheet {source_hash(source)[:10]}")
+            for diagnostic in diagnostics:
+                print(f"    {diagnostic}")
+    output = write_table(_requested)
+    print(f"{len(_requested)} stylesheets compiled into {output}; "
+          f"{uncompiled} stylesheets with dead CSS are set without compiling")
+    return uncompiled
+
+
+def main():
+    from PySide6.QtWidgets import QApplication
+    from soak_test import _init_soak_worker
+
+    _init_soak_worker()
+    app = QApplication.instance()
+    # The windows import this file as qss_compiler, and the build reads what they compiled there
+    import qss_compiler
+
+    qss_compiler.build()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
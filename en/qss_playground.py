@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+QSS Playground
+Setting the application stylesheet on every keystroke re-polishes every widget of the application each time,
+and most keystrokes leave a stylesheet that is not finished yet. QssPlayground edits the application stylesheet
+in a text editor: once typing pauses, the text is compiled by qss_compiler in the thread pool, and the compiled
+stylesheet is set on the application only if it compiled without diagnostics and differs from the one set last.
+Results that arrive after the text changed again are dropped, so typing never waits for a re-polish.
+
+Run directly, it types rules into the playground of the global styles window one character at a time, and
+reports the stylesheets set, the time to set them and the longest the GUI thread went without handling events,
+against setting the stylesheet on every keystroke.
+
+Usage:
+    python qss_playground.py
+    python qss_playground.py --interval 30 --offscreen
+    python -m doctest qss_playground.py    # check which stylesheets the playground sets
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import textwrap
+import time
+
+from PySide6.QtCore import QSignalBlocker, QTimer, Signal
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QPlainTextEdit, QPushButton, QVBoxLayout, QWidget
+
+from qss_compiler import compile_stylesheet
+from search_completion import TaskSignals, start_in_pool
+
+# Milliseconds without typing before the stylesheet is compiled
+PLAYGROUND_DELAY_MS = 300
+
+
+def _timed_compile(text):
+    """Return (compiled stylesheet, diagnostics, ms the compile took)
+
+    Text that is not a stylesheet yet, e.g. a half-typed rule, has diagnostics and is never set:
+
+    >>> _timed_compile('QPushButton { color: red; } garbage; QLabel { color: blue; }')[1]
+    ["line 1: invalid selector 'garbage; QLabel'", 'line 1: rule dropped, none of its selectors can match']
+    >>> _timed_compile('QPushButton { color: red; }')[1]
+    []
+    """
+    start = time.perf_counter()
+    compiled, diagnostics = compile_stylesheet(text)
+    return compiled, diagnostics, (time.perf_counter() - start) * 1000
+
+
+class QssPlayground(QWidget):
+    """Editor of the application stylesheet, which sets it once it compiles cleanly"""
+
+    # ms to set the stylesheet and repaint the window, and ms the compile took in the thread pool
+    applied = Signal(float, float)
+    # Diagnostics of a stylesheet that was not set
+    rejected = Signal(list)
+    # The text compiled to the stylesheet set last, so nothing was re-polished
+    unchanged = Signal()
+
+    def __init__(self, parent=None, delay=PLAYGROUND_DELAY_MS):
+        super().__init__(parent)
+        # Restored by the reset button
+        self.original = QApplication.instance().styleSheet()
+        # Compiled stylesheet set last, None while it is one the playground did not compile
+        self._applied = None
+        # Bumped on every edit, results of older generations are stale
+        self._generation = 0
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.editor = QPlainTextEdit()
+        self.editor.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.editor.setPlainText(textwrap.dedent(self.original).strip())
+        layout.addWidget(self.editor)
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.reset_button = QPushButton('Reset Stylesheet')
+        self.reset_button.clicked.connect(self.reset)
+        button_layout.addWidget(self.reset_button)
+        layout.addLayout(button_layout)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._submit)
+        self._signals = TaskSignals(self)
+        self._signals.finished.connect(self._deliver)
+        self.editor.textChanged.connect(self._schedule)
+
+    def reset(self):
+        """Restore the stylesheet the application had when the playground was created"""
+        self._generation += 1
+        self._timer.stop()
+        blocker = QSignalBlocker(self.editor)
+        self.editor.setPlainText(textwrap.dedent(self.original).strip())
+        blocker.unblock()
+        QApplication.instance().setStyleSheet(self.original)
+        self._applied = None
+
+    def _schedule(self):
+        self._generation += 1
+        self._timer.start()
+
+    def _submit(self):
+        start_in_pool(self._signals, self._generation, _timed_compile, self.editor.toPlainText())
+
+    def _deliver(self, generation, result):
+        if generation != self._generation:
+            return
+        if isinstance(result, Exception):
+            self.rejected.emit([f"compiling failed: {result}"])
+            return
+        compiled, diagnostics, compile_ms = result
+        if diagnostics:
+            self.rejected.emit(diagnostics)
+            return
+        # e.g. an edited comment, which compiles away
+        if compiled == self._applied:
+            self.unchanged.emit()
+            return
+        start = time.perf_counter()
+        QApplication.instance().setStyleSheet(compiled)
+        self._applied = compiled
+        self.window().repaint()
+        self.applied.emit((time.perf_counter() - start) * 1000, compile_ms)
+
+
+# Rules the benchmark types after the stylesheet of the global styles window
+BENCHMARK_RULES = """
+QPushButton#specialButton {
+    background-color: #9C27B0;
+    border-radius: 12px;
+}
+QLabel {
+    color: #5D4037;
+}
+"""
+
+
+def _type_rules(playground, interval, on_change=None):
+    """Type BENCHMARK_RULES at the end of the editor, a character per interval ms, and return the longest stall"""
+    from PySide6.QtCore import QEventLoop
+    from PySide6.QtGui import QTextCursor
+
+    editor = playground.editor
+    cursor = editor.textCursor()
+    cursor.movePosition(QTextCursor.End)
+    editor.setTextCursor(cursor)
+    characters = list(BENCHMARK_RULES)
+    loop = QEventLoop()
+    # The longest gap between ticks of a 10 ms timer is the longest the GUI thread was busy
+    ticks = [time.perf_counter()]
+    longest_gap = [0.0]
+
+    def tick():
+        now = time.perf_counter()
+        longest_gap[0] = max(longest_gap[0], now - ticks[0])
+        ticks[0] = now
+
+    def type_character():
+        if not characters:
+            typing.stop()
+            # Time for the last edit to be compiled and set
+            QTimer.singleShot(PLAYGROUND_DELAY_MS + 200, loop.quit)
+            return
+        editor.insertPlainText(characters.pop(0))
+        if on_change is not None:
+            on_change()
+
+    ticker = QTimer()
+    ticker.setInterval(10)
+    ticker.timeout.connect(tick)
+    typing = QTimer()
+    typing.setInterval(interval)
+    typing.timeout.connect(type_character)
+    ticks[0] = time.perf_counter()
+    ticker.start()
+    typing.start()
+    loop.exec()
+    ticker.stop()
+    return longest_gap[0] * 1000
+
+
+def benchmark(interval):
+    """Print the stylesheets set and the GUI stalls of typing rules into the playground, and on every keystroke"""
+    from PySide6.QtCore import qInstallMessageHandler
+    from global_styles import GlobalStylesWindow, setup_global_stylesheet
+
+    app = QApplication.instance()
+    setup_global_stylesheet(app)
+    window = GlobalStylesWindow()
+    window.show()
+    window.tab_widget.setCurrentWidget(window.playground_tab)
+    app.processEvents()
+    playground = window.playground
+
+    applies = []
+    rejected = []
+    playground.applied.connect(lambda ms, compile_ms: applies.append(ms))
+    playground.rejected.connect(rejected.append)
+    stall = _type_rules(playground, interval)
+    print(f"{len(BENCHMARK_RULES)} keystrokes every {interval} ms; stylesheets set, median / max / total ms "
+          f"setting them, longest GUI stall")
+    print(f"    playground      {len(applies):4} set {statistics.median(applies or [0]):7.2f} / "
+          f"{max(applies or [0]):7.2f} / {sum(applies):8.1f} ms  stall {stall:6.1f} ms  "
+          f"({len(rejected)} edits not compiling)")
+
+    # Every keystroke sets the text as it is, the way a textChanged slot calling setStyleSheet would
+    playground.reset()
+    playground.editor.textChanged.disconnect(playground._schedule)
+    applies.clear()
+
+    def apply_now():
+        start = time.perf_counter()
+        app.setStyleSheet(playground.editor.toPlainText())
+        window.repaint()
+        applies.append((time.perf_counter() - start) * 1000)
+
+    # Most keystrokes leave a stylesheet Qt warns it can't parse
+    qInstallMessageHandler(lambda *args: None)
+    stall = _type_rules(playground, interval, apply_now)
+    qInstallMessageHandler(None)
+    print(f"    every keystroke {len(applies):4} set {statistics.median(applies):7.2f} / "
+          f"{max(applies):7.2f} / {sum(applies):8.1f} ms  stall {stall:6.1f} ms")
+    window.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark typing into the QSS playground of the global styles")
+    parser.add_argument("--interval", type=int, default=50, help="milliseconds between keystrokes")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    app = QApplication(sys.argv)
+    benchmark(args.interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+QSS Hot Reload
+Every gallery style is a stylesheet string in the source of its window, so trying another color means editing
+code and restarting the window. export() writes every stylesheet the windows set, in every style state, to a
+.qss file of its own under qss/<window>/, with an index of which stylesheet each file replaces. A window with
+install_qss_reload() then takes its stylesheets from those files, whenever it sets one, and watches them: once a
+file stops changing for a moment it is read and compiled by qss_compiler in the thread pool, and set on only the
+widgets that use it, so only they and their children are re-polished. The status bar shows the time from the
+reload to the repaint and the declarations the compiler dropped, which are printed too.
+
+Usage:
+    python qss_reload.py --export            # write the stylesheets of every window to qss/
+    python qss_reload.py button              # open the button window with its stylesheets reloading from qss/
+    python qss_reload.py --benchmark --offscreen
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import re
+import statistics
+import sys
+import textwrap
+import time
+
+from PySide6.QtCore import QEvent, QFileSystemWatcher, QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication, QWidget
+
+from qss_compiler import compile_stylesheet, source_hash
+from search_completion import run_in_pool
+
+QSS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qss")
+INDEX_FILE = "index.json"
+# Milliseconds a file has to stay unchanged before it is reloaded, editors often write a file in several steps
+RELOAD_DELAY_MS = 150
+# Dynamic property holding the hash of the stylesheet a widget's file replaced
+SOURCE_PROPERTY = "qssSource"
+
+
+def _slug(text):
+    return re.sub(r"\W+", "-", text).strip("-").lower() or "style"
+
+
+def _text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def export(directory=QSS_DIR, force=False):
+    """Write every stylesheet of every window state to a .qss file, and return {window: files written}
+
+    The windows whose directory already has an index are kept, with the edits in their files, unless force is set.
+    """
+    import qss_compiler
+
+    # Window: {stylesheet hash: (file name, stylesheet)}, in the order the walk meets them
+    windows = {}
+
+    def report(key, state, widget, stylesheet):
+        if not stylesheet:
+            return
+        stylesheets = windows.setdefault(key.split("/")[-1], {})
+        key_hash = source_hash(stylesheet)
+        if key_hash in stylesheets:
+            return
+        target = "application" if isinstance(widget, QApplication) else widget.objectName() or type(widget).__name__
+        stylesheets[key_hash] = (f"{len(stylesheets):02d}-{_slug(state)}-{_slug(target)}.qss", stylesheet)
+
+    qss_compiler._walk_windows(report)
+    # Compiled stylesheets are written as the source they were compiled from, which reads better
+    sources = {qss_compiler.compiled_stylesheet(source): source for source in qss_compiler._requested.values()}
+
+    written = {}
+    for window, stylesheets in windows.items():
+        window_dir = os.path.join(directory, window)
+        if os.path.exists(os.path.join(window_dir, INDEX_FILE)) and not force:
+            continue
+        os.makedirs(window_dir, exist_ok=True)
+        index = {}
+        for key_hash, (filename, stylesheet) in stylesheets.items():
+            text = textwrap.dedent(sources.get(stylesheet, stylesheet)).strip() + "\n"
+            with open(os.path.join(window_dir, filename), "w", encoding="utf-8") as qss_file:
+                qss_file.write(text)
+            index[filename] = {"source": key_hash, "exported": _text_hash(text)}
+        with open(os.path.join(window_dir, INDEX_FILE), "w", encoding="utf-8") as index_file:
+            json.dump(index, index_file, indent=1)
+        written[window] = len(index)
+    return written
+
+
+def _load(path):
+    """Return (text hash, compiled stylesheet, diagnostics) of a .qss file, None if it can't be read"""
+    try:
+        with open(path, encoding="utf-8") as qss_file:
+            text = qss_file.read()
+    except OSError:
+        return None
+    compiled, diagnostics = compile_stylesheet(text)
+    return _text_hash(text), compiled, diagnostics
+
+
+class QssReloader(QObject):
+    """Takes the stylesheets of a window from the files export() wrote, and reloads them when they change"""
+
+    # File name, ms from the reload to the repaint, widgets re-polished and the compiler's diagnostics
+    reloaded = Signal(str, float, int, list)
+
+    def __init__(self, window, directory):
+        super().__init__(window)
+        self.window = window
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_FILE), encoding="utf-8") as index_file:
+            index = json.load(index_file)
+        # File name: hash of the stylesheet it replaces
+        self._sources = {filename: entry["source"] for filename, entry in index.items()}
+        # Stylesheet hash: compiled stylesheet of its file, for the files edited since they were exported
+        self._overrides = {}
+        for filename, entry in index.items():
+            loaded = _load(os.path.join(directory, filename))
+            if loaded is not None and loaded[0] != entry["exported"]:
+                self._overrides[entry["source"]] = loaded[1]
+        self._changed = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(RELOAD_DELAY_MS)
+        self._timer.timeout.connect(self._reload)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.addPaths([os.path.join(directory, filename) for filename in self._sources])
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        # Every widget that sets a stylesheet is told with a StyleChange event, e.g. on switching styles
+        QApplication.instance().installEventFilter(self)
+        self._apply(QApplication.instance())
+        for widget in [window] + window.findChildren(QWidget):
+            self._apply(widget)
+
+    def _apply(self, target):
+        """Replace the stylesheet of a widget, or of the application, by its file if that was edited"""
+        stylesheet = target.styleSheet()
+        if not stylesheet or not self._overrides:
+            return
+        key_hash = source_hash(stylesheet)
+        override = self._overrides.get(key_hash)
+        if override is not None and override != stylesheet:
+            target.setProperty(SOURCE_PROPERTY, key_hash)
+            target.setStyleSheet(override)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.StyleChange and isinstance(watched, QWidget):
+            self._apply(watched)
+        return False
+
+    def _on_file_changed(self, path):
+        self._changed.add(os.path.basename(path))
+        self._timer.start()
+
+    def _reload(self):
+        start = time.perf_counter()
+        for filename in sorted(self._changed):
+            path = os.path.join(self.directory, filename)
+            # Editors that save by replacing the file drop it from the watcher
+            if path not in self._watcher.files() and os.path.exists(path):
+                self._watcher.addPath(path)
+            run_in_pool(self, _load, lambda loaded, filename=filename: self._on_loaded(filename, start, loaded), path)
+        self._changed.clear()
+
+    def _on_loaded(self, filename, start, loaded):
+        # A file that can't be read or compiled keeps the stylesheets it had
+        if loaded is None or isinstance(loaded, Exception):
+            return
+        _, compiled, diagnostics = loaded
+        source = self._sources[filename]
+        previous = self._overrides.get(source)
+        if compiled == previous:
+            return
+        self._overrides[source] = compiled
+
+        # The widgets that set the stylesheet of the file, by the original or by an earlier version of the file
+        app = QApplication.instance()
+        targets = [
+            target for target in [app, self.window] + self.window.findChildren(QWidget)
+            if source_hash(target.styleSheet()) == source
+            or (previous is not None and target.property(SOURCE_PROPERTY) == source
+                and target.styleSheet() == previous)
+        ]
+        for target in targets:
+            target.setProperty(SOURCE_PROPERTY, source)
+            target.setStyleSheet(compiled)
+        # The overview's thumbnails show the stylesheets as they were
+        overview = getattr(self.window, "style_overview", None)
+        if overview is not None:
+            overview.invalidate()
+        self.window.repaint()
+        self.reloaded.emit(filename, (time.perf_counter() - start) * 1000, len(targets), diagnostics)
+
+
+def install_qss_reload(window, directory=None):
+    """Take the stylesheets of a gallery window from its files under qss/, reloaded as they change
+
+    Returns the QssReloader, whose reloaded signal the status bar of the window follows.
+    """
+    if directory is None:
+        # qss/button_styles for the window of button_styles.py, however the file was imported
+        window_file = inspect.getfile(type(window))
+        directory = os.path.join(QSS_DIR, os.path.splitext(os.path.basename(window_file))[0])
+    reloader = QssReloader(window, directory)
+    switcher = getattr(window, "locale_switcher", None)
+    text = switcher.text if switcher is not None else (lambda source: source)
+
+    def show(filename, ms, count, diagnostics):
+        for diagnostic in diagnostics:
+            print(f"{filename}: {diagnostic}")
+        window.statusBar().showMessage(
+            text("Reloaded {file} in {ms:.1f} ms: {count} widgets re-polished, {dropped} declarations dropped").format(
+                file=filename, ms=ms, count=count, dropped=len(diagnostics)))
+
+    reloader.reloaded.connect(show)
+    return reloader
+
+
+def _wait_for_reload(reloader, timeout_ms=5000):
+    """Run the event loop until reloader reports a reload, and return its (ms, widgets re-polished)"""
+    from PySide6.QtCore import QEventLoop
+
+    loop = QEventLoop()
+    result = []
+
+    def reloaded(filename, ms, count, diagnostics):
+        result.append((ms, count))
+        loop.quit()
+
+    reloader.reloaded.connect(reloaded)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    reloader.reloaded.disconnect(reloaded)
+    return result[0] if result else None
+
+
+def benchmark(runs):
+    """Print the reload-to-repaint latency of editing each stylesheet a window shows, for every window"""
+    import shutil
+    import tempfile
+    from PySide6.QtCore import QThreadPool
+    from render_snapshots import create_window, discover_windows
+
+    app = QApplication.instance()
+    directory = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        export(directory)
+        print(f"exported in {time.perf_counter() - start:.1f} s; {runs} edits per file, "
+              f"median / max ms from reload to repaint, widgets re-polished of all widgets")
+        for path in discover_windows(os.path.dirname(os.path.abspath(__file__))):
+            window = create_window(path)
+            window.show()
+            # Work a window starts in the thread pool would be measured as reload latency
+            QThreadPool.globalInstance().waitForDone()
+            app.processEvents()
+            name = os.path.splitext(os.path.basename(path))[0]
+            reloader = QssReloader(window, os.path.join(directory, name))
+            widgets = [window] + window.findChildren(QWidget)
+            shown = {source_hash(widget.styleSheet()) for widget in widgets if widget.styleSheet()}
+            latencies = []
+            counts = []
+            for filename, source in reloader._sources.items():
+                if source not in shown:
+                    continue
+                qss_path = os.path.join(reloader.directory, filename)
+                with open(qss_path, encoding="utf-8") as qss_file:
+                    original = qss_file.read()
+                for run in range(runs):
+                    # A change that keeps the stylesheet valid: a rule that matches nothing, or for a widget's
+                    # declarations without a selector, a tool tip
+                    if "{" in original:
+                        probe = original + f"QWidget#qssReloadProbe{run}{{color:red}}\n"
+                    else:
+                        declarations = original.rstrip()
+                        separator = ";" if declarations and not declarations.endswith(";") else ""
+                        probe = f'{declarations}{separator}\nqproperty-toolTip: "qssReloadProbe{run}";\n'
+                    with open(qss_path, "w", encoding="utf-8") as qss_file:
+                        qss_file.write(probe)
+                    result = _wait_for_reload(reloader)
+                    if result is not None:
+                        latencies.append(result[0])
+                        counts.append(result[1])
+            if latencies:
+                print(f"    {name:22} {len(latencies) // runs:3} files {statistics.median(latencies):7.2f} / "
+                      f"{max(latencies):7.2f} ms  {statistics.mean(counts):5.1f} of {len(widgets)} widgets")
+            window.close()
+            window.deleteLater()
+            app.sendPostedEvents(None, QEvent.DeferredDelete)
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reload the stylesheets of gallery windows from .qss files")
+    parser.add_argument("window", nargs="?", help="window to open, e.g. button for button_styles.py")
+    parser.add_argument("--export", action="store_true", help="write the stylesheets of every window to qss/")
+    parser.add_argument("--force", action="store_true", help="overwrite windows exported before, edits included")
+    parser.add_argument("--benchmark", action="store_true", help="measure reloading every window's stylesheets")
+    parser.add_argument("--runs", type=int, default=3, help="edits per stylesheet file when benchmarking")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen or args.export:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    app = QApplication(sys.argv)
+    if args.export:
+        written = export(force=args.force)
+        for window, count in written.items():
+            print(f"{window}: {count} stylesheets written to {os.path.join(QSS_DIR, window)}")
+        if not written:
+            print(f"every window was exported to {QSS_DIR} before, --force overwrites the files")
+        return 0
+    if args.benchmark:
+        benchmark(args.runs)
+        return 0
+    if not args.window:
+        parser.error("name a window to open, or --export or --benchmark")
+
+    from render_snapshots import create_window
+
+    name = args.window if args.window.endswith("_styles") else f"{args.window}_styles"
+    if not os.path.exists(os.path.join(QSS_DIR, name, INDEX_FILE)):
+        print(f"{os.path.join(QSS_DIR, name)} has no stylesheets yet, run: python qss_reload.py --export")
+        return 1
+    window = create_window(os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py"))
+    install_qss_reload(window)
+    window.show()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,9 @@ flat style, colored, custom size, and icon radio buttons.
 import sys
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,QRadioButton, QComboBox, QLabel
 from PySide6.QtCore import Qt
+from page_factory import LazyPageStack, styled_group_builder
+from locale_switcher import install_language_menu
+from style_overview import install_style_overview
 
 class RadioButtonStylesWindow(QMainWindow):
     """Main window for showcasing QRadioButton styles"""
@@ -28,7 +31,7 @@ class RadioButtonStylesWindow(QMainWindow):
         title_label = QLabel("QRadioButton Style Examples")
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
-        main_layout.addWidget(title_label)
+        main_layout.addWidget(title_label, 1)
         
         # Style selection combo box
         style_layout = QHBoxLayout()
@@ -59,32 +62,34 @@ class RadioButtonStylesWindow(QMainWindow):
         reset_layout.addStretch()
         main_layout.addLayout(reset_layout)
         
-        # Radio button container layout
-        self.radiobutton_layout = QVBoxLayout()
-        main_layout.addLayout(self.radiobutton_layout)
+        # Style pages, each built the first time its style is selected; a stacked widget always
+        # expands, so the title, pages and description share the spare height through equal stretch
+        self.radiobutton_pages = LazyPageStack()
+        main_layout.addWidget(self.radiobutton_pages, 1)
         
         # Info label for descriptions
         self.info_label = QLabel()
         self.info_label.setWordWrap(True)
         self.info_label.setStyleSheet("margin-top: 10px; padding: 8px; background-color: #f0f0f0; border-radius: 4px;")
-        main_layout.addWidget(self.info_label)
+        main_layout.addWidget(self.info_label, 1)
         
-        # Create all radio button groups
-        self._create_radiobutton_groups()
+        # Register a builder for every radio button group
+        self._register_radiobutton_groups()
         
         # Show the first style by default
         self.update_radiobutton_style(0)
-    
-    def _create_radiobutton_groups(self):
-        """Create all radio button groups with different styles"""
-        # 1. Basic Radio Button Style
-        basic_group = QWidget()
-        basic_layout = QVBoxLayout(basic_group)
         
-        self.basic_radio1 = QRadioButton("Option 1")
-        self.basic_radio2 = QRadioButton("Option 2")
-        self.basic_radio3 = QRadioButton("Option 3")
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combo.currentIndexChanged, self.info_label)
+        self.locale_switcher.follow(self.radiobutton_pages.page_built, self.radiobutton_pages)
         
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
+    
+    def _register_radiobutton_groups(self):
+        """Register the builders of all radio button groups with different styles"""
+        # 1. Basic Radio Button Style
         basic_style = """
             QRadioButton {
                 color: #333333;
@@ -114,23 +119,11 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.basic_radio1.setStyleSheet(basic_style)
-        self.basic_radio2.setStyleSheet(basic_style)
-        self.basic_radio3.setStyleSheet(basic_style)
-        
-        basic_layout.addWidget(self.basic_radio1)
-        basic_layout.addWidget(self.basic_radio2)
-        basic_layout.addWidget(self.basic_radio3)
-        self.radiobutton_layout.addWidget(basic_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Option 1", "Option 2", "Option 3"], basic_style)
+        )
         
         # 2. Filled Circle Radio Button Style
-        filled_group = QWidget()
-        filled_layout = QVBoxLayout(filled_group)
-        
-        self.filled_radio1 = QRadioButton("Option A")
-        self.filled_radio2 = QRadioButton("Option B")
-        self.filled_radio3 = QRadioButton("Option C")
-        
         filled_style = """
             QRadioButton {
                 color: #333333;
@@ -158,23 +151,11 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.filled_radio1.setStyleSheet(filled_style)
-        self.filled_radio2.setStyleSheet(filled_style)
-        self.filled_radio3.setStyleSheet(filled_style)
-        
-        filled_layout.addWidget(self.filled_radio1)
-        filled_layout.addWidget(self.filled_radio2)
-        filled_layout.addWidget(self.filled_radio3)
-        self.radiobutton_layout.addWidget(filled_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Option A", "Option B", "Option C"], filled_style)
+        )
         
         # 3. Square Radio Button Style
-        square_group = QWidget()
-        square_layout = QVBoxLayout(square_group)
-        
-        self.square_radio1 = QRadioButton("Choice X")
-        self.square_radio2 = QRadioButton("Choice Y")
-        self.square_radio3 = QRadioButton("Choice Z")
-        
         square_style = """
             QRadioButton {
                 color: #333333;
@@ -205,23 +186,11 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.square_radio1.setStyleSheet(square_style)
-        self.square_radio2.setStyleSheet(square_style)
-        self.square_radio3.setStyleSheet(square_style)
-        
-        square_layout.addWidget(self.square_radio1)
-        square_layout.addWidget(self.square_radio2)
-        square_layout.addWidget(self.square_radio3)
-        self.radiobutton_layout.addWidget(square_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Choice X", "Choice Y", "Choice Z"], square_style)
+        )
         
         # 4. Neon Effect Radio Button Style
-        neon_group = QWidget()
-        neon_layout = QVBoxLayout(neon_group)
-        
-        self.neon_radio1 = QRadioButton("Option One")
-        self.neon_radio2 = QRadioButton("Option Two")
-        self.neon_radio3 = QRadioButton("Option Three")
-        
         neon_style = """
             QRadioButton {
                 color: #00BCD4;
@@ -251,23 +220,11 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.neon_radio1.setStyleSheet(neon_style)
-        self.neon_radio2.setStyleSheet(neon_style)
-        self.neon_radio3.setStyleSheet(neon_style)
-        
-        neon_layout.addWidget(self.neon_radio1)
-        neon_layout.addWidget(self.neon_radio2)
-        neon_layout.addWidget(self.neon_radio3)
-        self.radiobutton_layout.addWidget(neon_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Option One", "Option Two", "Option Three"], neon_style)
+        )
         
         # 5. Flat Style Radio Button Style
-        flat_group = QWidget()
-        flat_layout = QVBoxLayout(flat_group)
-        
-        self.flat_radio1 = QRadioButton("Item 1")
-        self.flat_radio2 = QRadioButton("Item 2")
-        self.flat_radio3 = QRadioButton("Item 3")
-        
         flat_style = """
             QRadioButton {
                 color: #607D8B;
@@ -299,23 +256,11 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.flat_radio1.setStyleSheet(flat_style)
-        self.flat_radio2.setStyleSheet(flat_style)
-        self.flat_radio3.setStyleSheet(flat_style)
-        
-        flat_layout.addWidget(self.flat_radio1)
-        flat_layout.addWidget(self.flat_radio2)
-        flat_layout.addWidget(self.flat_radio3)
-        self.radiobutton_layout.addWidget(flat_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Item 1", "Item 2", "Item 3"], flat_style)
+        )
         
         # 6. Colored Radio Button Style
-        color_group = QWidget()
-        color_layout = QVBoxLayout(color_group)
-        
-        self.color_radio1 = QRadioButton("Red Option")
-        self.color_radio2 = QRadioButton("Green Option")
-        self.color_radio3 = QRadioButton("Blue Option")
-        
         # Red option
         color_red_style = """
             QRadioButton {
@@ -376,23 +321,11 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.color_radio1.setStyleSheet(color_red_style)
-        self.color_radio2.setStyleSheet(color_green_style)
-        self.color_radio3.setStyleSheet(color_blue_style)
-        
-        color_layout.addWidget(self.color_radio1)
-        color_layout.addWidget(self.color_radio2)
-        color_layout.addWidget(self.color_radio3)
-        self.radiobutton_layout.addWidget(color_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Red Option", "Green Option", "Blue Option"], [color_red_style, color_green_style, color_blue_style])
+        )
         
         # 7. Custom Size Radio Button Style
-        size_group = QWidget()
-        size_layout = QVBoxLayout(size_group)
-        
-        self.size_radio1 = QRadioButton("Small Size")
-        self.size_radio2 = QRadioButton("Standard Size")
-        self.size_radio3 = QRadioButton("Large Size")
-        
         # Small size
         small_style = """
             QRadioButton {
@@ -463,23 +396,11 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.size_radio1.setStyleSheet(small_style)
-        self.size_radio2.setStyleSheet(standard_style)
-        self.size_radio3.setStyleSheet(large_style)
-        
-        size_layout.addWidget(self.size_radio1)
-        size_layout.addWidget(self.size_radio2)
-        size_layout.addWidget(self.size_radio3)
-        self.radiobutton_layout.addWidget(size_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Small Size", "Standard Size", "Large Size"], [small_style, standard_style, large_style])
+        )
         
         # 8. Icon Radio Button Style
-        icon_group = QWidget()
-        icon_layout = QVBoxLayout(icon_group)
-        
-        self.icon_radio1 = QRadioButton("Icon Option 1")
-        self.icon_radio2 = QRadioButton("Icon Option 2")
-        self.icon_radio3 = QRadioButton("Icon Option 3")
-        
         icon_style = """
             QRadioButton {
                 color: #333333;
@@ -500,32 +421,19 @@ class RadioButtonStylesWindow(QMainWindow):
             }
         """
         
-        self.icon_radio1.setStyleSheet(icon_style)
-        self.icon_radio2.setStyleSheet(icon_style)
-        self.icon_radio3.setStyleSheet(icon_style)
-        
         # For simplicity, icons are not actually added here, but in a real application you could use:
         # icon = QIcon("path/to/icon.png")
-        # self.icon_radio1.setIcon(icon)
-        # self.icon_radio1.setIconSize(QSize(16, 16))
+        # radio.setIcon(icon)
+        # radio.setIconSize(QSize(16, 16))
         
-        icon_layout.addWidget(self.icon_radio1)
-        icon_layout.addWidget(self.icon_radio2)
-        icon_layout.addWidget(self.icon_radio3)
-        self.radiobutton_layout.addWidget(icon_group)
+        self.radiobutton_pages.register(
+            styled_group_builder(QRadioButton, ["Icon Option 1", "Icon Option 2", "Icon Option 3"], icon_style)
+        )
     
     def update_radiobutton_style(self, index):
         """Update the displayed radio button group style based on selection"""
-        # Hide all radio button groups
-        for i in range(self.radiobutton_layout.count()):
-            widget = self.radiobutton_layout.itemAt(i).widget()
-            if widget:
-                widget.hide()
-        
-        # Show the selected radio button group
-        selected_group = self.radiobutton_layout.itemAt(index).widget()
-        if selected_group:
-            selected_group.show()
+        # Show the selected radio button group, building it on first selection
+        self.radiobutton_pages.show_page(index)
         
         # Update description information
         descriptions = [
@@ -543,16 +451,9 @@ class RadioButtonStylesWindow(QMainWindow):
     def reset_selection(self):
         """Reset the selection state of all radio buttons"""
         if self.reset_btn.isChecked():
-            # Reset all radio buttons
+            # Reset the radio buttons of every group built so far
             radiobuttons = [
-                self.basic_radio1, self.basic_radio2, self.basic_radio3,
-                self.filled_radio1, self.filled_radio2, self.filled_radio3,
-                self.square_radio1, self.square_radio2, self.square_radio3,
-                self.neon_radio1, self.neon_radio2, self.neon_radio3,
-                self.flat_radio1, self.flat_radio2, self.flat_radio3,
-                self.color_radio1, self.color_radio2, self.color_radio3,
-                self.size_radio1, self.size_radio2, self.size_radio3,
-                self.icon_radio1, self.icon_radio2, self.icon_radio3
+                radio for page in self.radiobutton_pages.built_pages() for radio in page.findChildren(QRadioButton)
             ]
             
             for radio in radiobuttons:
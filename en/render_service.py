@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Local Render Service
+Design tools need thumbnails of a widget type in a gallery style, or in a stylesheet of their own, and
+starting a QApplication for each one takes longer than the rendering. This service keeps a pool of offscreen Qt
+worker processes, warmed up once: each opens every gallery window in every style state and keeps, per state
+and widget type, the stylesheets that apply to the widget showing it. Jobs arrive over a local socket, one JSON
+line each, and are answered with a JSON line and a PNG:
+
+    {"widget": "QPushButton", "style": "Linear Gradient", "size": [200, 60]}
+    {"widget": "QSlider", "qss": "QSlider::handle { background: red; }", "text": "unused"}
+    {"styles": true}                                 # the styles and widget types the workers know
+
+A job is rendered from its content, the widget type, stylesheet, size and text, and the PNG is cached on disk
+under the hash of that content, so a repeated job, or another job that comes down to the same content, is read
+from the cache instead of rendered.
+
+Usage:
+    python render_service.py serve --workers 4
+    python render_service.py render QPushButton --style "button/Linear Gradient" -o button.png
+    python render_service.py render QLineEdit --qss "QLineEdit { border: 2px solid red; }" --size 200x40
+    python render_service.py --benchmark
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+CACHE_DIR = "render_cache"
+# Largest width or height of a render, in pixels
+MAX_SIZE = 4096
+
+# Base types every widget shows, which a job for another type doesn't fall back to
+GENERIC_TYPES = ("QWidget", "QFrame", "QAbstractScrollArea")
+# The language menu and status bar of every window, which show no gallery style
+CHROME_TYPES = ("QMenuBar", "QMenu", "QStatusBar")
+# Longest widget text taken as the name of the style the widget shows
+MAX_NAME_LENGTH = 40
+# A widget text taken as a style name: words, not e.g. "Details ⋯" or "🔍 Search"
+_NAME_PATTERN = re.compile(r"[^\W\d_][\w '&+.,()-]*")
+
+# Style name: {widget type: render spec}, built by _init_render_worker in every worker process
+_catalog = {}
+
+
+def _window_name(key):
+    """Return the short name of a window key, e.g. 'button' for 'en/button_styles'"""
+    return key.split("/")[-1].rsplit("_styles", 1)[0]
+
+
+def _stylesheet_chain(widget):
+    """Return the stylesheets that apply to a widget, the application's first and its own last"""
+    from PySide6.QtWidgets import QApplication
+
+    own = widget.styleSheet()
+    ancestors = []
+    parent = widget.parentWidget()
+    while parent is not None:
+        # A stylesheet without selectors styles only the widget that set it
+        if "{" in parent.styleSheet():
+            ancestors.insert(0, parent.styleSheet())
+        parent = parent.parentWidget()
+    chain = [QApplication.instance().styleSheet()] + ancestors
+    chain.append(own if "{" in own or not own.strip() else f"* {{ {own} }}")
+    return [stylesheet for stylesheet in chain if stylesheet.strip()]
+
+
+def _dynamic_properties(widget):
+    """Return the plain dynamic properties of a widget, e.g. the class property class selectors match"""
+    properties = {}
+    for name in widget.dynamicPropertyNames():
+        name = bytes(name).decode()
+        # Qt's own properties, e.g. _q_styleSheetWidgetFont, are not the gallery's
+        if name.startswith("_q_"):
+            continue
+        try:
+            value = widget.property(name)
+        except RuntimeError:
+            # A type Python has no converter for
+            continue
+        if isinstance(value, (str, bool, int, float)):
+            properties[name] = value
+    return properties
+
+
+def _selector_row(window):
+    """Return the widgets of the layout holding a window's style selector, e.g. its label, which show no style"""
+    from render_snapshots import STYLE_SELECTOR_ATTRIBUTES
+
+    combobox = next((getattr(window, attribute) for attribute in STYLE_SELECTOR_ATTRIBUTES
+                     if hasattr(window, attribute)), None)
+    if combobox is None:
+        return []
+    layouts = [combobox.parentWidget().layout()]
+    while layouts:
+        layout = layouts.pop()
+        items = [layout.itemAt(position) for position in range(layout.count())]
+        widgets = [item.widget() for item in items if item.widget() is not None]
+        if combobox in widgets:
+            return widgets
+        layouts.extend(item.layout() for item in items if item.layout() is not None)
+    return [combobox]
+
+
+def _shown_style(key, state, widget):
+    """Return the names and render spec of the style a widget shows, or None for a widget that shows none"""
+    from PySide6.QtWidgets import QApplication, QWidget
+
+    if not isinstance(widget, QWidget) or widget.isWindow() or not widget.isVisible():
+        return None
+    parent = widget
+    while parent is not None:
+        if type(parent).__name__ in CHROME_TYPES:
+            return None
+        parent = parent.parentWidget()
+    # The widget that sets a stylesheet itself shows the style best, then the one nearest to one that does, and
+    # the widgets of windows styled by the application's stylesheet; widgets without any show no style
+    score = 2 if widget.styleSheet() else 1 if "{" in (widget.parentWidget().styleSheet() or "") else 0
+    if not score and "{" in QApplication.instance().styleSheet():
+        score = 1
+    if not score or widget in _selector_row(widget.window()):
+        return None
+    text = widget.text() if callable(getattr(widget, "text", None)) else ""
+    spec = {
+        "qss": "\n".join(_stylesheet_chain(widget)),
+        "object_name": widget.objectName(),
+        "properties": _dynamic_properties(widget),
+        "text": text if isinstance(text, str) else "",
+        "score": score,
+        "type": type(widget),
+    }
+    names = [f"{_window_name(key)}/{state}", state]
+    # Windows without a style selector show each style on a widget of its own, named by its text
+    text = spec["text"].strip()
+    if widget.styleSheet() and len(text) <= MAX_NAME_LENGTH and _NAME_PATTERN.fullmatch(text):
+        names += [f"{_window_name(key)}/{text}", text]
+    return names, spec
+
+
+def _register(key, shown):
+    """Keep the widgets of a window showing a style for their type and every base type, preferring widgets
+    with a stylesheet; shown maps each state of the window to the (names, spec) of its widgets"""
+    # Stylesheets every state shows, e.g. of a title label, belong to the window rather than to a style
+    fixed = set.intersection(*({spec["qss"] for names, spec in widgets} for widgets in shown.values()))
+    if len(shown) < 2:
+        fixed = set()
+    for widgets in shown.values():
+        for names, spec in widgets:
+            if spec["qss"] in fixed:
+                continue
+            entry = {name: value for name, value in spec.items() if name != "type"}
+            for name in names:
+                styles = _catalog.setdefault(name.lower(), {})
+                for cls in spec["type"].__mro__:
+                    if not cls.__name__.startswith("Q") or cls.__name__ in ("QObject", "QPaintDevice"):
+                        continue
+                    current = styles.get(cls.__name__)
+                    # The first window showing a state name keeps it, the window name tells the others apart
+                    if current is None or (current["window"] == key and current["score"] < spec["score"]):
+                        styles[cls.__name__] = dict(entry, window=key)
+
+
+def _init_render_worker(ready=None):
+    """Create the offscreen QApplication of a worker, learn the stylesheets of every gallery style, release ready"""
+    from soak_test import _init_soak_worker
+
+    _init_soak_worker()
+    from PySide6.QtWidgets import QApplication
+    from qss_compiler import _walk_windows
+
+    windows = {}
+
+    def collect(key, state, widget, stylesheet):
+        shown = _shown_style(key, state, widget)
+        widgets = windows.setdefault(key, {}).setdefault(state, [])
+        if shown is not None:
+            widgets.append(shown)
+
+    _walk_windows(collect)
+    for key, shown in windows.items():
+        _register(key, shown)
+    # Jobs bring their own stylesheets
+    QApplication.instance().setStyleSheet("")
+    # The first render loads the fonts and the style, once per worker
+    render_spec({"widget": "QPushButton", "qss": "", "text": "", "width": None, "height": None,
+                 "object_name": "", "properties": {}})
+    if ready is not None:
+        ready.release()
+
+
+def _start():
+    """Do nothing: warm_up() submits it only to make the pool spawn a worker, whose initializer warms it up"""
+
+
+def resolve(job):
+    """Return the render spec of a job: widget type, stylesheet, object name, properties, text and size"""
+    widget = job.get("widget", "QWidget")
+    if "qss" in job:
+        spec = {"qss": job["qss"], "object_name": job.get("object_name", ""), "properties": {}, "text": ""}
+    elif "style" in job:
+        styles = _catalog.get(str(job["style"]).lower())
+        if styles is None:
+            raise LookupError(f"unknown style {job['style']!r}")
+        # The nearest base type the style shows, e.g. QTableView for a QTableWidget
+        shown = next((cls.__name__ for cls in _widget_type(widget).__mro__ if cls.__name__ in styles), None)
+        if shown is None or (shown != widget and shown in GENERIC_TYPES):
+            raise LookupError(f"style {job['style']!r} shows no {widget}, only {', '.join(sorted(styles))}")
+        spec = {name: styles[shown][name] for name in ("qss", "object_name", "properties", "text")}
+    else:
+        spec = {"qss": "", "object_name": "", "properties": {}, "text": ""}
+    size = job.get("size") or [None, None]
+    if len(size) != 2 or any(value is not None and not 0 < int(value) <= MAX_SIZE for value in size):
+        raise ValueError(f"size must be [width, height] within 1 to {MAX_SIZE}, not {size!r}")
+    spec["widget"] = widget
+    spec["text"] = job.get("text", spec["text"]) or widget.lstrip("Q")
+    spec["width"], spec["height"] = (None if value is None else int(value) for value in size)
+    return spec
+
+
+def spec_hash(spec):
+    """Hash the content of a render spec, together with the Qt version that renders it"""
+    from PySide6 import __version__
+
+    content = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{__version__}\0{content}".encode("utf-8")).hexdigest()
+
+
+def _widget_type(name):
+    """Return the QtWidgets class of a widget type name"""
+    from PySide6 import QtWidgets
+
+    widget_type = getattr(QtWidgets, name, None)
+    if not isinstance(widget_type, type) or not issubclass(widget_type, QtWidgets.QWidget):
+        raise LookupError(f"unknown widget type {name!r}")
+    return widget_type
+
+
+def _populate(widget, text, horizontal):
+    """Give a new widget sample content, so that a thumbnail shows its items, values and text"""
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import (QAbstractSlider, QComboBox, QListWidget, QProgressBar, QTableWidget,
+                                   QTableWidgetItem, QTabWidget, QTreeWidget, QTreeWidgetItem, QWidget)
+
+    if isinstance(widget, QComboBox):
+        widget.addItems([text, "Option 2", "Option 3"])
+    elif isinstance(widget, QTabWidget):
+        for index in range(3):
+            widget.addTab(QWidget(), f"{text} {index + 1}")
+    elif isinstance(widget, QListWidget):
+        widget.addItems([f"{text} {index + 1}" for index in range(5)])
+    elif isinstance(widget, QTableWidget):
+        widget.setRowCount(4)
+        widget.setColumnCount(3)
+        for row in range(4):
+            for column in range(3):
+                widget.setItem(row, column, QTableWidgetItem(f"{text} {row + 1}.{column + 1}"))
+    elif isinstance(widget, QTreeWidget):
+        widget.setHeaderLabels([text])
+        for index in range(3):
+            item = QTreeWidgetItem(widget, [f"{text} {index + 1}"])
+            QTreeWidgetItem(item, [f"{text} {index + 1}.1"])
+        widget.expandAll()
+    elif isinstance(widget, (QAbstractSlider, QProgressBar)):
+        if hasattr(widget, "setOrientation"):
+            widget.setOrientation(Qt.Horizontal if horizontal else Qt.Vertical)
+        widget.setRange(0, 100)
+        widget.setValue(60)
+    elif hasattr(widget, "setPlainText"):
+        widget.setPlainText(text)
+    elif hasattr(widget, "setText"):
+        widget.setText(text)
+
+
+def render_spec(spec):
+    """Render a spec to PNG bytes"""
+    from PySide6.QtCore import QBuffer, QByteArray, QEvent, QIODevice
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    widget = _widget_type(spec["widget"])()
+    try:
+        widget.setObjectName(spec["object_name"])
+        for name, value in spec["properties"].items():
+            widget.setProperty(name, value)
+        width, height = spec["width"], spec["height"]
+        _populate(widget, spec["text"], width is None or height is None or width >= height)
+        widget.setStyleSheet(spec["qss"])
+        widget.ensurePolished()
+        hint = widget.sizeHint()
+        widget.resize(width or max(hint.width(), 1), height or max(hint.height(), 1))
+        # Shown on the offscreen platform, so that e.g. the tab bar of a tab widget is laid out
+        widget.show()
+        app.processEvents()
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        widget.grab().save(buffer, "PNG")
+        return bytes(data)
+    finally:
+        widget.close()
+        widget.deleteLater()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def render_job(job, cache_dir):
+    """Render a job into the cache unless its content is there already, and return (hash, rendered)"""
+    spec = resolve(job)
+    key = spec_hash(spec)
+    path = os.path.join(cache_dir, f"{key}.png")
+    if os.path.exists(path):
+        return key, False
+    png = render_spec(spec)
+    # Written under a temporary name first, so no reader sees half a file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as png_file:
+        png_file.write(png)
+    os.replace(temporary, path)
+    return key, True
+
+
+def list_styles():
+    """Return {style name: widget types showing it} of the gallery styles a worker knows"""
+    return {name: sorted(styles) for name, styles in sorted(_catalog.items())}
+
+
+class RenderService:
+    """A pool of warmed-up render workers in front of a content-hash cache of PNGs"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, cache_dir=CACHE_DIR):
+        self.workers = workers
+        self.cache_dir = os.path.abspath(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Canonical JSON of a job: hash of its content, so a repeated job never reaches a worker
+        self._hashes = {}
+        self._lock = threading.Lock()
+        self._styles = None
+        # Held while a pool broken by a dead worker is replaced
+        self._pool_lock = threading.Lock()
+        self._start_pool()
+
+    def _start_pool(self):
+        # Spawned workers start clean instead of inheriting Qt state from a fork
+        context = multiprocessing.get_context("spawn")
+        # Released by every worker once it is warm
+        self._ready = context.Semaphore(0)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                        initializer=_init_render_worker, initargs=(self._ready,))
+
+    def warm_up(self):
+        """Start every worker, and return once all of them are warm"""
+        # A job submitted while no started worker is idle starts another one
+        starts = [self.pool.submit(_start) for _ in range(self.workers)]
+        for _ in range(self.workers):
+            while not self._ready.acquire(timeout=0.1):
+                # A worker that died warming up breaks the pool, which would never be released
+                for start in starts:
+                    if start.done():
+                        start.result()
+
+    def _run(self, function, *args):
+        """Return function(*args) run by a worker; a job that found the pool broken is retried once in a new one"""
+        pool = self.pool
+        try:
+            return pool.submit(function, *args).result()
+        except BrokenProcessPool:
+            self._replace_pool(pool)
+            return self.pool.submit(function, *args).result()
+
+    def _replace_pool(self, broken):
+        """Replace a broken pool by a warmed-up one, unless another job already did"""
+        with self._pool_lock:
+            if self.pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._start_pool()
+                self.warm_up()
+
+    def render(self, job):
+        """Return (PNG bytes, whether it came from the cache) of a job"""
+        request = json.dumps(job, sort_keys=True)
+        with self._lock:
+            key = self._hashes.get(request)
+        path = os.path.join(self.cache_dir, f"{key}.png")
+        cached = key is not None and os.path.exists(path)
+        if not cached:
+            key, rendered = self._run(render_job, job, self.cache_dir)
+            cached = not rendered
+            path = os.path.join(self.cache_dir, f"{key}.png")
+            with self._lock:
+                self._hashes[request] = key
+        with open(path, "rb") as png_file:
+            return png_file.read(), cached
+
+    def styles(self):
+        if self._styles is None:
+            self._styles = self._run(list_styles)
+        return self._styles
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answers each JSON line of a connection with a JSON line, followed by "size" bytes of PNG"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            start = time.perf_counter()
+            png = b""
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError("a job is a JSON object")
+                if job.get("styles"):
+                    header = {"ok": True, "styles": self.server.service.styles()}
+                else:
+                    png, cached = self.server.service.render(job)
+                    header = {"ok": True, "cached": cached}
+            except Exception as error:
+                header = {"ok": False, "error": str(error) or type(error).__name__}
+            header.update(size=len(png), ms=round((time.perf_counter() - start) * 1000, 2))
+            self.wfile.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n" + png)
+
+
+class RenderServer(socketserver.ThreadingTCPServer):
+    """Local socket server of a RenderService, each connection on a thread of its own"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, service, port=DEFAULT_PORT):
+        # Only this machine can connect
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.service = service
+
+
+class RenderClient:
+    """Connection to a render service, sending jobs one after another"""
+
+    def __init__(self, port=DEFAULT_PORT, host="127.0.0.1"):
+        self.socket = socket.create_connection((host, port))
+        self.reader = self.socket.makefile("rb")
+
+    def request(self, job):
+        """Send a job and return (header, PNG bytes); raises RuntimeError with the service's error"""
+        self.socket.sendall(json.dumps(job).encode("utf-8") + b"\n")
+        header = json.loads(self.reader.readline())
+        png = self.reader.read(header["size"])
+        if not header["ok"]:
+            raise RuntimeError(header["error"])
+        return header, png
+
+    def close(self):
+        self.reader.close()
+        self.socket.close()
+
+
+def _start_in_thread(workers, cache_dir):
+    """Start a service on a free port in a thread of this process, and return (server, port)"""
+    service = RenderService(workers, cache_dir)
+    service.warm_up()
+    server = RenderServer(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+
+# Script the benchmark runs per job to time what the service replaces: a process and a QApplication per render
+_COLD_RENDER = """
+import os
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+from PySide6.QtWidgets import QApplication, QPushButton
+app = QApplication([])
+button = QPushButton("PushButton")
+button.setStyleSheet("QPushButton { background: #2196F3; color: white; border-radius: 4px; }")
+button.resize(200, 60)
+button.grab().save(os.devnull, "PNG")
+"""
+
+
+def benchmark(workers, runs):
+    """Print the latency of rendering through a warm service, cached and not, against a process per render"""
+    import shutil
+    import statistics
+    import tempfile
+
+    cold = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", _COLD_RENDER], check=True, stderr=subprocess.DEVNULL)
+        cold.append((time.perf_counter() - start) * 1000)
+
+    cache_dir = tempfile.mkdtemp(prefix="render-cache-")
+    start = time.perf_counter()
+    server, port = _start_in_thread(workers, cache_dir)
+    warm_up = time.perf_counter() - start
+    client = RenderClient(port)
+    try:
+        styles = client.request({"styles": True})[0]["styles"]
+        # A widget type of each of the first styles, under distinct sizes so that every job is rendered
+        jobs = [
+            {"widget": widgets[-1], "style": name, "size": [160 + index, 48]}
+            for index, (name, widgets) in enumerate(
+                (name, [widget for widget in widgets if widget not in GENERIC_TYPES])
+                for name, widgets in styles.items() if "/" in name)
+            if widgets
+        ][:runs * 10]
+        rendered = []
+        for job in jobs:
+            start = time.perf_counter()
+            client.request(job)
+            rendered.append((time.perf_counter() - start) * 1000)
+        cached = []
+        for job in jobs:
+            start = time.perf_counter()
+            header, _ = client.request(job)
+            cached.append((time.perf_counter() - start) * 1000)
+            assert header["cached"]
+    finally:
+        client.close()
+        server.shutdown()
+        server.service.close()
+        shutil.rmtree(cache_dir)
+
+    print(f"{workers} workers warm in {warm_up:.1f} s, {len(styles)} style names; median / max ms per render")
+    print(f"    process per render  {statistics.median(cold):8.2f} / {max(cold):8.2f}   ({runs} renders)")
+    print(f"    warm service        {statistics.median(rendered):8.2f} / {max(rendered):8.2f}   ({len(jobs)} jobs)")
+    print(f"    cached              {statistics.median(cached):8.2f} / {max(cached):8.2f}   ({len(jobs)} jobs)")
+
+
+def _parse_size(text):
+    width, _, height = text.lower().partition("x")
+    return [int(width), int(height)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render gallery styles and stylesheets to PNG over a local socket")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="local port of the service")
+    parser.add_argument("--benchmark", action="store_true", help="time renders through the service")
+    parser.add_argument("--runs", type=int, default=5, help="renders timed per measurement when benchmarking")
+    commands = parser.add_subparsers(dest="command")
+    serve = commands.add_parser("serve", help="run the service")
+    serve.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help="number of worker processes")
+    serve.add_argument("--cache", default=CACHE_DIR, help="directory of the rendered PNGs")
+    render = commands.add_parser("render", help="render a job through a running service")
+    render.add_argument("widget", help="widget type, e.g. QPushButton")
+    render.add_argument("--style", help="gallery style name, e.g. 'Linear Gradient' or 'button/Linear Gradient'")
+    render.add_argument("--qss", help="stylesheet to render the widget with instead of a style")
+    render.add_argument("--text", help="text of the widget")
+    render.add_argument("--size", type=_parse_size, help="WIDTHxHEIGHT, the size hint of the widget if omitted")
+    render.add_argument("-o", "--output", help="PNG file to write, WIDGET.png if omitted")
+    commands.add_parser("styles", help="list the styles a running service knows")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(DEFAULT_WORKERS, args.runs)
+        return 0
+    if args.command == "serve":
+        service = RenderService(args.workers, args.cache)
+        start = time.perf_counter()
+        service.warm_up()
+        print(f"{args.workers} workers warm in {time.perf_counter() - start:.1f} s, "
+              f"listening on 127.0.0.1:{args.port}, caching in {service.cache_dir}")
+        with RenderServer(service, args.port) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                service.close()
+        return 0
+    if args.command is None:
+        parser.error("name a command, or --benchmark")
+
+    client = RenderClient(args.port)
+    try:
+        if args.command == "styles":
+            for name, widgets in client.request({"styles": True})[0]["styles"].items():
+                print(f"{name}: {', '.join(widgets)}")
+            return 0
+        job = {"widget": args.widget}
+        for name in ("style", "qss", "text", "size"):
+            if getattr(args, name) is not None:
+                job[name] = getattr(args, name)
+        try:
+            header, png = client.request(job)
+        except RuntimeError as error:
+            print(f"render failed: {error}")
+            return 1
+    finally:
+        client.close()
+    output = args.output or f"{args.widget}.png"
+    with open(output, "wb") as png_file:
+        png_file.write(png)
+    print(f"{output}: {len(png)} bytes in {header['ms']:.1f} ms{' from the cache' if header['cached'] else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
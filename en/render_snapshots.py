@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Offscreen Style Snapshot Renderer
+This tool loads every *_styles.py window under the offscreen platform, walks every index of its style
+selector and saves each state as a PNG. Windows are rendered in parallel across a process pool, and a state
+is only re-rendered when the hash of its applied stylesheets changed since the last run.
+
+Usage:
+    python render_snapshots.py                       # render the windows next to this file
+    python render_snapshots.py ../en ../zh -o snapshots --workers 4
+"""
+
+import argparse
+import glob
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+MANIFEST_NAME = "manifest.json"
+
+# Attribute names the gallery windows use for their style selector
+STYLE_SELECTOR_ATTRIBUTES = ("style_combobox", "style_combo")
+
+# QApplication of a worker process, created once by _init_worker
+_app = None
+
+
+def discover_windows(directory):
+    """Return the paths of all *_styles.py gallery windows in a directory"""
+    return sorted(glob.glob(os.path.join(os.path.abspath(directory), "*_styles.py")))
+
+
+def window_key(path):
+    """Return the manifest key of a window file, e.g. 'en/button_styles'"""
+    directory, filename = os.path.split(os.path.abspath(path))
+    return f"{os.path.basename(directory)}/{os.path.splitext(filename)[0]}"
+
+
+def load_window_module(path):
+    """Import a gallery window file under a unique module name"""
+    directory = os.path.dirname(os.path.abspath(path))
+    # Helper modules such as locale_switcher live next to the window files
+    if directory in sys.path:
+        sys.path.remove(directory)
+    sys.path.insert(0, directory)
+
+    module_name = window_key(path).replace("/", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_window_class(module):
+    """Return the *StylesWindow class defined by a gallery module"""
+    for name, value in vars(module).items():
+        if name.endswith("StylesWindow") and isinstance(value, type) and value.__module__ == module.__name__:
+            return value
+    raise LookupError(f"{module.__name__} defines no *StylesWindow class")
+
+
+def create_window(path):
+    """Create the window of a gallery file, with the global stylesheet it expects if it has one"""
+    from PySide6.QtWidgets import QApplication
+
+    module = load_window_module(path)
+    app = QApplication.instance()
+    app.setStyleSheet("")
+    if hasattr(module, "setup_global_stylesheet"):
+        module.setup_global_stylesheet(app)
+    return find_window_class(module)()
+
+
+def style_states(window):
+    """Return the (name, activate) pairs of every style state a window can show"""
+    for attribute in STYLE_SELECTOR_ATTRIBUTES:
+        combobox = getattr(window, attribute, None)
+        if combobox is not None:
+            return [
+                (combobox.itemText(index), lambda index=index: combobox.setCurrentIndex(index))
+                for index in range(combobox.count())
+            ]
+
+    # Windows without a style selector show their styles on tabs, or all at once
+    tab_widget = getattr(window, "tab_widget", None)
+    if tab_widget is not None:
+        return [
+            (tab_widget.tabText(index), lambda index=index: tab_widget.setCurrentIndex(index))
+            for index in range(tab_widget.count())
+        ]
+    return [(window.windowTitle(), lambda: None)]
+
+
+def stylesheet_hash(window):
+    """Hash every stylesheet that currently applies to a window, together with its size"""
+    from PySide6.QtWidgets import QApplication, QWidget
+
+    digest = hashlib.sha256()
+    digest.update(QApplication.instance().styleSheet().encode("utf-8"))
+    digest.update(f"{type(window).__name__}:{window.width()}x{window.height()}".encode("utf-8"))
+    for widget in [window] + window.findChildren(QWidget):
+        digest.update(b"\0")
+        digest.update(type(widget).__name__.encode("utf-8"))
+        digest.update(widget.styleSheet().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def snapshot_filename(index, name):
+    """Return the PNG file name of a style state"""
+    slug = re.sub(r"\W+", "-", name).strip("-").lower() or "style"
+    return f"{index:02d}-{slug}.png"
+
+
+def _init_worker():
+    """Create the offscreen QApplication of a worker process"""
+    global _app
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtCore import QSettings
+    from PySide6.QtWidgets import QApplication
+
+    _app = QApplication.instance() or QApplication([])
+    # Render with default settings, not with e.g. the splitter sizes saved by the gallery in use
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, tempfile.mkdtemp(prefix="gallery-settings-"))
+
+
+def render_window(path, output_dir, previous, force=False):
+    """Render every style state of one window and return its manifest entries and counters"""
+    from PySide6.QtWidgets import QApplication
+
+    start = time.perf_counter()
+    app = QApplication.instance()
+    window = create_window(path)
+    window.show()
+    app.processEvents()
+
+    key = window_key(path)
+    window_dir = os.path.join(output_dir, key)
+    os.makedirs(window_dir, exist_ok=True)
+
+    entries = {}
+    rendered = skipped = 0
+    for index, (name, activate) in enumerate(style_states(window)):
+        activate()
+        app.processEvents()
+
+        state_hash = stylesheet_hash(window)
+        filename = snapshot_filename(index, name)
+        file_path = os.path.join(window_dir, filename)
+        entry = previous.get(str(index))
+        if not force and entry and entry["hash"] == state_hash and os.path.exists(file_path):
+            skipped += 1
+        else:
+            window.grab().save(file_path, "PNG")
+            rendered += 1
+        entries[str(index)] = {"name": name, "hash": state_hash, "file": f"{key}/{filename}"}
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return key, entries, rendered, skipped, time.perf_counter() - start
+
+
+def load_manifest(output_dir):
+    """Load the manifest of the previous run, or an empty one"""
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, encoding="utf-8") as manifest_file:
+        return json.load(manifest_file)
+
+
+def save_manifest(output_dir, manifest):
+    """Write the manifest of this run"""
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def render_all(directories, output_dir, workers=None, force=False):
+    """Render the windows of several directories in parallel and return the updated manifest"""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    paths = [path for directory in directories for path in discover_windows(directory)]
+
+    # Spawned workers start clean instead of inheriting Qt state from a fork
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as pool:
+        futures = {
+            pool.submit(render_window, path, output_dir, manifest.get(window_key(path), {}), force): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                key, entries, rendered, skipped, elapsed = future.result()
+            except Exception as error:
+                print(f"{window_key(futures[future])}: failed ({error})")
+                continue
+            manifest[key] = entries
+            print(f"{key}: {rendered} rendered, {skipped} unchanged ({elapsed:.2f}s)")
+
+    save_manifest(output_dir, manifest)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every style of every gallery window to PNG")
+    parser.add_argument("directories", nargs="*", default=[os.path.dirname(os.path.abspath(__file__))],
+                        help="directories containing *_styles.py windows")
+    parser.add_argument("-o", "--output", default="snapshots", help="output directory for PNGs and the manifest")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("-f", "--force", action="store_true", help="re-render states whose stylesheets did not change")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = render_all(args.directories, args.output, args.workers, args.force)
+    states = sum(len(entries) for entries in manifest.values())
+    print(f"{len(manifest)} windows, {states} states in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,12 +20,17 @@ from PySide6.QtWidgets import (
     QFrame
 )
 from PySide6.QtGui import QFont, QBrush, QColor, QIcon
+from locale_switcher import install_language_menu
+from style_overview import install_style_overview
+from icon_resources import load_icon_resources
 
 class ScrollBarStylesWindow(QMainWindow):
     """QScrollBar styles example window"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Register the :/icons/ images the stylesheets refer to before anything is polished
+        load_icon_resources()
         self.setWindowTitle("QScrollBar Styles Example")
         self.resize(800, 600)
         
@@ -78,6 +83,14 @@ class ScrollBarStylesWindow(QMainWindow):
         
         # Show basic scrollbar by default
         self.update_scrollbar_style(0)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label)
+        self.locale_switcher.follow(self.reset_button.clicked, self.info_label)
+        
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
     def create_scroll_area(self):
         """Create scroll area and content"""
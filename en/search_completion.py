@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Search Field Completion and Validation
+This module adds completion over very large corpora (1M+ entries) and debounced validation to a QLineEdit.
+The corpus is kept in a sorted-array index packed into one string with an array of offsets, so a prefix is
+two binary searches and a million entries cost a few bytes each. Validation waits until typing pauses and
+runs in a thread pool, and results that arrive after the text changed again are dropped.
+
+Usage:
+    python search_completion.py                       # benchmark keystroke-to-popup latency
+    python search_completion.py --size 2000000 --offscreen
+"""
+
+import argparse
+import heapq
+import os
+import statistics
+import sys
+import time
+from array import array
+from itertools import accumulate
+
+from PySide6.QtCore import Qt, QEvent, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtWidgets import QCompleter
+
+from large_combobox import LazyListModel
+
+# Completions shown for a prefix; QCompleter fetches until its model is exhausted, so they are capped
+COMPLETION_LIMIT = 100
+# Entries sorted per call while building an index, see _sorted_in_chunks
+SORT_CHUNK_SIZE = 50000
+# Milliseconds without typing before the text is validated
+VALIDATION_DELAY_MS = 150
+# Dynamic property the stylesheets of validated line edits select on, e.g. QLineEdit[validationState="invalid"]
+VALIDATION_PROPERTY = "validationState"
+
+
+def _sorted_in_chunks(texts):
+    """Return texts sorted ignoring case
+
+    A single sort call holds the GIL until it returns, which freezes the GUI thread while an index is built in
+    the thread pool; sorted chunks merged in Python give it a turn every few milliseconds instead.
+    """
+    chunks = [sorted(texts[start:start + SORT_CHUNK_SIZE], key=str.lower)
+              for start in range(0, len(texts), SORT_CHUNK_SIZE)]
+    return list(heapq.merge(*chunks, key=str.lower))
+
+
+def _packed(texts):
+    """Return texts joined into one string and the offset each one starts at"""
+    packed = "".join(texts)
+    # 4-byte offsets unless the corpus is larger than they can address
+    typecode = "I" if len(packed) < 2 ** 32 else "Q"
+    return packed, array(typecode, accumulate((len(text) for text in texts), initial=0))
+
+
+class CompactPrefixIndex:
+    """Case-insensitive sorted-array index that keeps a corpus in one packed string
+
+    The index is a sequence of the corpus texts in sorted order, so it can back a LazyListModel directly.
+    """
+
+    def __init__(self, entries):
+        texts = _sorted_in_chunks(list(set(entries)))
+        self._texts, self._text_starts = _packed(texts)
+        keys = [text.lower() for text in texts]
+        if len(self._texts) == sum(len(key) for key in keys):
+            # Lowercasing kept every length, the keys share the text offsets
+            self._keys, self._key_starts = "".join(keys), self._text_starts
+        else:
+            self._keys, self._key_starts = _packed(keys)
+
+    def __len__(self):
+        return len(self._text_starts) - 1
+
+    def __getitem__(self, position):
+        return self._texts[self._text_starts[position]:self._text_starts[position + 1]]
+
+    def __contains__(self, text):
+        key = text.lower()
+        position = self._lower_bound(key)
+        return position < len(self) and self.key(position) == key
+
+    def key(self, position):
+        return self._keys[self._key_starts[position]:self._key_starts[position + 1]]
+
+    def _lower_bound(self, key):
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def prefix_range(self, prefix):
+        """Return the range of positions whose text starts with prefix, ignoring case"""
+        key = prefix.lower()
+        return range(self._lower_bound(key), self._lower_bound(key + "\U0010ffff"))
+
+    def size_bytes(self):
+        """Return the memory held by the packed texts, keys and offsets"""
+        size = sys.getsizeof(self._texts) + self._text_starts.buffer_info()[1] * self._text_starts.itemsize
+        if self._keys is not self._texts:
+            size += sys.getsizeof(self._keys)
+        if self._key_starts is not self._text_starts:
+            size += self._key_starts.buffer_info()[1] * self._key_starts.itemsize
+        return size
+
+
+class IndexedCompleter(QCompleter):
+    """Popup completer over a CompactPrefixIndex that measures keystroke-to-popup latency"""
+
+    # Emitted with the milliseconds from a keystroke to the first paint of the popup it updated
+    latency_measured = Signal(float)
+
+    def __init__(self, index, line_edit):
+        super().__init__(line_edit)
+        self.index = index
+        self.completion_model = LazyListModel(index, COMPLETION_LIMIT, self)
+        self.completion_model.set_rows(range(0))
+        self.setModel(self.completion_model)
+        # The index already filtered the model; the completer only selects the closest row in it
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.popup().setUniformItemSizes(True)
+        self.popup().viewport().installEventFilter(self)
+        self._keystroke_time = None
+
+        line_edit.setCompleter(self)
+        line_edit.textEdited.connect(self.update_completions)
+
+    def update_completions(self, text):
+        """Show the entries starting with text"""
+        self._keystroke_time = time.perf_counter()
+        self.completion_model.set_rows(self.index.prefix_range(text)[:COMPLETION_LIMIT] if text else range(0))
+        if self.completion_model.rowCount():
+            self.complete()
+        else:
+            self._keystroke_time = None
+            self.popup().hide()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and self._keystroke_time is not None:
+            self.latency_measured.emit((time.perf_counter() - self._keystroke_time) * 1000)
+            self._keystroke_time = None
+        return super().eventFilter(watched, event)
+
+
+class TaskSignals(QObject):
+    """Signals of a thread pool task, delivered to the GUI thread through a queued connection"""
+
+    finished = Signal(int, object)
+
+
+class _Task(QRunnable):
+    """Thread pool task that reports the result of a function together with a generation number
+
+    An exception raised by the function is reported as the result, so the receiver is never left waiting.
+    """
+
+    def __init__(self, signals, generation, function, *args):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.function = function
+        self.args = args
+
+    def run(self):
+        try:
+            result = self.function(*self.args)
+        except Exception as error:
+            result = error
+        try:
+            self.signals.finished.emit(self.generation, result)
+        except RuntimeError:
+            # The receiver was deleted while the task ran, e.g. its window was closed
+            pass
+
+
+def run_in_pool(parent, function, callback, *args):
+    """Call function(*args) in the global thread pool and callback(result) in the GUI thread
+
+    The result is the exception the function raised, if it raised one.
+    """
+    signals = TaskSignals(parent)
+    signals.finished.connect(lambda _generation, result: (callback(result), signals.deleteLater()))
+    start_in_pool(signals, 0, function, *args)
+
+
+def start_in_pool(signals, generation, function, *args):
+    """Call function(*args) in the global thread pool and emit signals.finished(generation, result)
+
+    For receivers that start a task per edit and drop the results of all but the latest generation.
+    """
+    QThreadPool.globalInstance().start(_Task(signals, generation, function, *args))
+
+
+class DebouncedValidator(QObject):
+    """Validates the text of a line edit in the thread pool once typing pauses
+
+    validate(text) returns (valid, message). The result sets the validationState property of the line edit to
+    "valid" or "invalid" and re-polishes it, so its stylesheet can style either state; empty text, or an exception raised by validate, clears it.
+    """
+
+    # Emitted with the result for the current text of the line edit
+    validated = Signal(bool, str)
+
+    def __init__(self, line_edit, validate, delay=VALIDATION_DELAY_MS):
+        super().__init__(line_edit)
+        self.line_edit = line_edit
+        self.validate = validate
+        # Bumped on every edit, results of older generations are stale
+        self._generation = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._submit)
+        self._signals = TaskSignals(self)
+        self._signals.finished.connect(self._deliver)
+        # Not textEdited, which misses a completion accepted from the popup and text set by setText()
+        line_edit.textChanged.connect(self._schedule)
+
+    def _schedule(self):
+        self._generation += 1
+        self._timer.start()
+
+    def _submit(self):
+        text = self.line_edit.text()
+        if not text:
+            self._set_state("")
+            return
+        start_in_pool(self._signals, self._generation, self.validate, text)
+
+    def _deliver(self, generation, result):
+        if generation != self._generation:
+            return
+        if isinstance(result, Exception):
+            # Neither valid nor invalid, the text couldn't be validated
+            self._set_state("")
+            self.validated.emit(False, str(result))
+            return
+        valid, message = result
+        self._set_state("valid" if valid else "invalid")
+        self.validated.emit(valid, message)
+
+    def _set_state(self, state):
+        if self.line_edit.property(VALIDATION_PROPERTY) == state:
+            return
+        self.line_edit.setProperty(VALIDATION_PROPERTY, state)
+        # Dynamic property selectors are only re-evaluated on polish
+        self.line_edit.style().unpolish(self.line_edit)
+        self.line_edit.style().polish(self.line_edit)
+
+
+def corpus_validator(index):
+    """Return a validate function accepting the texts of an index, ignoring case"""
+    def validate(text):
+        if text in index:
+            return True, "Known entry"
+        return False, "No entry matches this text"
+
+    return validate
+
+
+def benchmark(size, repeat):
+    """Print the index build cost and the keystroke-to-popup latency of typing into a completed line edit"""
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QApplication, QLineEdit
+    from large_combobox import sample_entries
+
+    app = QApplication.instance()
+    entries = sample_entries(size)
+    start = time.perf_counter()
+    index = CompactPrefixIndex(entries)
+    elapsed = time.perf_counter() - start
+    print(f"{len(index)} entries: index built in {elapsed * 1000:.0f} ms, "
+          f"{index.size_bytes() / len(index):.1f} bytes per entry")
+
+    line_edit = QLineEdit()
+    completer = IndexedCompleter(index, line_edit)
+    latencies = []
+    completer.latency_measured.connect(latencies.append)
+    line_edit.show()
+    line_edit.setFocus()
+    app.processEvents()
+
+    for text in ("zephyr raven 0004", "amber", "m", "no match"):
+        for _ in range(repeat):
+            line_edit.clear()
+            completer.popup().hide()
+            latencies.clear()
+            for character in text:
+                QTest.keyClicks(line_edit, character)
+                app.processEvents()
+            if latencies:
+                print(f"    {text!r:20} {len(latencies)} popups, median {statistics.median(latencies):6.2f} ms, "
+                      f"max {max(latencies):6.2f} ms per keystroke")
+            else:
+                print(f"    {text!r:20} no popup")
+                break
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed completion of a line edit")
+    parser.add_argument("--size", type=int, default=1_000_000, help="corpus entries")
+    parser.add_argument("--repeat", type=int, default=1, help="times each text is typed")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtCore import qInstallMessageHandler
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    if args.offscreen:
+        # The offscreen platform warns about every popup it cannot raise or grab for
+        qInstallMessageHandler(lambda *args: None)
+    benchmark(args.size, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,10 @@ from PySide6.QtWidgets import (
     QGridLayout
 )
 from PySide6.QtGui import QFont, QColor
+from locale_switcher import install_language_menu
+from style_classes import SECTION_HEADER, install_class_styles, set_style_class
+from qss_compiler import compiled_stylesheet
+from value_propagation import CoalescedValue
 
 class SliderStylesWindow(QMainWindow):
     """QSlider Style Sheet Example Window"""
@@ -30,6 +34,8 @@ class SliderStylesWindow(QMainWindow):
         # Create central widget and layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
+        # Section labels are styled by their class, from one stylesheet here
+        install_class_styles(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
         # Add title
@@ -49,11 +55,15 @@ class SliderStylesWindow(QMainWindow):
         self.create_flat_style_example()
         self.create_groove_style_example()
         self.create_tick_style_example()
+        self.create_coalesced_value_example()
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
     
     def create_basic_style_example(self):
         """Basic style sheet example"""
         section_label = QLabel("Basic Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -89,7 +99,7 @@ class SliderStylesWindow(QMainWindow):
     def create_orientation_style_example(self):
         """Different orientation styles example"""
         section_label = QLabel("Orientation Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QGridLayout()
@@ -139,7 +149,7 @@ class SliderStylesWindow(QMainWindow):
     def create_gradient_style_example(self):
         """Gradient background styles example"""
         section_label = QLabel("Gradient Background Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -207,7 +217,7 @@ class SliderStylesWindow(QMainWindow):
     def create_round_handle_style_example(self):
         """Round handle styles example"""
         section_label = QLabel("Round Handle Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -262,7 +272,7 @@ class SliderStylesWindow(QMainWindow):
     def create_flat_style_example(self):
         """Flat style example"""
         section_label = QLabel("Flat Style")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -316,7 +326,7 @@ class SliderStylesWindow(QMainWindow):
     def create_groove_style_example(self):
         """Groove style example"""
         section_label = QLabel("Groove Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QHBoxLayout()
@@ -384,7 +394,7 @@ class SliderStylesWindow(QMainWindow):
     def create_tick_style_example(self):
         """Tick style example"""
         section_label = QLabel("Tick Styles")
-        section_label.setStyleSheet("background-color: #f0f0f0; padding: 5px;")
+        set_style_class(section_label, SECTION_HEADER)
         self.main_layout.addWidget(section_label)
         
         layout = QVBoxLayout()
@@ -395,7 +405,7 @@ class SliderStylesWindow(QMainWindow):
         tick_slider.setValue(50)
         tick_slider.setTickPosition(QSlider.TicksBelow)
         tick_slider.setTickInterval(20)
-        tick_slider.setStyleSheet("""
+        tick_slider.setStyleSheet(compiled_stylesheet("""
             QSlider::groove:horizontal {
                 background: #E0E0E0;
                 height: 8px;
@@ -413,7 +423,7 @@ class SliderStylesWindow(QMainWindow):
                 width: 2px;
                 height: 8px;
             }
-        """)
+        """))
         layout.addWidget(tick_slider)
         
         # Vertical slider with ticks
@@ -422,7 +432,7 @@ class SliderStylesWindow(QMainWindow):
         vertical_tick_slider.setValue(50)
         vertical_tick_slider.setTickPosition(QSlider.TicksRight)
         vertical_tick_slider.setTickInterval(20)
-        vertical_tick_slider.setStyleSheet("""
+        vertical_tick_slider.setStyleSheet(compiled_stylesheet("""
             QSlider::groove:vertical {
                 background: #E0E0E0;
                 width: 8px;
@@ -440,7 +450,7 @@ class SliderStylesWindow(QMainWindow):
                 width: 8px;
                 height: 2px;
             }
-        """)
+        """))
         
         # Add vertical slider to horizontal layout
         vertical_layout = QHBoxLayout()
@@ -449,6 +459,50 @@ class SliderStylesWindow(QMainWindow):
         layout.addLayout(vertical_layout)
         
         self.main_layout.addLayout(layout)
+    
+    def create_coalesced_value_example(self):
+        """Coalesced value propagation example"""
+        section_label = QLabel("Coalesced Value Propagation")
+        set_style_class(section_label, SECTION_HEADER)
+        self.main_layout.addWidget(section_label)
+        
+        layout = QHBoxLayout()
+        
+        # Fine-grained slider whose consumers see at most one value per frame
+        coalesced_slider = QSlider(Qt.Horizontal)
+        coalesced_slider.setRange(0, 1000)
+        coalesced_slider.setStyleSheet("""
+            QSlider::groove:horizontal {
+                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: 0 #B2DFDB, stop: 1 #00796B);
+                height: 8px;
+                border-radius: 4px;
+            }
+            QSlider::handle:horizontal {
+                background: white;
+                border: 2px solid #00796B;
+                width: 16px;
+                margin: -6px 0;
+                border-radius: 10px;
+            }
+        """)
+        layout.addWidget(coalesced_slider)
+        
+        # Updated once per frame with how many changes the frame coalesced
+        self.coalesced_label = QLabel("Drag the slider")
+        layout.addWidget(self.coalesced_label)
+        
+        self.coalesced_value = CoalescedValue(coalesced_slider.valueChanged, parent=self)
+        self.coalesced_value.add_consumer(self.show_coalesced_value)
+        
+        self.main_layout.addLayout(layout)
+    
+    def show_coalesced_value(self, value):
+        """Show the latest slider value and how many changes were coalesced so far"""
+        self.coalesced_label.setText(
+            self.locale_switcher.text("Value {value}: {delivered} updates for {received} changes").format(
+                value=value, delivered=self.coalesced_value.delivered, received=self.coalesced_value.received
+            )
+        )
 
 # Main function
 if __name__ == "__main__":
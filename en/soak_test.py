@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Style Switching Soak Test
+This tool cycles every style index of each gallery window thousands of times and tracks what grows while it
+does: live QObjects, signal connections, Python objects per type and the process RSS. Each window runs in its
+own offscreen process, and the test fails when growth after the warm-up goes past the thresholds.
+
+Usage:
+    python soak_test.py                              # the windows next to this file
+    python soak_test.py ../en -n 5000 --reset        # also press the reset button after every cycle
+    python soak_test.py treewidget_styles.py -n 500  # a single window
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from render_snapshots import _init_worker, create_window, discover_windows, style_states, window_key
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_ITERATIONS = 2000
+DEFAULT_WARMUP = 50
+# Growth allowed between the end of the warm-up and the end of the run
+DEFAULT_MAX_QOBJECTS = 0
+DEFAULT_MAX_CONNECTIONS = 0
+DEFAULT_MAX_TYPE_GROWTH = 500
+DEFAULT_MAX_RSS_MB = 20.0
+
+# Attribute names the gallery windows use for their reset button
+RESET_BUTTON_ATTRIBUTES = ("reset_button", "reset_btn")
+
+
+def _init_soak_worker():
+    """Create the offscreen QApplication of a worker and drop Qt's warnings, which repeat on every cycle"""
+    _init_worker()
+    from PySide6.QtCore import qInstallMessageHandler
+
+    qInstallMessageHandler(lambda *args: None)
+
+
+def rss_bytes():
+    """Return the resident set size of this process"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak instead of current RSS, still shows steady growth
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def count_qobjects(window):
+    """Count the QObjects owned by a window plus every widget alive in the application"""
+    from PySide6.QtCore import QObject
+    from PySide6.QtWidgets import QApplication
+
+    return len(window.findChildren(QObject)) + len(QApplication.allWidgets())
+
+
+def count_connections(window):
+    """Count the receivers connected to every signal of a window and its children"""
+    from PySide6.QtCore import QObject, QMetaMethod
+
+    total = 0
+    for qobject in [window] + window.findChildren(QObject):
+        meta_object = qobject.metaObject()
+        for index in range(meta_object.methodCount()):
+            method = meta_object.method(index)
+            if method.methodType() == QMetaMethod.Signal:
+                total += qobject.receivers("2" + method.methodSignature().data().decode())
+    return total
+
+
+def count_python_objects():
+    """Count live Python objects per type name"""
+    gc.collect()
+    return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+
+def sample(window):
+    """Flush deferred deletes and measure everything the soak test tracks"""
+    from PySide6.QtCore import QEvent
+    from PySide6.QtWidgets import QApplication
+
+    QApplication.processEvents()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    return {
+        "qobjects": count_qobjects(window),
+        "connections": count_connections(window),
+        "types": count_python_objects(),
+        "rss": rss_bytes(),
+    }
+
+
+def soak_window(path, iterations, warmup, reset, limits):
+    """Cycle every style of one window and return its growth report"""
+    from PySide6.QtWidgets import QApplication
+
+    start = time.perf_counter()
+    window = create_window(path)
+    window.show()
+    states = style_states(window)
+    reset_button = next(
+        (getattr(window, attribute) for attribute in RESET_BUTTON_ATTRIBUTES if hasattr(window, attribute)),
+        None
+    ) if reset else None
+
+    def cycle():
+        for _, activate in states:
+            activate()
+            QApplication.processEvents()
+        if reset_button is not None:
+            reset_button.click()
+
+    for _ in range(warmup):
+        cycle()
+    baseline = sample(window)
+
+    trend = []
+    checkpoint = max(1, iterations // 10)
+    for iteration in range(1, iterations + 1):
+        cycle()
+        if iteration % checkpoint == 0:
+            trend.append(count_qobjects(window))
+    final = sample(window)
+
+    type_growth = final["types"] - baseline["types"]
+    growth = {
+        "qobjects": final["qobjects"] - baseline["qobjects"],
+        "connections": final["connections"] - baseline["connections"],
+        "rss_mb": (final["rss"] - baseline["rss"]) / (1024 * 1024),
+        "types": dict(type_growth.most_common(5)),
+    }
+    failures = []
+    if growth["qobjects"] > limits["qobjects"]:
+        failures.append(f"{growth['qobjects']} QObjects")
+    if growth["connections"] > limits["connections"]:
+        failures.append(f"{growth['connections']} signal connections")
+    if growth["rss_mb"] > limits["rss_mb"]:
+        failures.append(f"{growth['rss_mb']:.1f} MB RSS")
+    failures += [f"{count} {name} objects" for name, count in type_growth.items() if count > limits["types"]]
+
+    window.close()
+    return {
+        "window": window_key(path),
+        "states": len(states),
+        "growth": growth,
+        "trend": trend,
+        "failures": failures,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def soak_in_process(path, iterations, warmup, reset, limits):
+    """Soak one window in an offscreen process of its own and return its growth report
+
+    Its own process, so that RSS growth is attributed to the right window, and so that a crash only fails the
+    window that crashed: a pool shared by the windows breaks for all of them.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_init_soak_worker) as pool:
+        return pool.submit(soak_window, path, iterations, warmup, reset, limits).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cycle gallery styles and fail on object or memory growth")
+    parser.add_argument("paths", nargs="*", default=[os.path.dirname(os.path.abspath(__file__))],
+                        help="*_styles.py windows, or directories containing them")
+    parser.add_argument("-n", "--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help="cycles through every style of each window")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="cycles before the baseline sample")
+    parser.add_argument("--reset", action="store_true", help="press the window's reset button after each cycle")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--max-qobjects", type=int, default=DEFAULT_MAX_QOBJECTS)
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS)
+    parser.add_argument("--max-type-growth", type=int, default=DEFAULT_MAX_TYPE_GROWTH,
+                        help="allowed growth of the Python objects of any single type")
+    parser.add_argument("--max-rss-mb", type=float, default=DEFAULT_MAX_RSS_MB)
+    args = parser.parse_args()
+
+    limits = {
+        "qobjects": args.max_qobjects,
+        "connections": args.max_connections,
+        "types": args.max_type_growth,
+        "rss_mb": args.max_rss_mb,
+    }
+    paths = [
+        os.path.abspath(path) for argument in args.paths
+        for path in ([argument] if os.path.isfile(argument) else discover_windows(argument))
+    ]
+
+    failed = 0
+    # Each thread waits for the process of one window
+    with ThreadPoolExecutor(max_workers=args.workers or os.cpu_count()) as pool:
+        futures = [pool.submit(soak_in_process, path, args.iterations, args.warmup, args.reset, limits)
+                   for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                report = future.result()
+            except Exception as error:
+                # A crash is the worst kind of growth, count it as a failure
+                failed += 1
+                print(f"{window_key(path)}: FAIL (crashed: {error})")
+                continue
+            growth = report["growth"]
+            status = "FAIL" if report["failures"] else "ok"
+            print(f"{report['window']}: {status} ({report['states']} states x {args.iterations}, "
+                  f"{report['elapsed']:.1f}s) QObjects {growth['qobjects']:+d}, "
+                  f"connections {growth['connections']:+d}, RSS {growth['rss_mb']:+.1f} MB")
+            if report["failures"]:
+                failed += 1
+                print(f"    grew by {', '.join(report['failures'])}")
+                print(f"    QObject trend: {report['trend']}")
+                print(f"    top growing types: {growth['types']}")
+
+    print(f"{len(paths)} windows soaked, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
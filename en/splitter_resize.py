@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Snapshot Splitter Resizing
+This module is a resize mode for splitters around heavy panels. While a handle is dragged, the panels are left
+alone and an overlay paints snapshots of them, taken when the drag started, at the sizes the drag asks for. The
+overlay follows the mouse at most once per frame, and the panels are relaid out once, when the handle is
+released. Splitter sizes are kept in QSettings and restored before the window is first shown.
+"""
+
+from PySide6.QtCore import Qt, QPoint, QRect, QSettings, Signal
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QSplitter, QSplitterHandle, QWidget
+
+from value_propagation import CoalescedValue
+
+SETTINGS_ORGANIZATION = "Qt-Widgets-Stylesheet-Gallery"
+SETTINGS_APPLICATION = "Gallery"
+
+
+def gallery_settings():
+    """Return the settings of the gallery, an INI file so that tools can redirect it with QSettings.setPath"""
+    return QSettings(QSettings.IniFormat, QSettings.UserScope, SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+
+
+def save_splitter_sizes(splitter, key):
+    gallery_settings().setValue(key, splitter.saveState())
+
+
+def persist_splitter_sizes(splitter, key, default_sizes):
+    """Restore the sizes saved for a splitter, or set the defaults, and save them after every move"""
+    state = gallery_settings().value(key)
+    if state is None or not splitter.restoreState(state):
+        splitter.setSizes(default_sizes)
+    splitter.splitterMoved.connect(lambda pos, index: save_splitter_sizes(splitter, key))
+
+
+class SnapshotOverlay(QWidget):
+    """Covers a splitter with snapshots of its widgets and handles while a handle is dragged
+
+    The overlay is a child of the splitter's window, a splitter would add a child widget to its panes.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        # (pixmap, rect) in splitter coordinates, painted unscaled and clipped to the rect
+        self.items = []
+        # The overlay paints every pixel, so the widgets it covers are not repainted below it
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.hide()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().window())
+        for pixmap, rect in self.items:
+            painter.save()
+            painter.setClipRect(rect)
+            painter.drawPixmap(rect.topLeft(), pixmap)
+            painter.restore()
+
+
+class SnapshotSplitterHandle(QSplitterHandle):
+    """Splitter handle that previews a drag on the overlay and only moves the splitter on release"""
+
+    # Emitted with the handle position a drag asks for, in splitter coordinates
+    drag_moved = Signal(int)
+
+    def __init__(self, orientation, splitter):
+        super().__init__(orientation, splitter)
+        self._mouse_offset = 0
+        # Mouse moves arrive faster than frames, the overlay follows the latest one once per frame
+        self._coalesced = CoalescedValue(self.drag_moved, parent=self)
+        self._coalesced.add_consumer(lambda pos: self.splitter().preview_drag(self.splitter().indexOf(self), pos))
+
+    def _pick(self, point):
+        return point.x() if self.orientation() == Qt.Horizontal else point.y()
+
+    def _drag_position(self, event):
+        return self._pick(self.splitter().mapFromGlobal(event.globalPosition().toPoint())) - self._mouse_offset
+
+    def mousePressEvent(self, event):
+        # The base class marks the handle pressed, for the :pressed style, before the snapshot is taken
+        super().mousePressEvent(event)
+        if event.button() == Qt.LeftButton:
+            self._mouse_offset = self._pick(event.position().toPoint())
+            self.splitter().begin_drag()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton:
+            self.drag_moved.emit(self._drag_position(event))
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.splitter().commit_drag(self.splitter().indexOf(self), self._drag_position(event))
+        super().mouseReleaseEvent(event)
+
+
+class SnapshotSplitter(QSplitter):
+    """Splitter whose handle drags show snapshots of its widgets and relayout them once, on release"""
+
+    def __init__(self, orientation, parent=None):
+        super().__init__(orientation, parent)
+        self._overlay = None
+        # Pixmaps of every widget and handle, taken when the current drag started
+        self._widget_snapshots = []
+        self._handle_snapshots = []
+
+    def createHandle(self):
+        return SnapshotSplitterHandle(self.orientation(), self)
+
+    def is_dragging(self):
+        return self._overlay is not None and self._overlay.isVisible()
+
+    def begin_drag(self):
+        """Snapshot every widget and handle and cover the splitter with the snapshots"""
+        self._widget_snapshots = [self.widget(index).grab() for index in range(self.count())]
+        self._handle_snapshots = [self.handle(index).grab() for index in range(self.count())]
+        if self._overlay is None or self._overlay.parentWidget() is not self.window():
+            self._overlay = SnapshotOverlay(self.window())
+        # Same origin as the splitter, so the snapshot rects need no mapping
+        self._overlay.setGeometry(QRect(self.mapTo(self.window(), QPoint(0, 0)), self.size()))
+        self._overlay.items = self._snapshot_items(self._geometries())
+        self._overlay.show()
+        self._overlay.raise_()
+
+    def _geometries(self):
+        """Return the current (widget rect, handle rect) of every position"""
+        return [(self.widget(index).geometry(), self.handle(index).geometry()) for index in range(self.count())]
+
+    def _snapshot_items(self, geometries):
+        items = []
+        for index, (widget_rect, handle_rect) in enumerate(geometries):
+            if index and self.handle(index).isVisible():
+                items.append((self._handle_snapshots[index], handle_rect))
+            if self.widget(index).isVisible():
+                items.append((self._widget_snapshots[index], widget_rect))
+        return items
+
+    def _moved(self, rect, start, length):
+        """Return rect with its start and length along the splitter's orientation replaced"""
+        if self.orientation() == Qt.Horizontal:
+            return QRect(start, rect.y(), length, rect.height())
+        return QRect(rect.x(), start, rect.width(), length)
+
+    def preview_drag(self, index, pos):
+        """Paint the snapshots as they would be laid out with handle index at pos"""
+        if not self.is_dragging():
+            return
+        pos = self.closestLegalPosition(pos, index)
+        horizontal = self.orientation() == Qt.Horizontal
+        geometries = self._geometries()
+        before, _ = geometries[index - 1]
+        after, handle_rect = geometries[index]
+        before_start = before.x() if horizontal else before.y()
+        after_end = (after.right() if horizontal else after.bottom()) + 1
+        handle_width = handle_rect.width() if horizontal else handle_rect.height()
+
+        geometries[index - 1] = (self._moved(before, before_start, pos - before_start), geometries[index - 1][1])
+        geometries[index] = (
+            self._moved(after, pos + handle_width, after_end - pos - handle_width),
+            self._moved(handle_rect, pos, handle_width),
+        )
+        self._overlay.items = self._snapshot_items(geometries)
+        self._overlay.update()
+
+    def commit_drag(self, index, pos):
+        """Remove the snapshots and move the handle to its final position, which relayouts the widgets once"""
+        if not self.is_dragging():
+            return
+        self._overlay.hide()
+        self._overlay.items = []
+        self._widget_snapshots = []
+        self._handle_snapshots = []
+        self.moveSplitter(self.closestLegalPosition(pos, index), index)
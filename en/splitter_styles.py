@@ -21,6 +21,9 @@ from PySide6.QtWidgets import (
     QTextEdit
 )
 from PySide6.QtGui import QFont, QBrush, QColor, QIcon
+from locale_switcher import install_language_menu
+from style_overview import install_style_overview
+from splitter_resize import SnapshotSplitter, persist_splitter_sizes, save_splitter_sizes
 
 class SplitterStylesWindow(QMainWindow):
     """QSplitter Style Sheet Example Window"""
@@ -85,14 +88,22 @@ class SplitterStylesWindow(QMainWindow):
         
         # Show basic splitter by default
         self.update_splitter_style(0)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label)
+        self.locale_switcher.follow(self.reset_button.clicked, self.info_label)
+        
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
     def create_splitter(self):
         """Create splitter and content"""
-        # Create main vertical splitter
-        self.main_splitter = QSplitter(Qt.Vertical)
+        # Create main vertical splitter, handle drags show panel snapshots until release
+        self.main_splitter = SnapshotSplitter(Qt.Vertical)
         
         # Create top horizontal splitter
-        self.top_splitter = QSplitter(Qt.Horizontal)
+        self.top_splitter = SnapshotSplitter(Qt.Horizontal)
         
         # Create left and right panels
         self.left_panel = self._create_panel("Left Panel")
@@ -101,7 +112,8 @@ class SplitterStylesWindow(QMainWindow):
         # Add to top horizontal splitter
         self.top_splitter.addWidget(self.left_panel)
         self.top_splitter.addWidget(self.right_panel)
-        self.top_splitter.setSizes([300, 400])  # Set initial size ratio
+        # Restore the saved sizes, or set the initial size ratio
+        persist_splitter_sizes(self.top_splitter, "splitter_styles/top_splitter", [300, 400])
         
         # Create bottom panel
         self.bottom_panel = self._create_panel("Bottom Panel")
@@ -109,7 +121,7 @@ class SplitterStylesWindow(QMainWindow):
         # Add to main vertical splitter
         self.main_splitter.addWidget(self.top_splitter)
         self.main_splitter.addWidget(self.bottom_panel)
-        self.main_splitter.setSizes([400, 200])  # Set initial size ratio
+        persist_splitter_sizes(self.main_splitter, "splitter_styles/main_splitter", [400, 200])
         
         # Add main splitter to layout
         self.splitter_layout.addWidget(self.main_splitter)
@@ -393,6 +405,8 @@ class SplitterStylesWindow(QMainWindow):
         # Reset splitter position
         self.top_splitter.setSizes([300, 400])
         self.main_splitter.setSizes([400, 200])
+        save_splitter_sizes(self.top_splitter, "splitter_styles/top_splitter")
+        save_splitter_sizes(self.main_splitter, "splitter_styles/main_splitter")
         
         # Restore default style
         self.update_splitter_style(self.style_combobox.currentIndex())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Style Classes
+Most gallery windows head each example with a section label styled by a stylesheet of its own. Every widget
+with a stylesheet of its own gets its own style sheet style object and has that stylesheet parsed and matched on
+its own, seven to nine times per window for the same two declarations. This module marks widgets with a class
+dynamic property instead, set_style_class(label, SECTION_HEADER), and resolves every class from one stylesheet
+installed on a parent of the marked widgets, e.g. the central widget, with install_class_styles().
+
+Run directly, it opens the windows with section labels, once with a stylesheet per section label and once with
+the class styles, and reports the widgets with stylesheets of their own, the style objects and the time of the
+first polish of each window.
+
+Usage:
+    python style_classes.py
+    python style_classes.py --runs 10 --offscreen
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Dynamic property holding the space separated classes of a widget, as global_styles' buttons use it
+STYLE_CLASS_PROPERTY = "class"
+SECTION_HEADER = "section-header"
+# Class: declarations of its widgets
+CLASS_STYLES = {
+    SECTION_HEADER: "background-color: #f0f0f0; padding: 5px;",
+}
+# Windows whose examples start with a section label
+SECTION_WINDOWS = ("button", "checkbox", "combobox", "label", "lineedit", "slider")
+
+# Set by the benchmark to style every marked widget with a stylesheet of its own, as the windows used to
+_per_widget = False
+
+
+def style_classes(widget):
+    """Return the classes of a widget"""
+    return (widget.property(STYLE_CLASS_PROPERTY) or "").split()
+
+
+def set_style_class(widget, name):
+    """Add a class to a widget, to be styled by the stylesheet of install_class_styles(), and return the widget"""
+    if _per_widget:
+        widget.setStyleSheet(CLASS_STYLES[name])
+        return widget
+    classes = style_classes(widget)
+    if name not in classes:
+        widget.setProperty(STYLE_CLASS_PROPERTY, " ".join(classes + [name]))
+    return widget
+
+
+def class_stylesheet(names=None):
+    """Return the stylesheet of some classes, all of CLASS_STYLES by default"""
+    names = CLASS_STYLES if names is None else names
+    return "".join(f'*[{STYLE_CLASS_PROPERTY}~="{name}"]{{{CLASS_STYLES[name]}}}' for name in names)
+
+
+def install_class_styles(parent):
+    """Style the marked descendants of parent from one stylesheet on parent
+
+    Installed before the marked widgets are polished, e.g. right after parent is created, the classes are
+    matched in the same polish that styles the widgets anyway.
+    """
+    if not _per_widget:
+        parent.setStyleSheet(parent.styleSheet() + class_stylesheet())
+    return parent
+
+
+def style_counts(window):
+    """Return (widgets with a stylesheet of their own, style objects) of a window and its descendants"""
+    import shiboken6
+    from PySide6.QtWidgets import QWidget
+
+    widgets = [window] + window.findChildren(QWidget)
+    own = sum(1 for widget in widgets if widget.styleSheet())
+    styles = {shiboken6.getCppPointer(widget.style())[0] for widget in widgets}
+    return own, len(styles)
+
+
+def _create_and_show(app, path):
+    """Return (window, ms to create it, ms to show it), showing polishes every widget of the window"""
+    from render_snapshots import create_window
+
+    start = time.perf_counter()
+    window = create_window(path)
+    created = time.perf_counter()
+    window.show()
+    app.processEvents()
+    return window, (created - start) * 1000, (time.perf_counter() - created) * 1000
+
+
+def benchmark(runs):
+    """Print the stylesheets, style objects, creation and first polish time of the section windows per styling"""
+    global _per_widget
+    from PySide6.QtCore import QEvent
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    print(f"{runs} runs; own stylesheets, style objects, median ms to create / to show")
+    for window_name in SECTION_WINDOWS:
+        path = os.path.join(directory, f"{window_name}_styles.py")
+        # Styling: (counts, creation times, show times), the stylings alternate so both see the same noise
+        results = {True: (None, [], []), False: (None, [], [])}
+        try:
+            for _ in range(runs):
+                for per_widget in results:
+                    _per_widget = per_widget
+                    window, create, show = _create_and_show(app, path)
+                    _, creates, shows = results[per_widget]
+                    creates.append(create)
+                    shows.append(show)
+                    results[per_widget] = (style_counts(window), creates, shows)
+                    window.close()
+                    window.deleteLater()
+                    app.sendPostedEvents(None, QEvent.DeferredDelete)
+        finally:
+            _per_widget = False
+        for per_widget, (counts, creates, shows) in results.items():
+            mode = "per widget" if per_widget else "classes"
+            print(f"    {window_name:9} {mode:10} {counts[0]:3} stylesheets {counts[1]:3} styles "
+                  f"{statistics.median(creates):7.2f} / {statistics.median(shows):7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-widget section stylesheets with class styles")
+    parser.add_argument("--runs", type=int, default=10, help="windows created per measurement")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    # The windows import this file as style_classes, and the benchmark switches their styling there
+    import style_classes
+
+    style_classes.benchmark(args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
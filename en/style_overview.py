@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Style Overview Page
+This module adds an overview mode to the combobox-driven gallery windows: every style is shown side by side
+as a cached pixmap thumbnail instead of as a live widget. Thumbnails are rendered once from a hidden copy of
+the window, so rendering them never runs the style handlers of the window itself, which may reset the data
+shown in it, and kept in QPixmapCache under the hash of the stylesheets they were rendered with. A thumbnail is
+only rendered again when it was invalidated, or when the window was resized or switched to another language.
+The single live widget of the window follows the thumbnail that is hovered or clicked.
+"""
+
+from PySide6.QtCore import Qt, QTimer, QEvent, Signal
+from PySide6.QtGui import QAction, QPixmapCache
+from PySide6.QtWidgets import (
+    QApplication,
+    QDialog,
+    QWidget,
+    QLabel,
+    QScrollArea,
+    QGridLayout,
+    QVBoxLayout,
+    QFrame
+)
+
+from render_snapshots import STYLE_SELECTOR_ATTRIBUTES, stylesheet_hash
+
+THUMBNAIL_WIDTH = 240
+THUMBNAIL_COLUMNS = 4
+# Hover delay before the live widget follows a thumbnail, so that sweeping over tiles doesn't re-polish each one
+HOVER_DELAY_MS = 150
+
+
+class ThumbnailTile(QFrame):
+    """A cached thumbnail of one style with its name"""
+
+    hovered = Signal(int)
+    clicked = Signal(int)
+
+    def __init__(self, index, name, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.setFrameShape(QFrame.StyledPanel)
+        self.setCursor(Qt.PointingHandCursor)
+
+        layout = QVBoxLayout(self)
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignCenter)
+        self.name_label = QLabel(name)
+        self.name_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.image_label)
+        layout.addWidget(self.name_label)
+
+    def set_pixmap(self, pixmap):
+        self.image_label.setPixmap(pixmap)
+
+    def enterEvent(self, event):
+        self.hovered.emit(self.index)
+        super().enterEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit(self.index)
+        super().mousePressEvent(event)
+
+
+class StyleOverview(QDialog):
+    """Overview of every style of a window as cached thumbnails"""
+
+    def __init__(self, window, combobox):
+        super().__init__(window)
+        self.window = window
+        self.combobox = combobox
+        self.setWindowTitle("Style Overview")
+        self.resize(THUMBNAIL_COLUMNS * (THUMBNAIL_WIDTH + 30) + 20, 520)
+
+        # Stylesheet hash each style had when it was rendered
+        self._hashes = {}
+        # Hidden copy of the window the thumbnails are rendered from, with its style selector
+        self._renderer = None
+        self._renderer_combobox = None
+        # Size and language of the window the thumbnails were rendered for
+        self._rendered_for = None
+        # Style the window showed before the overview opened, restored when a hover preview changed it
+        self._selected_index = combobox.currentIndex()
+        self._hover_index = None
+        self._previewed = False
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.timeout.connect(self._show_hovered_style)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        content = QWidget()
+        self.grid_layout = QGridLayout(content)
+        scroll_area.setWidget(content)
+        layout = QVBoxLayout(self)
+        layout.addWidget(scroll_area)
+
+        self.tiles = []
+        for index in range(combobox.count()):
+            tile = ThumbnailTile(index, combobox.itemText(index))
+            tile.hovered.connect(self._on_tile_hovered)
+            tile.clicked.connect(self._on_tile_clicked)
+            self.grid_layout.addWidget(tile, index // THUMBNAIL_COLUMNS, index % THUMBNAIL_COLUMNS)
+            self.tiles.append(tile)
+
+    def _cache_key(self, index):
+        return f"{type(self.window).__name__}:{index}:{self._hashes.get(index)}"
+
+    def _language(self):
+        switcher = getattr(self.window, "locale_switcher", None)
+        return switcher.language if switcher is not None else None
+
+    def invalidate(self, index=None):
+        """Drop the thumbnail of one style, or of all of them, e.g. after stylesheets were reloaded"""
+        for key in ([index] if index is not None else list(self._hashes)):
+            QPixmapCache.remove(self._cache_key(key))
+            self._hashes.pop(key, None)
+        # The copy may still show a style with the stylesheets it had
+        if self._renderer is not None:
+            self._renderer.deleteLater()
+            self._renderer = self._renderer_combobox = None
+
+    def _render_window(self):
+        """Return the hidden copy of the window and its style selector, created when first needed"""
+        if self._renderer is None:
+            self._renderer = type(self.window)()
+            self._renderer.setAttribute(Qt.WA_DontShowOnScreen)
+            language = self._language()
+            if language is not None:
+                self._renderer.locale_switcher.set_language(language)
+            self._renderer_combobox = next(
+                getattr(self._renderer, attribute) for attribute in STYLE_SELECTOR_ATTRIBUTES
+                if hasattr(self._renderer, attribute)
+            )
+        self._renderer.resize(self.window.size())
+        # Shown, though not on screen, so that its layouts are activated
+        self._renderer.show()
+        return self._renderer, self._renderer_combobox
+
+    def refresh(self):
+        """Show every thumbnail, rendering only those that are missing from the cache"""
+        rendered_for = (self.window.size(), self._language())
+        if rendered_for != self._rendered_for:
+            self.invalidate()
+            self._rendered_for = rendered_for
+        missing = []
+        for tile in self.tiles:
+            pixmap = QPixmapCache.find(self._cache_key(tile.index)) if tile.index in self._hashes else None
+            if pixmap is None or pixmap.isNull():
+                missing.append(tile)
+            else:
+                tile.set_pixmap(pixmap)
+        if not missing:
+            return
+
+        renderer, combobox = self._render_window()
+        for tile in missing:
+            combobox.setCurrentIndex(tile.index)
+            QApplication.sendPostedEvents(None, QEvent.LayoutRequest)
+            self._hashes[tile.index] = stylesheet_hash(renderer)
+            pixmap = renderer.centralWidget().grab().scaledToWidth(THUMBNAIL_WIDTH, Qt.SmoothTransformation)
+            QPixmapCache.insert(self._cache_key(tile.index), pixmap)
+            tile.set_pixmap(pixmap)
+        renderer.hide()
+
+    def showEvent(self, event):
+        self._selected_index = self.combobox.currentIndex()
+        self._previewed = False
+        self.refresh()
+        super().showEvent(event)
+
+    def _on_tile_hovered(self, index):
+        self._hover_index = index
+        self._hover_timer.start(HOVER_DELAY_MS)
+
+    def _show_hovered_style(self):
+        """Let the window's live widget show the hovered style"""
+        if self._hover_index is not None and self._hover_index != self.combobox.currentIndex():
+            self.combobox.setCurrentIndex(self._hover_index)
+            self._previewed = True
+
+    def _on_tile_clicked(self, index):
+        self._hover_timer.stop()
+        self._selected_index = index
+        self._previewed = False
+        self.combobox.setCurrentIndex(index)
+        self.accept()
+
+    def leaveEvent(self, event):
+        # Back to the chosen style once the pointer leaves the thumbnails, if a preview left it
+        self._hover_timer.stop()
+        self._hover_index = None
+        if self._previewed:
+            self._previewed = False
+            self.combobox.setCurrentIndex(self._selected_index)
+        super().leaveEvent(event)
+
+
+def install_style_overview(window):
+    """Add a style overview action to a combobox-driven gallery window and return the overview"""
+    combobox = next(
+        (getattr(window, attribute) for attribute in STYLE_SELECTOR_ATTRIBUTES if hasattr(window, attribute)),
+        None
+    )
+    if combobox is None:
+        return None
+
+    overview = StyleOverview(window, combobox)
+    action = QAction("Style Overview", window)
+    action.setShortcut("Ctrl+O")
+    action.triggered.connect(overview.show)
+    window.menuBar().addMenu("View").addAction(action)
+    return overview
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Table Import
+The table gallery shows five sample rows. This module streams the rows of a CSV file, or of a Parquet file when
+pyarrow is installed, into a ColumnTableModel: a task in the thread pool reads the file a chunk of rows at a
+time and parses each chunk into columns, and the GUI thread appends the chunks to the model as they arrive, so
+the rows show while the file is read. The reader waits while a few chunks are waiting to be appended, so an
+import holds the model and those chunks, however much faster the file reads than the model grows.
+
+Run directly with a file, it imports the file into the table gallery and reports rows per second, the longest
+the GUI thread went without handling events and the peak memory; without one, it writes a synthetic CSV file
+of --rows rows first.
+
+Usage:
+    python table_import.py products.csv
+    python table_import.py --rows 1000000 --offscreen
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from column_table import ColumnTableModel, NumberColumn, TextColumn, column_from_texts
+
+# Rows read and parsed per chunk
+CHUNK_ROWS = 20000
+# Rows turned from rows into columns at a time
+TRANSPOSE_ROWS = 500
+# Chunks read ahead of the model before the reader waits
+PENDING_CHUNKS = 4
+# Delimiters of CSV exports, the first when a header has none of them
+DELIMITERS = ",;\t|"
+# File name filter of the import dialog
+FILE_FILTER = "Tables (*.csv *.tsv *.txt *.parquet);;All Files (*)"
+
+
+def _csv_chunks(path, chunk_rows):
+    """Return (headers, iterator of chunks of columns) of a CSV file, its delimiter guessed from its header"""
+    # utf-8-sig drops the byte order mark spreadsheet exports start with
+    table_file = open(path, newline="", encoding="utf-8-sig")
+    try:
+        # The most frequent candidate in the header line, which unlike the values holds no decimal commas
+        header_line = table_file.readline()
+        table_file.seek(0)
+        delimiter = max(DELIMITERS, key=header_line.count) if any(map(header_line.count, DELIMITERS)) else ","
+        reader = csv.reader(table_file, delimiter=delimiter)
+        headers = next(reader, [])
+    except BaseException:
+        table_file.close()
+        raise
+
+    def chunks():
+        with table_file:
+            width = len(headers)
+            while True:
+                columns = [[] for _ in range(width)]
+                # A list per row, kept only while a small batch is turned into columns, so the rows of a chunk
+                # don't survive long enough to make the garbage collector walk the whole heap
+                for _ in range(0, chunk_rows, TRANSPOSE_ROWS):
+                    rows = list(itertools.islice(reader, TRANSPOSE_ROWS))
+                    if not rows:
+                        break
+                    # Short rows are padded and long rows cut to the header
+                    rows = [row if len(row) == width else (row + [""] * width)[:width] for row in rows]
+                    for column, texts in zip(columns, zip(*rows)):
+                        column.extend(texts)
+                if not columns or not columns[0]:
+                    return
+                yield [column_from_texts(texts) for texts in columns]
+
+    return headers, chunks()
+
+
+def _parquet_chunks(path, chunk_rows):
+    """Return (headers, iterator of chunks of columns) of a Parquet file"""
+    try:
+        import pyarrow.parquet as parquet
+        import pyarrow.types as types
+    except ImportError:
+        raise ImportError("Importing Parquet files needs pyarrow (pip install pyarrow)") from None
+    parquet_file = parquet.ParquetFile(path)
+    headers = list(parquet_file.schema_arrow.names)
+
+    def column(array):
+        if types.is_integer(array.type) or types.is_floating(array.type):
+            # Missing values become NaN
+            values = array.to_numpy(zero_copy_only=False).astype(np.float64)
+            return NumberColumn(values, decimals=0 if types.is_integer(array.type) else 2)
+        return column_from_texts(["" if value is None else str(value) for value in array.to_pylist()])
+
+    def chunks():
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+            yield [column(array) for array in batch.columns]
+
+    return headers, chunks()
+
+
+def read_chunks(path, chunk_rows=CHUNK_ROWS):
+    """Return (headers, iterator of chunks) of a table file, each chunk a TextColumn or NumberColumn per column"""
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        return _parquet_chunks(path, chunk_rows)
+    return _csv_chunks(path, chunk_rows)
+
+
+class _ImportSignals(QObject):
+    """Signals of the import task, delivered to the GUI thread through a queued connection"""
+
+    headers_read = Signal(list)
+    chunk_read = Signal(object)
+    # Error message, empty once the whole file was read or the import was cancelled
+    done = Signal(str)
+
+
+class _ImportTask(QRunnable):
+    """Thread pool task that reads a table file chunk by chunk"""
+
+    def __init__(self, signals, path, chunk_rows, pending, cancelled):
+        super().__init__()
+        self.signals = signals
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.pending = pending
+        self.cancelled = cancelled
+
+    def run(self):
+        try:
+            try:
+                headers, chunks = read_chunks(self.path, self.chunk_rows)
+                self.signals.headers_read.emit(headers)
+                for chunk in chunks:
+                    # Released by the GUI thread once it appended a chunk
+                    while not self.pending.acquire(timeout=0.1):
+                        if self.cancelled.is_set():
+                            return
+                    if self.cancelled.is_set():
+                        return
+                    self.signals.chunk_read.emit(chunk)
+            except Exception as error:
+                self.signals.done.emit(str(error) or type(error).__name__)
+                return
+            self.signals.done.emit("")
+        except RuntimeError:
+            # The receiver was deleted while the task ran, e.g. its window was closed
+            pass
+
+
+class TableImport(QObject):
+    """Imports a table file in the thread pool into a ColumnTableModel that grows as the file is read"""
+
+    # The model, created once the header is read and still empty
+    model_created = Signal(object)
+    # Rows imported and rows per second so far
+    progressed = Signal(int, float)
+    # Rows imported, rows per second and the error message, empty if the import succeeded or was cancelled
+    finished = Signal(int, float, str)
+
+    def __init__(self, path, alignment=None, chunk_rows=CHUNK_ROWS, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.alignment = alignment
+        self.chunk_rows = chunk_rows
+        self.model = None
+        self.rows = 0
+        self.running = False
+        self._start_time = 0.0
+        self._pending = threading.Semaphore(PENDING_CHUNKS)
+        self._cancelled = threading.Event()
+        # A reader waiting for a deleted import, e.g. of a closed window, gives up
+        self.destroyed.connect(self._cancelled.set)
+        self._signals = _ImportSignals(self)
+        self._signals.headers_read.connect(self._on_headers_read)
+        self._signals.chunk_read.connect(self._on_chunk_read)
+        self._signals.done.connect(self._on_done)
+
+    def start(self):
+        self.running = True
+        self._start_time = time.perf_counter()
+        QThreadPool.globalInstance().start(
+            _ImportTask(self._signals, self.path, self.chunk_rows, self._pending, self._cancelled))
+
+    def cancel(self):
+        """Stop reading; the rows already imported stay in the model"""
+        self._cancelled.set()
+        if self.running:
+            self.running = False
+            self.finished.emit(self.rows, self.rate(), "")
+
+    def rate(self):
+        elapsed = time.perf_counter() - self._start_time
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def _on_headers_read(self, headers):
+        # Chunks already on their way when the import was cancelled are dropped
+        if self._cancelled.is_set():
+            return
+        self.model = ColumnTableModel(headers, [TextColumn() for _ in headers], self.alignment)
+        self.model_created.emit(self.model)
+
+    def _on_chunk_read(self, chunk):
+        if self._cancelled.is_set():
+            return
+        self.model.append_columns(chunk)
+        self.rows += len(chunk[0]) if chunk else 0
+        self._pending.release()
+        self.progressed.emit(self.rows, self.rate())
+
+    def _on_done(self, error):
+        if self._cancelled.is_set():
+            return
+        self.running = False
+        self.finished.emit(self.rows, self.rate(), error)
+
+
+def write_synthetic_csv(path, row_count):
+    """Write a CSV file of row_count synthetic product rows"""
+    from column_table import synthetic_rows
+
+    with open(path, "w", newline="", encoding="utf-8") as table_file:
+        writer = csv.writer(table_file)
+        # Written in batches, so the rows of the file are not all in memory at once
+        for seed, start in enumerate(range(0, row_count, 100000)):
+            headers, columns = synthetic_rows(min(100000, row_count - start), seed)
+            if not start:
+                writer.writerow(headers)
+            writer.writerows(zip(*columns))
+
+
+def benchmark(path, chunk_rows):
+    """Import a file into the table gallery and print the rows per second, GUI stalls and peak memory"""
+    import resource
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+    from tablewidget_styles import TableWidgetStylesWindow
+
+    app = QApplication.instance()
+    window = TableWidgetStylesWindow()
+    window.show()
+    app.processEvents()
+    peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # The longest gap between ticks of a 10 ms timer is the longest the GUI thread was busy
+    ticks = [time.perf_counter()]
+    longest_gap = [0.0]
+
+    def tick():
+        now = time.perf_counter()
+        longest_gap[0] = max(longest_gap[0], now - ticks[0])
+        ticks[0] = now
+
+    timer = QTimer()
+    timer.setInterval(10)
+    timer.timeout.connect(tick)
+    progress = []
+    loop = QEventLoop()
+
+    def finished(rows, rate, error):
+        if error:
+            print(f"import failed: {error}")
+        loop.quit()
+
+    table_import = window.start_import(path, chunk_rows)
+    table_import.progressed.connect(lambda rows, rate: progress.append(rows))
+    table_import.finished.connect(finished)
+    ticks[0] = time.perf_counter()
+    timer.start()
+    loop.exec()
+    timer.stop()
+
+    model = table_import.model
+    peak_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    array_bytes = sum(column.codes.nbytes if isinstance(column, TextColumn) else column.values.nbytes
+                      for column in model.columns)
+    print(f"{table_import.rows} rows in {len(progress)} chunks at {table_import.rate():,.0f} rows/s")
+    print(f"longest GUI stall {longest_gap[0] * 1000:.0f} ms; column arrays {array_bytes / 1024 / 1024:.1f} MB; "
+          f"peak memory {peak_before / 1024:.0f} -> {peak_after / 1024:.0f} MB")
+    window.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a table file into the table gallery and time it")
+    parser.add_argument("path", nargs="?", help="CSV or Parquet file; a synthetic CSV file if omitted")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows of the synthetic file")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="rows read per chunk")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    path = args.path
+    if path is None:
+        import tempfile
+
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+        start = time.perf_counter()
+        write_synthetic_csv(path, args.rows)
+        print(f"wrote {args.rows} synthetic rows in {time.perf_counter() - start:.1f} s")
+    try:
+        benchmark(path, args.chunk_rows)
+    finally:
+        if args.path is None:
+            os.remove(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
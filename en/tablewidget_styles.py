@@ -11,16 +11,31 @@ from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
     QWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QComboBox,
+    QLineEdit,
     QPushButton,
+    QFileDialog,
     QGroupBox
 )
-from PySide6.QtGui import QFont, QBrush, QColor
+from PySide6.QtGui import QFont, QColor
+from locale_switcher import install_language_menu
+from style_overview import install_style_overview
+from column_table import ColumnTableModel, KeyProxyModel, NumberColumn, TextColumn
+from conditional_format import EqualsRule
+from table_import import CHUNK_ROWS, FILE_FILTER, TableImport
+
+# Stock status column and the colors of its text, one brush each for every cell
+STATUS_COLUMN = 3
+# Red text for products out of stock and green for the others
+STATUS_RULES = [
+    EqualsRule("Out of Stock", foreground=QColor(255, 0, 0)),
+    EqualsRule("In Stock", foreground=QColor(0, 150, 0)),
+]
 
 class TableWidgetStylesWindow(QMainWindow):
     """QTableWidget Style Sheet Example Window"""
@@ -60,10 +75,31 @@ class TableWidgetStylesWindow(QMainWindow):
         # Function buttons
         self.reset_button = QPushButton("Reset Table")
         self.reset_button.clicked.connect(self.reset_table)
+        self.import_button = QPushButton("Import...")
+        self.import_button.clicked.connect(self.import_table)
+        self.table_import = None
         
         selector_layout.addWidget(selector_label)
         selector_layout.addWidget(self.style_combobox)
         selector_layout.addWidget(self.reset_button)
+        selector_layout.addWidget(self.import_button)
+        
+        # Range filter on a numeric column, applied by the table's proxy
+        filter_label = QLabel("Filter:")
+        self.filter_column_combobox = QComboBox()
+        self.filter_minimum_edit = QLineEdit()
+        self.filter_minimum_edit.setPlaceholderText("Min")
+        self.filter_maximum_edit = QLineEdit()
+        self.filter_maximum_edit.setPlaceholderText("Max")
+        for edit in (self.filter_minimum_edit, self.filter_maximum_edit):
+            edit.setMaximumWidth(80)
+            edit.textChanged.connect(self.apply_range_filter)
+        self.filter_column_combobox.currentIndexChanged.connect(self.apply_range_filter)
+        
+        selector_layout.addWidget(filter_label)
+        selector_layout.addWidget(self.filter_column_combobox)
+        selector_layout.addWidget(self.filter_minimum_edit)
+        selector_layout.addWidget(self.filter_maximum_edit)
         selector_layout.addStretch()
         
         self.main_layout.addLayout(selector_layout)
@@ -84,15 +120,19 @@ class TableWidgetStylesWindow(QMainWindow):
         
         # Show basic table by default
         self.update_table_style(0)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label)
+        self.locale_switcher.follow(self.reset_button.clicked, self.info_label, self.table_container)
+        
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
     def create_table(self):
         """Create table and populate with sample data"""
-        # Create table widget
-        self.table_widget = QTableWidget(5, 4)
-        
         # Set header
         headers = ["Product Name", "Price", "Stock", "Status"]
-        self.table_widget.setHorizontalHeaderLabels(headers)
         
         # Populate with sample data
         data = [
@@ -103,43 +143,120 @@ class TableWidgetStylesWindow(QMainWindow):
             ["Wireless Headphones", "¥899", "45", "In Stock"]
         ]
         
-        for row in range(5):
-            for col in range(4):
-                item = QTableWidgetItem(data[row][col])
-                item.setTextAlignment(Qt.AlignCenter)
-                
-                # Set special style for stock status
-                if col == 3:
-                    if data[row][col] == "Out of Stock":
-                        item.setForeground(QBrush(QColor(255, 0, 0)))
-                    else:
-                        item.setForeground(QBrush(QColor(0, 150, 0)))
-                
-                self.table_widget.setItem(row, col, item)
+        # Prices and stock counts are parsed into numbers once, when the rows are loaded
+        model = ColumnTableModel.from_rows(headers, data, Qt.AlignCenter)
+        
+        # Create table view, sorted and filtered by a proxy on the parsed columns
+        self.table_view = QTableView()
+        self.table_proxy = KeyProxyModel(self.table_view)
+        self.table_view.setModel(self.table_proxy)
+        self.set_table_model(model)
+        
+        # Sort by a column when its header is clicked, starting in the order the rows were loaded
+        self.table_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table_view.setSortingEnabled(True)
         
         # Auto adjust column widths
-        self.table_widget.horizontalHeader().setSectionResizeMode(0, self.table_widget.horizontalHeader().Stretch)
+        self.table_view.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         for i in range(1, 4):
-            self.table_widget.horizontalHeader().setSectionResizeMode(i, self.table_widget.horizontalHeader().ResizeToContents)
+            self.table_view.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        # Widths fit the shown rows and a sample of the others, not a thousand rows on every imported chunk
+        self.table_view.horizontalHeader().setResizeContentsPrecision(100)
         
         # Add table to layout
-        self.table_layout.addWidget(self.table_widget)
+        self.table_layout.addWidget(self.table_view)
+    
+    def set_table_model(self, model):
+        """Show a ColumnTableModel in the table, e.g. a larger data set than the sample rows"""
+        self.table_model = model
+        
+        # Set special style for stock status
+        if len(model.columns) > STATUS_COLUMN and isinstance(model.columns[STATUS_COLUMN], TextColumn):
+            model.set_format_rules(STATUS_COLUMN, STATUS_RULES)
+        
+        self.table_proxy.setSourceModel(model)
+        self.filter_columns = None
+        self.update_filter_columns()
+    
+    def update_filter_columns(self):
+        """Offer the numeric columns of the table for range filtering"""
+        model = self.table_model
+        columns = [column for column, values in enumerate(model.columns) if isinstance(values, NumberColumn)]
+        if columns == self.filter_columns:
+            return
+        self.filter_columns = columns
+        self.filter_column_combobox.blockSignals(True)
+        self.filter_column_combobox.clear()
+        for column in columns:
+            self.filter_column_combobox.addItem(model.headers[column], column)
+        self.filter_column_combobox.blockSignals(False)
+        self.apply_range_filter()
+    
+    def import_table(self):
+        """Import the rows of a CSV or Parquet file into the table"""
+        path, _ = QFileDialog.getOpenFileName(self, self.locale_switcher.text("Import Table"), "", FILE_FILTER)
+        if path:
+            self.start_import(path)
+    
+    def start_import(self, path, chunk_rows=CHUNK_ROWS):
+        """Stream the rows of a file into a new table model in the background, and return the TableImport"""
+        self.cancel_import()
+        self.table_import = TableImport(path, Qt.AlignCenter, chunk_rows, self)
+        self.table_import.model_created.connect(self.set_table_model)
+        self.table_import.progressed.connect(self._show_import_progress)
+        self.table_import.finished.connect(self._show_import_result)
+        self.table_import.start()
+        return self.table_import
+    
+    def cancel_import(self):
+        if self.table_import is not None:
+            self.table_import.cancel()
+            self.table_import.deleteLater()
+            self.table_import = None
+    
+    def _show_import_progress(self, rows, rate):
+        # Numeric columns are known once their first rows are read
+        self.update_filter_columns()
+        self.statusBar().showMessage(
+            self.locale_switcher.text("Importing: {rows:,} rows, {rate:,.0f} rows/s").format(rows=rows, rate=rate))
+    
+    def _show_import_result(self, rows, rate, error):
+        if error:
+            message = self.locale_switcher.text("Import failed: {error}").format(error=error)
+        else:
+            message = self.locale_switcher.text("Imported {rows:,} rows, {rate:,.0f} rows/s").format(
+                rows=rows, rate=rate)
+        self.statusBar().showMessage(message)
+    
+    def apply_range_filter(self):
+        """Show only the rows whose value in the chosen numeric column lies within the entered range"""
+        column = self.filter_column_combobox.currentData()
+        bounds = []
+        for edit in (self.filter_minimum_edit, self.filter_maximum_edit):
+            try:
+                bounds.append(float(edit.text().replace(",", "")))
+            except ValueError:
+                bounds.append(None)
+        if column is None or bounds == [None, None]:
+            self.table_proxy.set_range_filters({})
+        else:
+            self.table_proxy.set_range_filters({column: tuple(bounds)})
     
     def update_table_style(self, index):
         """Update table style based on selection"""
         # Clear previous styles
-        self.table_widget.setStyleSheet("")
+        self.table_view.setStyleSheet("")
         
         # Apply new style
         if index == 0:
             # Basic table style
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: white;
                     gridline-color: #DDDDDD;
                     font-size: 14px;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 8px;
                     border: 1px solid #DDDDDD;
                 }
@@ -154,21 +271,21 @@ class TableWidgetStylesWindow(QMainWindow):
         
         elif index == 1:
             # Zebra striped table style
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: white;
                     gridline-color: #E0E0E0;
                     font-size: 14px;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 8px;
                     border: 1px solid #E0E0E0;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #CCE8FF;
                     color: #000000;
                 }
-                QTableWidget::item:alternate {
+                QTableView::item:alternate {
                     background-color: #F9F9F9;
                 }
                 QHeaderView::section {
@@ -183,22 +300,22 @@ class TableWidgetStylesWindow(QMainWindow):
         
         elif index == 2:
             # Modern style table
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: #FFFFFF;
                     border: 1px solid #E0E0E0;
                     border-radius: 4px;
                     font-size: 14px;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 10px;
                     border-bottom: 1px solid #F0F0F0;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #2196F3;
                     color: white;
                 }
-                QTableWidget::item:hover {
+                QTableView::item:hover {
                     background-color: #F5F5F5;
                 }
                 QHeaderView::section {
@@ -215,18 +332,18 @@ class TableWidgetStylesWindow(QMainWindow):
         
         elif index == 3:
             # Dark theme table style
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: #2C2C2C;
                     color: #FFFFFF;
                     gridline-color: #444444;
                     font-size: 14px;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 8px;
                     border: 1px solid #444444;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #3F51B5;
                     color: #FFFFFF;
                 }
@@ -242,20 +359,20 @@ class TableWidgetStylesWindow(QMainWindow):
         
         elif index == 4:
             # Cell highlight table style
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: white;
                     gridline-color: #E0E0E0;
                     font-size: 14px;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 8px;
                     border: 1px solid #E0E0E0;
                 }
-                QTableWidget::item:nth-child(4n+3) {
+                QTableView::item:nth-child(4n+3) {
                     background-color: #FFF9C4;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #FFCDD2;
                     color: #C62828;
                     font-weight: bold;
@@ -272,22 +389,22 @@ class TableWidgetStylesWindow(QMainWindow):
         
         elif index == 5:
             # Borderless table style
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: white;
                     border: none;
                     gridline-color: transparent;
                     font-size: 14px;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 10px;
                     border: none;
                 }
-                QTableWidget::item:hover {
+                QTableView::item:hover {
                     background-color: #F5F5F5;
                     border-radius: 4px;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #E3F2FD;
                     border-radius: 4px;
                     color: #1565C0;
@@ -304,22 +421,22 @@ class TableWidgetStylesWindow(QMainWindow):
         
         elif index == 6:
             # Custom grid table style
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: #FAFAFA;
                     border: 2px solid #E0E0E0;
                     border-radius: 8px;
                     font-size: 14px;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 8px;
                     border: none;
                     border-bottom: 1px dashed #E0E0E0;
                 }
-                QTableWidget::item:last-row {
+                QTableView::item:last-row {
                     border-bottom: none;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: #FFF3E0;
                     color: #E65100;
                 }
@@ -339,25 +456,25 @@ class TableWidgetStylesWindow(QMainWindow):
         
         elif index == 7:
             # Complex style table
-            self.table_widget.setStyleSheet("""
-                QTableWidget {
+            self.table_view.setStyleSheet("""
+                QTableView {
                     background-color: white;
                     gridline-color: #EEEEEE;
                     font-size: 14px;
                     border-radius: 8px;
                     border: 1px solid #EEEEEE;
                 }
-                QTableWidget::item {
+                QTableView::item {
                     padding: 12px 8px;
                     border: 1px solid #EEEEEE;
                 }
-                QTableWidget::item:selected {
+                QTableView::item:selected {
                     background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
                                                   stop:0 #64B5F6, stop:1 #42A5F5);
                     color: white;
                     border: 1px solid #42A5F5;
                 }
-                QTableWidget::item:hover {
+                QTableView::item:hover {
                     background-color: #F5F5F5;
                 }
                 QHeaderView::section {
@@ -381,6 +498,14 @@ class TableWidgetStylesWindow(QMainWindow):
     
     def reset_table(self):
         """Reset table data and style"""
+        # Stop importing, the sample rows replace the imported ones
+        self.cancel_import()
+        self.statusBar().clearMessage()
+        
+        # Clear the range filter
+        self.filter_minimum_edit.clear()
+        self.filter_maximum_edit.clear()
+        
         # Recreate table
         while self.table_layout.count() > 0:
             item = self.table_layout.takeAt(0)
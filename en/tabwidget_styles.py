@@ -21,6 +21,13 @@ from PySide6.QtWidgets import (
     QGroupBox
 )
 from PySide6.QtGui import QFont, QIcon
+from locale_switcher import install_language_menu
+from qss_compiler import compiled_stylesheet
+from style_overview import install_style_overview
+from lazy_tabs import LazyTabWidget
+
+# Tab pages that stay inactive this long are unloaded until they are shown again
+INACTIVE_TAB_UNLOAD_MS = 60000
 
 class TabWidgetStylesWindow(QMainWindow):
     """QTabWidget style example window"""
@@ -84,11 +91,21 @@ class TabWidgetStylesWindow(QMainWindow):
         
         # Show basic tabs by default
         self.update_tab_style(0)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label)
+        self.locale_switcher.follow(self.reset_button.clicked, self.info_label, self.tab_container)
+        self.locale_switcher.follow(self.tab_widget.page_built, self.tab_container)
+        
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
     def create_tabwidget(self):
         """Create tab widget and add tab pages"""
-        # Create tab widget
-        self.tab_widget = QTabWidget()
+        # Create tab widget, pages are built the first time their tab is shown
+        self.tab_widget = LazyTabWidget()
+        self.tab_widget.set_unload_after(INACTIVE_TAB_UNLOAD_MS)
         
         # Create multiple tab pages
         self.create_tab("Basic Info", "This is the content of the Basic Info tab.")
@@ -100,7 +117,11 @@ class TabWidgetStylesWindow(QMainWindow):
         self.tab_layout.addWidget(self.tab_widget)
     
     def create_tab(self, title, content_text):
-        """Create a single tab page"""
+        """Add a single tab page, built when the tab is first shown"""
+        self.tab_widget.add_lazy_tab(lambda: self.build_tab_page(content_text), title)
+    
+    def build_tab_page(self, content_text):
+        """Build the page of a single tab"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
@@ -124,8 +145,7 @@ class TabWidgetStylesWindow(QMainWindow):
         layout.addWidget(content)
         layout.addWidget(group)
         
-        # Add tab page to tab widget
-        self.tab_widget.addTab(tab, title)
+        return tab
     
     def update_tab_style(self, index):
         """Update tab style based on selection"""
@@ -212,7 +232,7 @@ class TabWidgetStylesWindow(QMainWindow):
         
         elif index == 3:
             # Underlined tab style
-            self.tab_widget.setStyleSheet("""
+            self.tab_widget.setStyleSheet(compiled_stylesheet("""
                 QTabWidget::pane {
                     border: none;
                     background-color: white;
@@ -240,12 +260,12 @@ class TabWidgetStylesWindow(QMainWindow):
                     bottom: 0;
                     left: 0;
                 }
-            """)
+            """))
             self.info_label.setText("Underlined Tabs: Uses simple underlines to identify selected tabs, providing a minimalist design.")
         
         elif index == 4:
             # Colored tab style
-            self.tab_widget.setStyleSheet("""
+            self.tab_widget.setStyleSheet(compiled_stylesheet("""
                 QTabWidget::pane {
                     border: 1px solid #E0E0E0;
                     background-color: white;
@@ -276,7 +296,7 @@ class TabWidgetStylesWindow(QMainWindow):
                 QTabBar::tab:selected {
                     font-weight: bold;
                 }
-            """)
+            """))
             self.info_label.setText("Colored Tabs: Each tab uses a different color, creating a colorful interface effect.")
         
         elif index == 5:
@@ -380,6 +400,7 @@ class TabWidgetStylesWindow(QMainWindow):
         
         # Recreate tab widget
         self.create_tabwidget()
+        self.locale_switcher.follow(self.tab_widget.page_built, self.tab_container)
         
         # Reset style selector
         self.style_combobox.setCurrentIndex(0)
@@ -9,6 +9,10 @@ import sys
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QTextEdit, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QGroupBox
 from PySide6.QtGui import QFont
+from background_tiles import tile_stylesheet
+from locale_switcher import install_language_menu
+from qss_compiler import compiled_stylesheet
+from style_overview import install_style_overview
 
 class TextEditStylesWindow(QMainWindow):
     """QTextEdit style example window"""
@@ -75,6 +79,14 @@ class TextEditStylesWindow(QMainWindow):
         
         # Show basic text box by default
         self.update_textedit_style(0)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label)
+        self.locale_switcher.follow(self.apply_button.clicked, self.info_label)
+        
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
     def create_textedits(self):
         """Create various text editors"""
@@ -159,7 +171,7 @@ class TextEditStylesWindow(QMainWindow):
     def apply_styles(self):
         """Apply various text editor styles"""
         # 1. Basic text box style
-        self.basic_textedit.setStyleSheet("""
+        self.basic_textedit.setStyleSheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: white;
                 color: #333333;
@@ -178,7 +190,7 @@ class TextEditStylesWindow(QMainWindow):
                 background-color: #FAFAFA;
                 outline: none;
             }
-        """)
+        """))
         
         # 2. Code editor style
         code_font = QFont()
@@ -188,7 +200,7 @@ class TextEditStylesWindow(QMainWindow):
         code_font.setPointSize(10)
         self.code_textedit.setFont(code_font)
         
-        self.code_textedit.setStyleSheet("""
+        self.code_textedit.setStyleSheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: #2D2D2D;
                 color: #D4D4D4;
@@ -207,10 +219,10 @@ class TextEditStylesWindow(QMainWindow):
                 background-color: #2D2D2D;
                 outline: none;
             }
-        """)
+        """))
         
         # 3. Rich text editor style
-        self.rich_textedit.setStyleSheet("""
+        self.rich_textedit.setStyleSheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: white;
                 color: #333333;
@@ -230,10 +242,10 @@ class TextEditStylesWindow(QMainWindow):
                 border-color: #2196F3;
                 outline: none;
             }
-        """)
+        """))
         
-        # 4. Notebook style
-        self.notebook_textedit.setStyleSheet("""
+        # 4. Notebook style, its SVG pattern drawn from a tile since Qt cannot load data URIs
+        self.notebook_textedit.setStyleSheet(tile_stylesheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: #FFFBE6;
                 color: #333333;
@@ -253,10 +265,10 @@ class TextEditStylesWindow(QMainWindow):
                 background-color: #FFF8E1;
                 outline: none;
             }
-        """)
+        """)))
         
         # 5. Paper style
-        self.paper_textedit.setStyleSheet("""
+        self.paper_textedit.setStyleSheet(tile_stylesheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: white;
                 color: #333333;
@@ -277,10 +289,10 @@ class TextEditStylesWindow(QMainWindow):
                 box-shadow: 0 2px 15px rgba(33, 150, 243, 0.2);
                 outline: none;
             }
-        """)
+        """)))
         
         # 6. Dark theme style
-        self.dark_textedit.setStyleSheet("""
+        self.dark_textedit.setStyleSheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: #1E1E1E;
                 color: #D4D4D4;
@@ -300,10 +312,10 @@ class TextEditStylesWindow(QMainWindow):
                 border-color: #007ACC;
                 outline: none;
             }
-        """)
+        """))
         
         # 7. Read-only document style
-        self.readonly_textedit.setStyleSheet("""
+        self.readonly_textedit.setStyleSheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: #F5F5F5;
                 color: #666666;
@@ -325,10 +337,10 @@ class TextEditStylesWindow(QMainWindow):
             QTextEdit QScrollBar::handle:vertical:hover {
                 background-color: #9E9E9E;
             }
-        """)
+        """))
         
         # 8. Editor with line numbers style (simulated)
-        self.linenumber_textedit.setStyleSheet("""
+        self.linenumber_textedit.setStyleSheet(tile_stylesheet(compiled_stylesheet("""
             QTextEdit {
                 background-color: #F7F7F7;
                 color: #333333;
@@ -350,7 +362,7 @@ class TextEditStylesWindow(QMainWindow):
                 background-color: #F5F5F5;
                 outline: none;
             }
-        """)
+        """)))
     
     def update_textedit_style(self, index):
         """Update the displayed text editor style based on selection"""
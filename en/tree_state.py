@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tree State Snapshots
+Resetting a QTreeWidget by clearing it and adding every item again costs as much as the whole tree, however
+little of it changed. TreeSnapshot records the header, structure, flags, data of a set of roles, expansion and
+selection of every item once, and from then on follows the changes the model and the view report. restore() puts
+back only the items that changed since the snapshot was taken or last restored; items added to or removed from
+the children of an item restore those children as a whole.
+
+Run directly, it measures resetting trees of growing size after a few changes, by rebuilding and by restoring.
+With --check it switches the tree widget styles window to the checkbox style and back, and checks that the tree
+is the same as in a fresh window.
+
+Usage:
+    python tree_state.py
+    python tree_state.py --check --offscreen
+    python tree_state.py --sizes 1000 10000 100000 --changes 10 --offscreen
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from PySide6.QtCore import Qt, QObject
+from PySide6.QtWidgets import QTreeWidgetItem
+
+# Roles recorded for every column of every item; windows that keep their own data add their user roles
+DEFAULT_ROLES = (
+    Qt.DisplayRole,
+    Qt.DecorationRole,
+    Qt.ToolTipRole,
+    Qt.FontRole,
+    Qt.TextAlignmentRole,
+    Qt.BackgroundRole,
+    Qt.ForegroundRole,
+    Qt.CheckStateRole,
+)
+
+
+class _ItemState:
+    """Recorded state of one item and its children"""
+
+    __slots__ = ("flags", "values", "expanded", "selected", "children")
+
+    def __init__(self, flags, values, expanded, selected, children):
+        self.flags = flags
+        # One tuple per column, with the value of every recorded role
+        self.values = values
+        self.expanded = expanded
+        self.selected = selected
+        self.children = children
+
+
+def _index_path(index):
+    """Return the rows from the top level down to a model index"""
+    path = []
+    while index.isValid():
+        path.append(index.row())
+        index = index.parent()
+    return tuple(reversed(path))
+
+
+class TreeSnapshot(QObject):
+    """State of a QTreeWidget, restored by putting back only what changed since it was taken"""
+
+    def __init__(self, tree, roles=DEFAULT_ROLES):
+        # A child of the tree, so that snapshots of the same tree can find each other
+        super().__init__(tree)
+        self.tree = tree
+        self.roles = tuple(roles)
+        self._restoring = False
+        # Paths of items whose own state changed, and of items whose children were added, removed or moved
+        self._changed_items = set()
+        self._changed_children = set()
+        self._header_changed = False
+        # Other snapshots of the tree, while restoring
+        self._others = []
+
+        model = tree.model()
+        model.dataChanged.connect(self._on_data_changed)
+        model.rowsInserted.connect(self._on_rows_changed)
+        model.rowsRemoved.connect(self._on_rows_changed)
+        model.rowsMoved.connect(self._on_rows_moved)
+        model.columnsInserted.connect(self._on_columns_changed)
+        model.columnsRemoved.connect(self._on_columns_changed)
+        model.modelReset.connect(self._on_reset)
+        model.layoutChanged.connect(self._on_reset)
+        model.headerDataChanged.connect(self._on_header_changed)
+        tree.expanded.connect(self._on_index_changed)
+        tree.collapsed.connect(self._on_index_changed)
+        tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.capture()
+
+    def capture(self):
+        """Record the current state of the tree as the state restore() puts back"""
+        tree = self.tree
+        self._columns = tree.columnCount()
+        header = tree.headerItem()
+        self._header = tuple(header.text(column) for column in range(self._columns))
+        root = tree.invisibleRootItem()
+        self._root = _ItemState(None, (), True, False, self._capture_children(root))
+        self._clear_changes()
+
+    def _capture_children(self, item):
+        return [self._capture_item(item.child(row)) for row in range(item.childCount())]
+
+    def _capture_item(self, item):
+        values = tuple(
+            tuple(item.data(column, role) for role in self.roles) for column in range(self._columns)
+        )
+        return _ItemState(item.flags(), values, item.isExpanded(), item.isSelected(), self._capture_children(item))
+
+    def _clear_changes(self):
+        self._changed_items.clear()
+        self._changed_children.clear()
+        self._header_changed = False
+
+    def change_count(self):
+        """Return the number of items and child lists changed since the snapshot was taken or last restored"""
+        return len(self._changed_items) + len(self._changed_children) + self._header_changed
+
+    # Change tracking
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        if self._restoring:
+            return
+        parent_path = _index_path(top_left.parent())
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._changed_items.add(parent_path + (row,))
+
+    def _on_index_changed(self, index):
+        if not self._restoring and index.isValid():
+            self._changed_items.add(_index_path(index))
+
+    def _on_selection_changed(self, selected, deselected):
+        if self._restoring:
+            return
+        for selection in (selected, deselected):
+            for index in selection.indexes():
+                self._on_index_changed(index)
+
+    def _on_rows_changed(self, parent, first, last):
+        if not self._restoring:
+            self._changed_children.add(_index_path(parent))
+
+    def _on_rows_moved(self, parent, start, end, destination, row):
+        if not self._restoring:
+            self._changed_children.add(_index_path(parent))
+            self._changed_children.add(_index_path(destination))
+
+    def _on_columns_changed(self, parent, first, last):
+        # Every item gains or loses values
+        if not self._restoring:
+            self._header_changed = True
+            self._changed_children.add(())
+
+    def _on_reset(self):
+        if not self._restoring:
+            self._changed_children.add(())
+
+    def _on_header_changed(self, orientation, first, last):
+        if not self._restoring:
+            self._header_changed = True
+
+    # Restoring
+
+    def _node(self, path):
+        node = self._root
+        for row in path:
+            node = node.children[row]
+        return node
+
+    def _item(self, path):
+        item = self.tree.invisibleRootItem()
+        for row in path:
+            item = item.child(row)
+        return item
+
+    def restore(self):
+        """Put back the state recorded by capture() where it changed, and return the number of items changed
+
+        The tree's signals are blocked meanwhile, so handlers of e.g. itemChanged don't react to the restored
+        states; other snapshots of the tree are told about the expansion changes they miss that way.
+        """
+        tree = self.tree
+        self._others = [snapshot for snapshot in tree.findChildren(TreeSnapshot) if snapshot is not self]
+        changed = 0
+        self._restoring = True
+        blocked = tree.blockSignals(True)
+        try:
+            if self._header_changed:
+                changed += self._restore_header()
+            # Children restored as a whole cover every change below them, the shortest paths come first
+            restored = []
+            for path in sorted(self._changed_children, key=len):
+                if any(path[:len(done)] == done for done in restored):
+                    continue
+                changed += self._restore_children(self._item(path), self._node(path), path)
+                restored.append(path)
+            for path in self._changed_items:
+                if any(len(done) < len(path) and path[:len(done)] == done for done in restored):
+                    continue
+                changed += self._restore_item(self._item(path), self._node(path), path)
+        finally:
+            tree.blockSignals(blocked)
+            self._restoring = False
+            self._others = []
+        self._clear_changes()
+        return changed
+
+    def _restore_header(self):
+        tree = self.tree
+        if tree.columnCount() != self._columns:
+            tree.setColumnCount(self._columns)
+        header = tree.headerItem()
+        changed = 0
+        for column, text in enumerate(self._header):
+            if header.text(column) != text:
+                header.setText(column, text)
+                changed = 1
+        return changed
+
+    def _restore_children(self, parent, node, path):
+        """Restore the children of an item, reusing the items that are there row by row"""
+        changed = 0
+        # Surplus items are taken from the end, so the rows of the others don't move
+        while parent.childCount() > len(node.children):
+            parent.takeChild(parent.childCount() - 1)
+            changed += 1
+        for row, child_node in enumerate(node.children):
+            child_path = path + (row,)
+            if row < parent.childCount():
+                child = parent.child(row)
+            else:
+                child = QTreeWidgetItem()
+                parent.addChild(child)
+            changed += self._restore_children(child, child_node, child_path)
+            # After the children, an item is only expanded once it has them
+            changed += self._restore_item(child, child_node, child_path)
+        return changed
+
+    def _restore_item(self, item, node, path):
+        """Restore the flags, values, selection and expansion of one item, and return 1 if any differed"""
+        changed = False
+        if item.flags() != node.flags:
+            item.setFlags(node.flags)
+            changed = True
+        rebuild = False
+        for column, values in enumerate(node.values):
+            for role, value in zip(self.roles, values):
+                if item.data(column, role) != value:
+                    item.setData(column, role, value)
+                    changed = True
+                    # Depending on the binding, setData() stores None as e.g. Unchecked instead of removing the role
+                    rebuild = rebuild or (value is None and item.data(column, role) is not None)
+        if rebuild:
+            item = self._rebuild_item(item, node, path)
+        if item.isSelected() != node.selected:
+            item.setSelected(node.selected)
+            changed = True
+        if item.isExpanded() != node.expanded:
+            item.setExpanded(node.expanded)
+            # The blocked tree doesn't report it to the other snapshots
+            for snapshot in self._others:
+                snapshot._changed_items.add(path)
+            changed = True
+        return int(changed)
+
+    def _rebuild_item(self, item, node, path):
+        """Replace an item with a fresh one with the recorded values in the same row, which takes over its children"""
+        parent = item.parent() or self.tree.invisibleRootItem()
+        row = parent.indexOfChild(item)
+        children = item.takeChildren()
+        parent.takeChild(row)
+        fresh = QTreeWidgetItem()
+        fresh.setFlags(node.flags)
+        for column, values in enumerate(node.values):
+            for role, value in zip(self.roles, values):
+                if value is not None:
+                    fresh.setData(column, role, value)
+        parent.insertChild(row, fresh)
+        fresh.addChildren(children)
+        # Items taken from the tree lose their expansion and selection
+        self._restore_children(fresh, node, path)
+        return fresh
+
+
+def _build_tree(tree, size, branching=10):
+    """Fill tree with size items, branching children per item, every item with children expanded"""
+    tree.clear()
+    tree.setHeaderLabel("Items")
+    parents = [tree.invisibleRootItem()]
+    created = 0
+    while created < size:
+        children = []
+        for parent in parents:
+            for _ in range(min(branching, size - created)):
+                children.append(QTreeWidgetItem(parent, [f"Item {created}"]))
+                created += 1
+            parent.setExpanded(True)
+        parents = children
+    return created
+
+
+def _change(tree, count):
+    """Change the text, check state and expansion of count items spread over the tree"""
+    items = []
+    stack = [tree.invisibleRootItem()]
+    while stack and len(items) < count * 50:
+        item = stack.pop()
+        stack.extend(item.child(row) for row in range(item.childCount()))
+        items.append(item)
+    for item in items[1::max(1, len(items) // count)][:count]:
+        item.setText(0, item.text(0) + " (edited)")
+        item.setCheckState(0, Qt.Checked)
+        item.setExpanded(not item.isExpanded())
+
+
+def benchmark(sizes, changes, runs):
+    """Print the time to reset trees of each size after a few changes, by rebuilding and by restoring"""
+    from PySide6.QtWidgets import QApplication, QTreeWidget
+
+    app = QApplication.instance()
+    print(f"{changes} changed items, {runs} runs; median ms to reset")
+    for size in sizes:
+        tree = QTreeWidget()
+        tree.resize(400, 600)
+        tree.show()
+        _build_tree(tree, size)
+        snapshot = TreeSnapshot(tree)
+        app.processEvents()
+        rebuilds = []
+        restores = []
+        for _ in range(runs):
+            _change(tree, changes)
+            start = time.perf_counter()
+            _build_tree(tree, size)
+            app.processEvents()
+            rebuilds.append((time.perf_counter() - start) * 1000)
+            snapshot.capture()
+
+            _change(tree, changes)
+            start = time.perf_counter()
+            restored = snapshot.restore()
+            app.processEvents()
+            restores.append((time.perf_counter() - start) * 1000)
+        print(f"    {size:7} items  rebuild {statistics.median(rebuilds):9.2f}  "
+              f"restore {statistics.median(restores):7.2f}  ({restored} items restored)")
+        tree.close()
+        tree.deleteLater()
+        app.processEvents()
+
+
+def _dump(tree, roles):
+    """Return the state TreeSnapshot records of every item of tree, comparable across trees"""
+    from PySide6.QtGui import QIcon
+
+    def value(data):
+        # Icons only compare equal to themselves
+        return ("icon", data.isNull()) if isinstance(data, QIcon) else data
+
+    def dump(item):
+        values = [[value(item.data(column, role)) for role in roles] for column in range(tree.columnCount())]
+        return (item.flags(), values, item.isExpanded(), item.isSelected(),
+                [dump(item.child(row)) for row in range(item.childCount())])
+
+    return [dump(tree.topLevelItem(row)) for row in range(tree.topLevelItemCount())]
+
+
+def check_styles_window():
+    """Switch the tree widget styles window to the checkbox style and back, and compare it with a fresh window"""
+    from PySide6.QtWidgets import QApplication
+    from treewidget_styles import TREE_ROLES, TreeWidgetStylesWindow
+
+    app = QApplication.instance()
+    fresh = TreeWidgetStylesWindow()
+    window = TreeWidgetStylesWindow()
+    for index in (5, 0, 5, 0):
+        window.style_combobox.setCurrentIndex(index)
+        app.processEvents()
+    same = _dump(window.tree_widget, TREE_ROLES) == _dump(fresh.tree_widget, TREE_ROLES)
+    print(f"checkbox style and back: {'same as' if same else 'differs from'} a fresh tree")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resetting tree widgets by rebuilding and by restoring")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="items per tree")
+    parser.add_argument("--changes", type=int, default=10, help="items changed before each reset")
+    parser.add_argument("--runs", type=int, default=5, help="resets timed per measurement")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that the tree widget styles window resets to a fresh tree")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    if args.check:
+        return 0 if check_styles_window() else 1
+    benchmark(args.sizes, args.changes, args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,15 +21,29 @@ from PySide6.QtWidgets import (
     QGroupBox
 )
 from PySide6.QtGui import QFont, QBrush, QColor, QIcon
+from locale_switcher import install_language_menu
+from style_overview import install_style_overview
+from icon_resources import load_icon_resources
+from tree_state import DEFAULT_ROLES, TreeSnapshot
+
+# The colored and file system styles mark items with the first user roles
+TREE_ROLES = DEFAULT_ROLES + tuple(Qt.UserRole + offset for offset in range(4))
 
 class TreeWidgetStylesWindow(QMainWindow):
     """QTreeWidget style example window"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Register the :/icons/ images the stylesheets refer to before anything is polished
+        load_icon_resources()
         self.setWindowTitle("QTreeWidget Style Examples")
         self.resize(800, 600)
         
+        # The checkbox style connects its change handler once, not on every selection
+        self.checkbox_handler_connected = False
+        # The tree with the checkbox style's checkboxes, taken the first time that style is selected
+        self.checkbox_snapshot = None
+        
         # Create central widget and main layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -84,6 +98,14 @@ class TreeWidgetStylesWindow(QMainWindow):
         
         # Show basic tree by default
         self.update_tree_style(0)
+        
+        # Language menu for switching the window text at runtime
+        self.locale_switcher = install_language_menu(self)
+        self.locale_switcher.follow(self.style_combobox.currentIndexChanged, self.info_label, self.tree_widget)
+        self.locale_switcher.follow(self.reset_button.clicked, self.tree_widget)
+        
+        # Thumbnail overview of every style
+        self.style_overview = install_style_overview(self)
     
     def create_treewidget(self):
         """Create tree widget and add items"""
@@ -96,6 +118,9 @@ class TreeWidgetStylesWindow(QMainWindow):
         # Add tree nodes
         self._add_tree_items()
         
+        # Resetting puts back only what changed since the tree was built
+        self.tree_snapshot = TreeSnapshot(self.tree_widget, TREE_ROLES)
+        
         # Add tree widget to layout
         self.tree_layout.addWidget(self.tree_widget)
     
@@ -140,6 +165,8 @@ class TreeWidgetStylesWindow(QMainWindow):
         # Apply new style
         if index == 0:
             # Basic tree style
+            self.reset_tree()
+            
             self.tree_widget.setStyleSheet("""
                 QTreeWidget {
                     background-color: white;
@@ -165,6 +192,8 @@ class TreeWidgetStylesWindow(QMainWindow):
         
         elif index == 1:
             # Folder tree style
+            self.reset_tree()
+            
             self.tree_widget.setStyleSheet("""
                 QTreeWidget {
                     background-color: #F8F9FA;
@@ -359,10 +388,15 @@ class TreeWidgetStylesWindow(QMainWindow):
         
         elif index == 5:
             # Checkbox tree style
-            self.reset_tree()
-            
-            # Add checkboxes to all nodes
-            self._add_checkboxes_to_tree()
+            if self.checkbox_snapshot is None:
+                self.reset_tree()
+                
+                # Add checkboxes to all nodes
+                self._add_checkboxes_to_tree()
+                self.checkbox_snapshot = TreeSnapshot(self.tree_widget, TREE_ROLES)
+            else:
+                # Reset to the tree with its checkboxes in one step
+                self.checkbox_snapshot.restore()
             
             self.tree_widget.setStyleSheet("""
                 QTreeWidget {
@@ -398,7 +432,9 @@ class TreeWidgetStylesWindow(QMainWindow):
             """)
             
             # Connect signal to update parent nodes when checkbox is clicked
-            self.tree_widget.itemChanged.connect(self._on_tree_item_changed)
+            if not self.checkbox_handler_connected:
+                self.tree_widget.itemChanged.connect(self._on_tree_item_changed)
+                self.checkbox_handler_connected = True
             
             self.info_label.setText("Checkbox Tree Style: Each node has a checkbox, supporting cascading select/deselect functionality.")
         
@@ -553,14 +589,8 @@ class TreeWidgetStylesWindow(QMainWindow):
     
     def reset_tree(self):
         """Reset tree data and style"""
-        # Clear the tree
-        self.tree_widget.clear()
-        
-        # Restore default column name
-        self.tree_widget.setHeaderLabel("Project Structure")
-        
-        # Add items again
-        self._add_tree_items()
+        # Restore the column name, items, check states and expansion that changed since the tree was built
+        self.tree_snapshot.restore()
 
 # Startup function
 if __name__ == "__main__":
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Coalesced Value Propagation
+This module sits between a rapidly changing value, such as a dragged slider, and the consumers it feeds. Every
+change is recorded, but consumers see only the latest value, at most once per frame, and an expensive consumer
+can run in the thread pool, where values superseded while it was busy are skipped.
+
+Run directly, it drags every slider of the slider gallery with a scripted drag and reports the handle repaint
+cost per slider style, then compares direct, coalesced and pooled propagation to a simulated expensive consumer.
+
+Usage:
+    python value_propagation.py
+    python value_propagation.py --steps 500 --input-hz 500 --consumer-ms 8 --offscreen
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from PySide6.QtCore import Qt, QEvent, QObject, QTimer, Signal
+
+from search_completion import run_in_pool
+
+# Frame interval consumers are fed at, in milliseconds
+FRAME_INTERVAL_MS = 16
+
+
+class CoalescedValue(QObject):
+    """Delivers the latest value of a signal at most once per frame"""
+
+    # Emitted with the latest value once per frame in which the value changed
+    value_ready = Signal(object)
+
+    def __init__(self, signal, interval=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.value = None
+        # Changes seen and values delivered, their ratio is the work coalescing saved
+        self.received = 0
+        self.delivered = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._flush)
+        signal.connect(self._receive)
+
+    def _receive(self, value):
+        self.value = value
+        self.received += 1
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        self.delivered += 1
+        self.value_ready.emit(self.value)
+
+    def add_consumer(self, consumer, offload=False, on_result=None):
+        """Feed a consumer the coalesced values, in the thread pool if offload is set
+
+        on_result(result) is called in the GUI thread with the return value of an offloaded consumer.
+        """
+        if offload:
+            consumer = PooledConsumer(consumer, self)
+            if on_result is not None:
+                consumer.result_ready.connect(on_result)
+        self.value_ready.connect(consumer)
+        return consumer
+
+
+class PooledConsumer(QObject):
+    """Runs a consumer in the thread pool one value at a time, keeping only the newest value while it is busy"""
+
+    # Emitted in the GUI thread with the return value of each call, or the exception it raised
+    result_ready = Signal(object)
+
+    def __init__(self, function, parent=None):
+        super().__init__(parent)
+        self.function = function
+        self.calls = 0
+        # Values replaced by a newer one before the consumer got to them
+        self.skipped = 0
+        self._busy = False
+        self._has_pending = False
+        self._pending = None
+
+    def __call__(self, value):
+        if not self._busy:
+            self._start(value)
+            return
+        if self._has_pending:
+            self.skipped += 1
+        self._pending, self._has_pending = value, True
+
+    def _start(self, value):
+        self._busy = True
+        self.calls += 1
+        run_in_pool(self, self.function, self._finished, value)
+
+    def _finished(self, result):
+        self._busy = False
+        self.result_ready.emit(result)
+        if self._has_pending:
+            self._has_pending = False
+            self._start(self._pending)
+
+
+def gallery_sliders(window):
+    """Return (name, slider) for every slider of the gallery window, named after its section"""
+    from PySide6.QtWidgets import QLabel, QSlider
+
+    sliders = []
+    section = ""
+    numbers = {}
+
+    def walk(layout):
+        nonlocal section
+        for position in range(layout.count()):
+            item = layout.itemAt(position)
+            widget = item.widget()
+            if isinstance(widget, QLabel) and layout is window.main_layout:
+                section = widget.text()
+            elif isinstance(widget, QSlider):
+                numbers[section] = numbers.get(section, 0) + 1
+                sliders.append((f"{section} #{numbers[section]}", widget))
+            elif item.layout() is not None:
+                walk(item.layout())
+
+    walk(window.main_layout)
+    return sliders
+
+
+def scripted_drag(slider, steps, input_hz):
+    """Drag a slider's handle from its minimum to its maximum, one step per input event at input_hz
+
+    Returns the longest time the GUI thread was busy with a single step, in milliseconds.
+    """
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    slider.setValue(slider.minimum())
+    app.processEvents()
+    slider.setSliderDown(True)
+    longest = 0.0
+    next_step = time.perf_counter()
+    for step in range(1, steps + 1):
+        start = time.perf_counter()
+        slider.setSliderPosition(slider.minimum() + round((slider.maximum() - slider.minimum()) * step / steps))
+        app.processEvents()
+        longest = max(longest, time.perf_counter() - start)
+        # Keep the event loop running, timers included, until the next input event is due
+        next_step += 1 / input_hz
+        while time.perf_counter() < next_step:
+            app.processEvents()
+            time.sleep(0.0005)
+    slider.setSliderDown(False)
+    app.processEvents()
+    return longest * 1000
+
+
+def repaint_benchmark(window, steps, input_hz):
+    """Print the handle repaint cost of every slider style of the window during a scripted drag"""
+    from event_profiler import EventProfiler
+
+    profiler = EventProfiler(window)
+    profiler.start()
+    print(f"Handle repaint cost, {steps} steps at {input_hz} Hz:")
+    for name, slider in gallery_sliders(window):
+        profiler.begin_switch(name)
+        scripted_drag(slider, steps, input_hz)
+        stats = profiler.current.widgets.get(slider)
+        paints = stats.counts["Paint"] if stats else 0
+        paint_time = stats.times["Paint"] * 1000 if stats else 0.0
+        mean = paint_time / paints if paints else 0.0
+        print(f"    {name:32} {paints:5d} paints, {mean:6.3f} ms per paint, {paint_time:8.2f} ms total")
+    profiler.stop()
+
+
+def propagation_benchmark(slider, steps, input_hz, consumer_ms):
+    """Print what a consumer costs the GUI thread when fed directly, coalesced and coalesced in the pool"""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    print(f"Propagation to a {consumer_ms} ms consumer, {steps} steps at {input_hz} Hz:")
+
+    def consumer(value):
+        # Stands in for work that releases the GIL, e.g. I/O or a native library call
+        time.sleep(consumer_ms / 1000)
+        return value
+
+    for mode in ("direct", "coalesced", "pooled"):
+        calls = []
+        gui_time = [0.0]
+
+        def timed_consumer(value):
+            start = time.perf_counter()
+            calls.append(consumer(value))
+            gui_time[0] += time.perf_counter() - start
+
+        holder = QObject()
+        if mode == "direct":
+            slider.valueChanged.connect(timed_consumer)
+        else:
+            coalesced = CoalescedValue(slider.valueChanged, parent=holder)
+            if mode == "coalesced":
+                coalesced.add_consumer(timed_consumer)
+            else:
+                coalesced.add_consumer(consumer, offload=True, on_result=calls.append)
+        start = time.perf_counter()
+        longest = scripted_drag(slider, steps, input_hz)
+        # Let the last frame and the last pooled call finish
+        deadline = time.perf_counter() + max(0.2, 4 * consumer_ms / 1000)
+        while time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+        elapsed = (time.perf_counter() - start) * 1000
+        last = calls[-1] if calls else None
+        print(f"    {mode:9} {len(calls):5d} consumer calls, {gui_time[0] * 1000:8.1f} ms in the GUI thread, "
+              f"longest step {longest:6.1f} ms, {elapsed:7.0f} ms total, last value {last}")
+        if mode == "direct":
+            slider.valueChanged.disconnect(timed_consumer)
+        # Disconnect this mode's coalescing before the next mode drags
+        holder.deleteLater()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark slider dragging and value propagation")
+    parser.add_argument("--steps", type=int, default=200, help="input events per drag")
+    parser.add_argument("--input-hz", type=float, default=240.0, help="rate of the drag's input events")
+    parser.add_argument("--consumer-ms", type=float, default=8.0, help="cost of the simulated consumer")
+    parser.add_argument("--offscreen", action="store_true", help="run without a display")
+    args = parser.parse_args()
+
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PySide6.QtCore import qInstallMessageHandler
+    from event_profiler import ProfiledApplication
+    from slider_styles import SliderStylesWindow
+
+    app = ProfiledApplication(sys.argv)
+    if args.offscreen:
+        qInstallMessageHandler(lambda *args: None)
+    window = SliderStylesWindow()
+    window.show()
+    app.processEvents()
+
+    repaint_benchmark(window, args.steps, args.input_hz)
+    propagation_benchmark(gallery_sliders(window)[0][1], args.steps, args.input_hz, args.consumer_ms)
+    window.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Visual Regression for Style Snapshots
+This tool compares the PNGs written by render_snapshots.py against stored baselines. Pixels are compared as
+whole NumPy arrays in CIELAB space, so the tolerance is perceptual (a color difference below ~2.3 is not
+visible), and every state that changed gets a heatmap of where it changed.
+
+Usage:
+    python render_snapshots.py ../en ../zh -o snapshots
+    python visual_regression.py snapshots baselines --update     # accept the current look
+    python visual_regression.py snapshots baselines -o diffs     # after a QSS change
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PySide6.QtGui import QImage
+
+from render_snapshots import MANIFEST_NAME, load_manifest
+
+# Default color difference (CIE76 delta E) below which two pixels look the same
+DEFAULT_TOLERANCE = 2.3
+# Default share of visibly different pixels above which a state counts as changed
+DEFAULT_THRESHOLD = 0.001
+# Written first into every output directory, the only directories the next run removes
+OUTPUT_MARKER = ".visual_regression"
+
+# sRGB (D65) to XYZ matrix and reference white
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+], dtype=np.float32)
+_WHITE = np.array([0.95047, 1.0, 1.08883], dtype=np.float32)
+
+
+def load_rgb(path):
+    """Load a PNG as an (height, width, 3) uint8 array"""
+    image = QImage(path)
+    if image.isNull():
+        raise IOError(f"cannot read {path}")
+    image = image.convertToFormat(QImage.Format_RGB888)
+    # Rows are padded to 4 bytes, so go through the stride before dropping the padding,
+    # and copy because the buffer belongs to the QImage
+    stride = image.bytesPerLine()
+    buffer = np.frombuffer(image.constBits(), dtype=np.uint8, count=stride * image.height())
+    rows = buffer.reshape(image.height(), stride)[:, :image.width() * 3]
+    return rows.reshape(image.height(), image.width(), 3).copy()
+
+
+def save_rgb(path, pixels):
+    """Save an (height, width, 3) uint8 array as a PNG"""
+    pixels = np.ascontiguousarray(pixels)
+    height, width, _ = pixels.shape
+    QImage(pixels.data, width, height, width * 3, QImage.Format_RGB888).save(path, "PNG")
+
+
+def rgb_to_lab(pixels):
+    """Convert an array of sRGB pixels to CIELAB"""
+    rgb = pixels.astype(np.float32) / 255.0
+    linear = np.where(rgb > 0.04045, ((rgb + 0.055) / 1.055) ** 2.4, rgb / 12.92)
+    xyz = (linear @ _RGB_TO_XYZ.T) / _WHITE
+    f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16.0 / 116.0)
+    lab = np.empty_like(f)
+    lab[..., 0] = 116.0 * f[..., 1] - 16.0
+    lab[..., 1] = 500.0 * (f[..., 0] - f[..., 1])
+    lab[..., 2] = 200.0 * (f[..., 1] - f[..., 2])
+    return lab
+
+
+def delta_e(baseline, current):
+    """Return the per-pixel CIE76 color difference of two images of the same size"""
+    return np.linalg.norm(rgb_to_lab(baseline) - rgb_to_lab(current), axis=-1)
+
+
+def heatmap(baseline, difference, tolerance):
+    """Draw the difference in red over a faded grayscale copy of the baseline"""
+    gray = baseline.astype(np.float32).mean(axis=-1, keepdims=True) * 0.35 + 160.0
+    image = np.repeat(gray, 3, axis=-1)
+    # Visible differences start at 40% red and saturate at 10x the tolerance
+    strength = np.where(difference > tolerance, np.clip(0.4 + 0.06 * difference / tolerance, 0.0, 1.0), 0.0)
+    red = np.array([255.0, 0.0, 0.0], dtype=np.float32)
+    image = image * (1.0 - strength[..., None]) + red * strength[..., None]
+    return image.astype(np.uint8)
+
+
+def compare_state(baseline_path, current_path, heatmap_path, tolerance, threshold):
+    """Compare one snapshot with its baseline and write a heatmap if it changed"""
+    baseline = load_rgb(baseline_path)
+    current = load_rgb(current_path)
+    if baseline.shape != current.shape:
+        return {"status": "resized", "baseline": list(baseline.shape[:2]), "current": list(current.shape[:2])}
+
+    # Most states are untouched by a change, skip the color conversion for them
+    if np.array_equal(baseline, current):
+        return {"status": "identical", "changed_ratio": 0.0, "max_delta_e": 0.0}
+
+    difference = delta_e(baseline, current)
+    changed_ratio = float(np.count_nonzero(difference > tolerance)) / difference.size
+    result = {
+        "status": "changed" if changed_ratio > threshold else "within tolerance",
+        "changed_ratio": changed_ratio,
+        "max_delta_e": float(difference.max()),
+    }
+    if result["status"] == "changed":
+        os.makedirs(os.path.dirname(heatmap_path), exist_ok=True)
+        save_rgb(heatmap_path, heatmap(baseline, difference, tolerance))
+        result["heatmap"] = heatmap_path
+    return result
+
+
+def compare_all(snapshot_dir, baseline_dir, diff_dir, tolerance=DEFAULT_TOLERANCE, threshold=DEFAULT_THRESHOLD,
+                workers=None):
+    """Compare every snapshot in the manifest against the baselines and return the report"""
+    snapshots = load_manifest(snapshot_dir)
+    baselines = load_manifest(baseline_dir)
+
+    jobs = {}
+    report = {}
+    for key, entries in snapshots.items():
+        for index, entry in entries.items():
+            name = f"{key}/{index}"
+            baseline_entry = baselines.get(key, {}).get(index)
+            if baseline_entry is None:
+                report[name] = {"status": "new", "name": entry["name"]}
+                continue
+            jobs[name] = (
+                os.path.join(baseline_dir, baseline_entry["file"]),
+                os.path.join(snapshot_dir, entry["file"]),
+                os.path.join(diff_dir, entry["file"]),
+            )
+    for key, entries in baselines.items():
+        for index, entry in entries.items():
+            if index not in snapshots.get(key, {}):
+                report[f"{key}/{index}"] = {"status": "missing", "name": entry["name"]}
+
+    # NumPy releases the GIL in the heavy parts, so threads keep every core busy
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            name: pool.submit(compare_state, *paths, tolerance, threshold)
+            for name, paths in jobs.items()
+        }
+        for name, future in futures.items():
+            report[name] = future.result()
+    return dict(sorted(report.items()))
+
+
+def remove_tree(directory, marker):
+    """Remove a directory this tool wrote, recognized by its marker file; raise FileExistsError for any other"""
+    if not os.path.exists(directory):
+        return
+    if os.listdir(directory) and not os.path.isfile(os.path.join(directory, marker)):
+        raise FileExistsError(f"{directory} has no {marker}, not removing a directory this tool didn't write")
+    shutil.rmtree(directory)
+
+
+def update_baselines(snapshot_dir, baseline_dir):
+    """Accept the current snapshots as the new baselines"""
+    if os.path.exists(baseline_dir) and os.path.samefile(snapshot_dir, baseline_dir):
+        raise FileExistsError(f"{baseline_dir} holds the snapshots themselves")
+    # Baselines are copies of a snapshot directory, with its manifest
+    remove_tree(baseline_dir, MANIFEST_NAME)
+    shutil.copytree(snapshot_dir, baseline_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare style snapshots against baselines")
+    parser.add_argument("snapshots", help="directory written by render_snapshots.py")
+    parser.add_argument("baselines", help="directory with the accepted snapshots")
+    parser.add_argument("-o", "--output", default="diffs", help="directory for heatmaps and report.json")
+    parser.add_argument("-t", "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="delta E below which pixels count as equal")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="share of different pixels above which a state counts as changed")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of comparison threads")
+    parser.add_argument("--update", action="store_true", help="accept the snapshots as the new baselines")
+    args = parser.parse_args()
+
+    if args.update:
+        try:
+            update_baselines(args.snapshots, args.baselines)
+        except FileExistsError as error:
+            print(error)
+            return 2
+        print(f"Baselines updated from {args.snapshots}")
+        return 0
+    if not os.path.exists(os.path.join(args.baselines, MANIFEST_NAME)):
+        print(f"No baselines in {args.baselines}, run with --update first")
+        return 2
+
+    start = time.perf_counter()
+    try:
+        remove_tree(args.output, OUTPUT_MARKER)
+    except FileExistsError as error:
+        print(error)
+        return 2
+    os.makedirs(args.output)
+    open(os.path.join(args.output, OUTPUT_MARKER), "w").close()
+    report = compare_all(args.snapshots, args.baselines, args.output, args.tolerance, args.threshold, args.workers)
+    elapsed = time.perf_counter() - start
+
+    with open(os.path.join(args.output, "report.json"), "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, ensure_ascii=False, indent=1)
+
+    regressions = {name: result for name, result in report.items()
+                   if result["status"] not in ("identical", "within tolerance")}
+    for name, result in regressions.items():
+        details = ""
+        if result["status"] == "changed":
+            details = f" {result['changed_ratio']:.2%} of pixels, max delta E {result['max_delta_e']:.1f}"
+        print(f"{name}: {result['status']}{details}")
+    print(f"{len(report)} states compared in {elapsed:.2f}s, {len(regressions)} changed")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
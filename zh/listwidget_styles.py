@@ -31,6 +31,9 @@ class ListWidgetStylesWindow(QMainWindow):
         self.setWindowTitle("QListWidget样式表示例")
         self.resize(800, 600)
         
+        # 复选框样式只连接一次点击处理函数，而不是每次选中都连接
+        self.checkbox_handler_connected = False
+        
         # 创建中心部件和主布局
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -305,7 +308,9 @@ class ListWidgetStylesWindow(QMainWindow):
                 item.setText(f"□ {item.text()}")
             
             # 连接信号以便点击时切换复选状态
-            self.list_widget.itemClicked.connect(self.toggle_checkbox)
+            if not self.checkbox_handler_connected:
+                self.list_widget.itemClicked.connect(self.toggle_checkbox)
+                self.checkbox_handler_connected = True
             
             self.list_widget.setStyleSheet("""
                 QListWidget {
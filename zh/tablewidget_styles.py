@@ -14,6 +14,7 @@ from PySide6.QtWidgets import (
     QWidget,
     QTableWidget,
     QTableWidgetItem,
+    QHeaderView,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
@@ -119,9 +120,9 @@ class TableWidgetStylesWindow(QMainWindow):
                 self.table_widget.setItem(row, col, item)
         
         # 自动调整列宽
-        self.table_widget.horizontalHeader().setSectionResizeMode(0, self.table_widget.horizontalHeader().Stretch)
+        self.table_widget.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         for i in range(1, 4):
-            self.table_widget.horizontalHeader().setSectionResizeMode(i, self.table_widget.horizontalHeader().ResizeToContents)
+            self.table_widget.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeToContents)
         
         # 添加表格到布局
         self.table_layout.addWidget(self.table_widget)
@@ -31,6 +31,9 @@ class TreeWidgetStylesWindow(QMainWindow):
         self.setWindowTitle("QTreeWidget样式表示例")
         self.resize(800, 600)
         
+        # 复选框样式只连接一次状态变化处理函数，而不是每次选中都连接
+        self.checkbox_handler_connected = False
+        
         # 创建中心部件和主布局
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -399,7 +402,9 @@ class TreeWidgetStylesWindow(QMainWindow):
             """)
             
             # 连接信号以便点击复选框时更新父节点
-            self.tree_widget.itemChanged.connect(self._on_tree_item_changed)
+            if not self.checkbox_handler_connected:
+                self.tree_widget.itemChanged.connect(self._on_tree_item_changed)
+                self.checkbox_handler_connected = True
             
             self.info_label.setText("复选框树样式：每个节点都带有复选框，支持级联选中/取消选中功能。")
         